@@ -0,0 +1,314 @@
+"""Benchmarks of building statements with sea_query.
+
+Every case is also run with a pure-Python builder rendering equivalent SQL,
+as a baseline. The `import` case times importing sea_query in a new
+interpreter, against importing json. Results are written as JSON, and a
+previous run can be compared against to fail on throughput regressions:
+
+    python benchmarks/bench.py --output results.json
+    python benchmarks/bench.py --compare results.json --threshold 0.1
+"""
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import timeit
+from typing import Any, Callable, Dict, List, Tuple
+
+from sea_query import DBEngine, Expr, Query, Table
+from sea_query.expr import Condition
+from sea_query.query import OrderBy
+from sea_query.table import Column
+
+ENGINES = (
+    ("mysql", DBEngine.Mysql),
+    ("postgres", DBEngine.Postgres),
+    ("sqlite", DBEngine.Sqlite),
+)
+
+INSERT_ROWS = 100
+IS_IN_VALUES = 1000
+CONDITION_DEPTH = 8
+
+# A module of the standard library importing about as much, so the import
+# case is compared against what the machine does for any package.
+IMPORT_BASELINE = "json"
+
+Built = Tuple[str, List[Any]]
+
+
+# Pure-Python baseline: string formatting with the quoting and placeholders
+# of each engine, which is about the least a builder can do. The SQL is
+# equivalent to what sea_query renders, not always identical.
+
+
+def quote(name: str, engine: DBEngine) -> str:
+    if engine == DBEngine.Mysql:
+        return f"`{name}`"
+    return f'"{name}"'
+
+
+class Params:
+    def __init__(self, engine: DBEngine) -> None:
+        self.engine = engine
+        self.values: List[Any] = []
+
+    def add(self, value: Any) -> str:
+        self.values.append(value)
+        if self.engine == DBEngine.Postgres:
+            return f"${len(self.values)}"
+        return "?"
+
+
+def baseline_select(engine: DBEngine) -> Built:
+    params = Params(engine)
+    columns = ", ".join(quote(c, engine) for c in ("id", "name", "email"))
+    sql = (
+        f"SELECT {columns} FROM {quote('users', engine)}"
+        f" WHERE {quote('age', engine)} > {params.add(18)}"
+        f" AND {quote('name', engine)} LIKE {params.add('a%')}"
+        f" ORDER BY {quote('name', engine)} DESC"
+        f" LIMIT {params.add(10)}"
+    )
+    return sql, params.values
+
+
+def baseline_insert(engine: DBEngine) -> Built:
+    params = Params(engine)
+    columns = ", ".join(quote(c, engine) for c in ("id", "name", "score"))
+    rows = ", ".join(
+        f"({params.add(i)}, {params.add(f'name{i}')}, {params.add(i * 0.5)})"
+        for i in range(INSERT_ROWS)
+    )
+    sql = f"INSERT INTO {quote('scores', engine)} ({columns}) VALUES {rows}"
+    return sql, params.values
+
+
+def baseline_is_in(engine: DBEngine) -> Built:
+    params = Params(engine)
+    values = ", ".join(params.add(i) for i in range(IS_IN_VALUES))
+    sql = (
+        f"SELECT {quote('id', engine)} FROM {quote('users', engine)}"
+        f" WHERE {quote('id', engine)} IN ({values})"
+    )
+    return sql, params.values
+
+
+def baseline_condition(engine: DBEngine) -> Built:
+    params = Params(engine)
+
+    def tree(depth: int) -> str:
+        if depth == 0:
+            return f"{quote('a', engine)} = {params.add(depth)}"
+        joiner = " OR " if depth % 2 else " AND "
+        return "(" + joiner.join((tree(depth - 1), tree(depth - 1))) + ")"
+
+    sql = f"SELECT * FROM {quote('t', engine)} WHERE {tree(CONDITION_DEPTH)}"
+    return sql, params.values
+
+
+def baseline_ddl(engine: DBEngine) -> str:
+    columns = ", ".join(
+        f"{quote(name, engine)} {kind}"
+        for name, kind in (
+            ("id", "integer NOT NULL PRIMARY KEY"),
+            ("name", "varchar(100) NOT NULL"),
+            ("email", "varchar(255)"),
+            ("created", "timestamp"),
+        )
+    )
+    return f"CREATE TABLE IF NOT EXISTS {quote('users', engine)} ( {columns} )"
+
+
+# sea_query
+
+
+def sea_select(engine: DBEngine) -> Built:
+    return (
+        Query.select()
+        .columns(["id", "name", "email"])
+        .from_table("users")
+        .and_where(Expr.column("age").gt(18))
+        .and_where(Expr.column("name").like("a%"))
+        .order_by("name", OrderBy.Desc)
+        .limit(10)
+        .build(engine)
+    )
+
+
+def sea_insert(engine: DBEngine) -> Built:
+    return (
+        Query.insert()
+        .into("scores")
+        .columns(["id", "name", "score"])
+        .values_many([[i, f"name{i}", i * 0.5] for i in range(INSERT_ROWS)])
+        .build(engine)
+    )
+
+
+def sea_is_in(engine: DBEngine) -> Built:
+    return (
+        Query.select()
+        .column("id")
+        .from_table("users")
+        .and_where(Expr.column("id").is_in(list(range(IS_IN_VALUES))))
+        .build(engine)
+    )
+
+
+def sea_condition(engine: DBEngine) -> Built:
+    def tree(depth: int) -> Condition:
+        condition = Condition.any() if depth % 2 else Condition.all()
+        for _ in range(2):
+            if depth == 1:
+                condition = condition.add(Expr.column("a").eq(0))
+            else:
+                condition = condition.add(tree(depth - 1))
+        return condition
+
+    query = Query.select().all().from_table("t").cond_where(tree(CONDITION_DEPTH))
+    return query.build(engine)
+
+
+def sea_ddl(engine: DBEngine) -> str:
+    return (
+        Table.create()
+        .name("users")
+        .if_not_exists()
+        .column(Column("id").integer().not_null().primary_key())
+        .column(Column("name").string_len(100).not_null())
+        .column(Column("email").string_len(255))
+        .column(Column("created").timestamp())
+        .to_string(engine)
+    )
+
+
+CASES: Dict[str, Tuple[Callable[[DBEngine], Any], Callable[[DBEngine], Any]]] = {
+    "select_chain": (sea_select, baseline_select),
+    "insert_rows": (sea_insert, baseline_insert),
+    "is_in_list": (sea_is_in, baseline_is_in),
+    "condition_tree": (sea_condition, baseline_condition),
+    "ddl_to_string": (sea_ddl, baseline_ddl),
+}
+
+
+def ops_per_second(func: Callable[[], Any], repeat: int) -> float:
+    """The best throughput of `func` over `repeat` runs of about 0.2s."""
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    return number / min(timer.repeat(repeat=repeat, number=number))
+
+
+def import_us(module: str) -> int:
+    """The cumulative time importing `module` takes in a new interpreter, in
+    microseconds."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        if name.strip() == module:
+            return int(cumulative)
+    raise RuntimeError(f"{module} was not imported")
+
+
+def imports_per_second(module: str, repeat: int) -> float:
+    """The best throughput of importing `module` over `repeat` imports."""
+    return 1e6 / min(import_us(module) for _ in range(repeat))
+
+
+def run(repeat: int, only: List[str]) -> Dict[str, Dict[str, float]]:
+    results = {}
+    if not only or "import" in only:
+        results["import"] = {
+            "ops": imports_per_second("sea_query", repeat),
+            "baseline_ops": imports_per_second(IMPORT_BASELINE, repeat),
+        }
+        result = results["import"]
+        print(
+            f"{'import':32} {1e6 / result['ops']:>12,.0f} us"
+            f"  {result['ops'] / result['baseline_ops']:>6.2f}x baseline"
+        )
+    for name, (sea, baseline) in CASES.items():
+        if only and name not in only:
+            continue
+        for engine_name, engine in ENGINES:
+            key = f"{name}[{engine_name}]"
+            results[key] = {
+                "ops": ops_per_second(lambda: sea(engine), repeat),
+                "baseline_ops": ops_per_second(lambda: baseline(engine), repeat),
+            }
+            result = results[key]
+            print(
+                f"{key:32} {result['ops']:>12,.0f} ops/s"
+                f"  {result['ops'] / result['baseline_ops']:>6.2f}x baseline"
+            )
+    return results
+
+
+def compare(
+    results: Dict[str, Dict[str, float]], previous_path: str, threshold: float
+) -> List[str]:
+    """The cases whose throughput dropped by more than `threshold`."""
+    with open(previous_path) as f:
+        previous = json.load(f)["results"]
+    regressions = []
+    for key, result in results.items():
+        if key not in previous:
+            continue
+        before = previous[key]["ops"]
+        if result["ops"] < before * (1 - threshold):
+            change = result["ops"] / before - 1
+            regressions.append(
+                f"{key}: {before:,.0f} -> {result['ops']:,.0f} ops/s ({change:.1%})"
+            )
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--compare", help="JSON results of a previous run")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="fraction of throughput a case may lose before failing",
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("cases", nargs="*", help="cases to run, all by default")
+    args = parser.parse_args()
+    unknown = set(args.cases) - set(CASES) - {"import"}
+    if unknown:
+        parser.error(f"unknown cases: {', '.join(sorted(unknown))}")
+
+    results = run(args.repeat, args.cases)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(
+                {
+                    "python": platform.python_version(),
+                    "platform": platform.platform(),
+                    "results": results,
+                },
+                f,
+                indent=2,
+            )
+
+    if args.compare:
+        regressions = compare(results, args.compare, args.threshold)
+        for regression in regressions:
+            print(f"regression: {regression}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,9 +1,85 @@
+from __future__ import annotations
+
+from importlib import import_module
+
 from sea_query.expr import Expr
-from sea_query.foreign_key import ForeignKey
-from sea_query.index import Index
-from sea_query.query import Query
-from sea_query.table import Table
+from sea_query.query import Query, build_many
+
+from ._internal import (
+    BuildEvent,
+    DBEngine,
+    clear_build_hook,
+    clear_sql_cache,
+    disable_metrics,
+    disable_recording,
+    disable_sql_cache,
+    enable_metrics,
+    enable_recording,
+    enable_sql_cache,
+    metrics_prometheus,
+    metrics_snapshot,
+    register_identifiers,
+    reset_metrics,
+    set_build_hook,
+    sql_cache_info,
+)
+
+# Importing typing takes longer than the rest of the package, so it is only
+# imported by type checkers, which take this name as true.
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Any, List
+
+    from sea_query.foreign_key import ForeignKey
+    from sea_query.index import Index
+    from sea_query.table import Table
+
+# Schema builders and the engine modules are only imported when first used,
+# so applications that only build queries don't load them.
+_LAZY = {
+    "Table": "sea_query.table",
+    "Index": "sea_query.index",
+    "ForeignKey": "sea_query.foreign_key",
+}
+_SUBMODULES = ("mysql", "postgres", "sqlite")
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY:
+        value = getattr(import_module(_LAZY[name]), name)
+    elif name in _SUBMODULES:
+        value = import_module(f"{__name__}.{name}")
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted([*globals(), *_LAZY, *_SUBMODULES])
 
-from ._internal import DBEngine
 
-__all__ = ["DBEngine", "Table", "Query", "Index", "ForeignKey", "Expr"]
+__all__ = [
+    "DBEngine",
+    "Table",
+    "Query",
+    "Index",
+    "ForeignKey",
+    "Expr",
+    "build_many",
+    "register_identifiers",
+    "enable_recording",
+    "disable_recording",
+    "enable_sql_cache",
+    "disable_sql_cache",
+    "clear_sql_cache",
+    "sql_cache_info",
+    "enable_metrics",
+    "disable_metrics",
+    "reset_metrics",
+    "metrics_snapshot",
+    "metrics_prometheus",
+    "set_build_hook",
+    "clear_build_hook",
+    "BuildEvent",
+]
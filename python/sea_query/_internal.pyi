@@ -1,6 +1,17 @@
 import datetime as dt
 from enum import IntEnum
-from typing import Any, Optional, Self, TypeAlias, Union
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Iterable,
+    Mapping,
+    Optional,
+    Self,
+    Sequence,
+    TypeAlias,
+    Union,
+)
 
 class DBEngine(IntEnum):
     Mysql = 1
@@ -37,8 +48,20 @@ class SimpleExpr:
     def __or__(self, other: SimpleExpr) -> SimpleExpr: ...
     def __and__(self, other: SimpleExpr) -> SimpleExpr: ...
     def __invert__(self) -> SimpleExpr: ...
+    def fingerprint(self) -> int: ...
+    def to_bytes(self) -> bytes: ...
+    @classmethod
+    def from_bytes(cls, data: bytes) -> Self: ...
 
-ValueType: TypeAlias = Union[int, float, str, bool, dt.date, dt.time, dt.datetime, None]
+class Param:
+    """A named placeholder, filled in with a value when the statement is built."""
+
+    @property
+    def name(self) -> str: ...
+
+ValueType: TypeAlias = Union[
+    int, float, str, bool, dt.date, dt.time, dt.datetime, Param, None
+]
 
 class Expr:
     @staticmethod
@@ -46,6 +69,9 @@ class Expr:
     @staticmethod
     def value(value: ValueType) -> Expr: ...
     @staticmethod
+    def param(name: str) -> Param:
+        """Create a placeholder that can be used anywhere a value is accepted."""
+    @staticmethod
     def expr(expr: Expr) -> Expr: ...
     def equals(self, column: str, table: Optional[str] = None) -> SimpleExpr: ...
     def not_equals(self, column: str, table: Optional[str] = None) -> SimpleExpr: ...
@@ -83,6 +109,9 @@ class Expr:
     def exists(query: SelectStatement) -> SimpleExpr: ...
     @staticmethod
     def case() -> CaseStatement: ...
+    def to_bytes(self) -> bytes: ...
+    @classmethod
+    def from_bytes(cls, data: bytes) -> Self: ...
 
 ConditionExpression: TypeAlias = Union[SimpleExpr, Condition]
 
@@ -93,6 +122,30 @@ class Condition:
     def any() -> Condition: ...
     def add(self, expr: ConditionExpression) -> Self: ...
     def __invert__(self) -> Self: ...
+    def fingerprint(self) -> int: ...
+    def to_bytes(self) -> bytes: ...
+    @classmethod
+    def from_bytes(cls, data: bytes) -> Self: ...
+
+class CompiledStatement:
+    """A statement rendered once for an engine, ready to be bound many times."""
+
+    @property
+    def sql(self) -> str: ...
+    @property
+    def params(self) -> list[Any]:
+        """The parameters captured when the statement was compiled."""
+    def bind(
+        self,
+        values: Optional[list[ValueType] | dict[str, ValueType]] = None,
+        **params: ValueType,
+    ) -> tuple[str, list[Any]]:
+        """Return the compiled SQL with the given parameters.
+
+        A list replaces the compiled parameters positionally, so it must have
+        the same length. A dict, or keyword arguments, fill the placeholders
+        created with `Expr.param` by name.
+        """
 
 class OnConflict:
     @staticmethod
@@ -100,11 +153,17 @@ class OnConflict:
     @staticmethod
     def columns(columns: list[str]) -> OnConflict: ...
     def do_nothing(self) -> Self: ...
+    def to_bytes(self) -> bytes: ...
+    @classmethod
+    def from_bytes(cls, data: bytes) -> Self: ...
 
 class CaseStatement:
     def __init__(self) -> None: ...
     def when(self, condition: ConditionExpression, then: Expr) -> Self: ...
     def else_(self, expr: Expr) -> Self: ...
+    def to_bytes(self) -> bytes: ...
+    @classmethod
+    def from_bytes(cls, data: bytes) -> Self: ...
 
 class SelectStatement:
     def __init__(self) -> None: ...
@@ -145,14 +204,52 @@ class SelectStatement:
     ) -> Self: ...
     def lock_shared(self) -> Self: ...
     def lock_exclusive(self) -> Self: ...
+    def fingerprint(self) -> int:
+        """A stable 128-bit hash of the shape of the statement.
+
+        Values are left out, so statements that only differ in their values
+        share a fingerprint. Statements, expressions and conditions also
+        compare and hash by how they were built, values included.
+        """
+    def to_bytes(self) -> bytes:
+        """Serialize the statement to a compact binary form.
+
+        Statements, expressions and conditions can also be pickled, which
+        uses the same format.
+        """
+    @classmethod
+    def from_bytes(cls, data: bytes) -> Self:
+        """Rebuild a statement serialized with `to_bytes`."""
     def to_string(self, engine: DBEngine) -> str: ...
-    def build(self, engine: DBEngine) -> tuple[str, list[Any]]: ...
+    def build(self, engine: DBEngine, **params: ValueType) -> tuple[str, list[Any]]:
+        """Render the statement with its values as parameters.
+
+        The output is kept per engine until the statement is changed, so
+        building it again only binds the parameters.
+        """
+    def compile(self, engine: DBEngine) -> CompiledStatement: ...
 
 class InsertStatement:
     def __init__(self) -> None: ...
     def into(self, table: str) -> Self: ...
     def columns(self, columns: list[str]) -> Self: ...
     def values(self, values: list[ValueType]) -> Self: ...
+    def values_many(self, rows: Sequence[Sequence[ValueType]]) -> Self:
+        """Add many rows at once, each one in the order of the columns."""
+    def values_columns(self, data: Mapping[str, Sequence[ValueType]]) -> Self:
+        """Set the columns and add their values from column oriented data.
+
+        Every column must have the same number of values.
+        """
+    def keep_originals(self, enabled: bool = True) -> Self:
+        """Return the objects given to `values` as the parameters of the rows.
+
+        `build` and `build_chunks` then hand back the caller's own objects
+        instead of converting the values of the statement back into new
+        Python objects, which saves copying large strings a second time. The
+        values are still copied into the statement to render it. Rows added
+        before enabling it are converted as usual.
+        """
     def select_from(self, query: SelectStatement) -> Self: ...
     def on_conflict(self, on_conflict: OnConflict) -> Self: ...
     def returning_all(self) -> Self:
@@ -165,8 +262,69 @@ class InsertStatement:
     def returning_columns(self, columns: list[str]) -> Self:
         """Return the specified columns.
         **NOTE**: Calling this method multiple times will overwrite the previous columns"""
+    def fingerprint(self) -> int: ...
+    def to_bytes(self) -> bytes: ...
+    @classmethod
+    def from_bytes(cls, data: bytes) -> Self: ...
     def to_string(self, engine: DBEngine) -> str: ...
-    def build(self, engine: DBEngine) -> tuple[str, list[Any]]: ...
+    def build(self, engine: DBEngine, **params: ValueType) -> tuple[str, list[Any]]: ...
+    def build_chunks(
+        self,
+        engine: DBEngine,
+        max_params: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        **params: ValueType,
+    ) -> list[tuple[str, list[Any]]]:
+        """Build the rows in as few statements as the engine limits allow.
+
+        Every statement shares the columns, `on_conflict` and `returning`
+        clauses. The limits default to the ones of the engine: 65535 parameters
+        for Postgres and MySQL, 32766 for SQLite, and 4MiB statements for MySQL.
+        The statement size is an estimate.
+        """
+    def stream(
+        self,
+        rows: Iterable[Sequence[ValueType]],
+        engine: DBEngine,
+        batch_rows: Optional[int] = None,
+        max_params: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        **params: ValueType,
+    ) -> InsertStream:
+        """Build the rows of an iterable in batches, pulling them as needed.
+
+        Only one batch of rows is held at a time, whatever the length of
+        `rows`. Batches share the columns, `on_conflict` and `returning`
+        clauses, and hold at most `batch_rows` rows within the limits of
+        `build_chunks`. Rows added to the statement itself are left out.
+        """
+    def build_executemany(
+        self, engine: DBEngine, **params: ValueType
+    ) -> tuple[str, list[tuple[Any, ...]]]:
+        """Build a single row insert, with a tuple of parameters for each row.
+
+        The SQL is rendered once, for a driver's `executemany`, rather than
+        as one statement holding every row.
+        """
+    def build_unnest(
+        self,
+        engine: DBEngine,
+        types: Optional[dict[str, ColumnType]] = None,
+        **params: ValueType,
+    ) -> tuple[str, list[Any]]:
+        """Build the rows as one array parameter per column, for PostgreSQL.
+
+        The statement inserts `SELECT unnest(CAST($1 AS bigint[])), ...`, so
+        its SQL and number of parameters don't depend on the number of rows,
+        and one prepared statement serves every batch. Arrays are cast to the
+        type in `types` of their column, or else the type of its first value
+        that isn't null.
+        """
+    def compile(self, engine: DBEngine) -> CompiledStatement: ...
+
+class InsertStream:
+    def __iter__(self) -> InsertStream: ...
+    def __next__(self) -> tuple[str, list[Any]]: ...
 
 class UpdateStatement:
     def __init__(self) -> None: ...
@@ -178,8 +336,21 @@ class UpdateStatement:
     def limit(self, limit: int) -> Self: ...
     def returning_all(self) -> Self: ...
     def returning_column(self, name: str) -> Self: ...
+    def fingerprint(self) -> int: ...
+    def to_bytes(self) -> bytes: ...
+    @classmethod
+    def from_bytes(cls, data: bytes) -> Self: ...
     def to_string(self, engine: DBEngine) -> str: ...
-    def build(self, engine: DBEngine) -> tuple[str, list[Any]]: ...
+    def build(self, engine: DBEngine, **params: ValueType) -> tuple[str, list[Any]]: ...
+    def build_executemany(
+        self, engine: DBEngine, rows: list[dict[str, ValueType]]
+    ) -> tuple[str, list[tuple[Any, ...]]]:
+        """Build the statement once, with a tuple of parameters for each row.
+
+        Every dict of `rows` fills the placeholders created with `Expr.param`
+        by name, for a driver's `executemany`.
+        """
+    def compile(self, engine: DBEngine) -> CompiledStatement: ...
 
 class DeleteStatement:
     def __init__(self) -> None: ...
@@ -189,8 +360,20 @@ class DeleteStatement:
     def limit(self, limit: int) -> Self: ...
     def returning_all(self) -> Self: ...
     def returning_column(self, name: str) -> Self: ...
+    def fingerprint(self) -> int: ...
+    def to_bytes(self) -> bytes: ...
+    @classmethod
+    def from_bytes(cls, data: bytes) -> Self: ...
     def to_string(self, engine: DBEngine) -> str: ...
-    def build(self, engine: DBEngine) -> tuple[str, list[Any]]: ...
+    def build(self, engine: DBEngine, **params: ValueType) -> tuple[str, list[Any]]: ...
+    def build_executemany(
+        self, engine: DBEngine, rows: list[dict[str, ValueType]]
+    ) -> tuple[str, list[tuple[Any, ...]]]:
+        """Build the statement once, with a tuple of parameters for each row.
+
+        See `UpdateStatement.build_executemany`.
+        """
+    def compile(self, engine: DBEngine) -> CompiledStatement: ...
 
 class Query:
     @staticmethod
@@ -202,6 +385,216 @@ class Query:
     @staticmethod
     def delete() -> DeleteStatement: ...
 
+def build_many(
+    statements: Sequence[
+        Union[SelectStatement, InsertStatement, UpdateStatement, DeleteStatement]
+    ],
+    engine: DBEngine,
+) -> list[tuple[str, list[Any]]]:
+    """Build every statement for the given engine in a single call.
+
+    Rendering happens without the GIL and is spread over a pool of worker
+    threads when the batch is large enough. Results are returned in the
+    same order as the statements.
+    """
+    ...
+
+def _ddl_classes() -> dict[str, type]: ...
+def _bound_classes(engine: DBEngine) -> dict[str, type]: ...
+def register_identifiers(names: list[str]) -> None:
+    """Intern table, column and alias names ahead of their first use.
+
+    Names are always interned when passed to a builder; registering a schema's
+    names up front only moves that work to start up.
+    """
+    ...
+
+def enable_recording() -> None:
+    """Record how statements and expressions are built again, the default."""
+    ...
+
+def disable_recording() -> None:
+    """Stop recording how statements and expressions are built.
+
+    Builder calls then skip the bookkeeping kept for `to_bytes`, pickling,
+    `fingerprint` and the SQL cache. Objects built meanwhile, or from such
+    objects, raise `ValueError` on `to_bytes`, pickling and `fingerprint`,
+    compare equal only to themselves and are never served from the SQL
+    cache.
+    """
+    ...
+
+class CopyFormat(IntEnum):
+    Text = 0
+    Binary = 1
+
+class CopyStatement:
+    """Rows loaded into PostgreSQL with `COPY ... FROM STDIN`.
+
+    Send `to_string()` as the command and `payload()`, or the `chunks()`,
+    as its input, for instance with psycopg's `copy_expert`.
+    """
+
+    def __init__(self) -> None: ...
+    def into(self, table: str) -> Self: ...
+    def columns(self, columns: list[str]) -> Self: ...
+    def format(
+        self, format: CopyFormat, types: Optional[dict[str, ColumnType]] = None
+    ) -> Self:
+        """Use the text format, the default, or the binary one.
+
+        The binary format needs the listed columns and the type of each in
+        `types`, which its values are sent as. Decimal, blob and uuid
+        columns can only be copied in the text format.
+        """
+    def values(self, values: list[ValueType]) -> Self: ...
+    def values_many(self, rows: Sequence[Sequence[ValueType]]) -> Self: ...
+    def __len__(self) -> int: ...
+    def to_string(self) -> str:
+        """Return the `COPY` command."""
+    def payload(self) -> bytes:
+        """Encode every row in the format of the statement."""
+    def chunks(self, size: int = 65536) -> CopyChunks:
+        """Iterate over the payload in chunks of about `size` bytes.
+
+        Rows are encoded as the chunks are read.
+        """
+
+class CopyChunks:
+    def __iter__(self) -> CopyChunks: ...
+    def __next__(self) -> bytes: ...
+
+class LoadDataStatement:
+    """Rows loaded into MySQL with `LOAD DATA LOCAL INFILE`.
+
+    Rows are tab separated by default. Write the `payload()`, or the
+    `chunks()`, to the infile, or stream them to it with `write_to`, and
+    execute `to_string()` with `local_infile` enabled on the connection.
+    """
+
+    def __init__(self) -> None: ...
+    def infile(self, path: str) -> Self: ...
+    def into(self, table: str) -> Self: ...
+    def columns(self, columns: list[str]) -> Self: ...
+    def ignore(self) -> Self:
+        """Skip rows duplicating a unique key."""
+    def replace(self) -> Self:
+        """Replace the rows whose unique keys are duplicated."""
+    def fields_terminated_by(self, separator: str) -> Self: ...
+    def enclosed_by(self, quote: Optional[str] = '"') -> Self:
+        """Enclose strings in `quote`, or nothing if `None`."""
+    def values(self, values: list[ValueType]) -> Self: ...
+    def values_many(self, rows: Sequence[Sequence[ValueType]]) -> Self: ...
+    def __len__(self) -> int: ...
+    def to_string(self) -> str:
+        """Return the `LOAD DATA` statement.
+
+        Datetimes with a timezone are loaded in UTC.
+        """
+    def payload(self) -> bytes:
+        """Encode every row of the infile."""
+    def chunks(self, size: int = 65536) -> LoadDataChunks:
+        """Iterate over the infile in chunks of about `size` bytes.
+
+        Rows are encoded as the chunks are read.
+        """
+    def write_to(self, file: BinaryIO, size: int = 65536) -> int:
+        """Write the infile to `file` in chunks of about `size` bytes.
+
+        Return the number of bytes written.
+        """
+
+class LoadDataChunks:
+    def __iter__(self) -> LoadDataChunks: ...
+    def __next__(self) -> bytes: ...
+
+class SqlCacheInfo:
+    hits: int
+    misses: int
+    entries: int
+    bytes: int
+    max_entries: int
+    max_bytes: Optional[int]
+
+def enable_sql_cache(max_entries: int = 1024, max_bytes: Optional[int] = None) -> None:
+    """Cache the SQL rendered by `build`, `compile` and `build_many`.
+
+    Statements built the same way render to the same SQL, whatever their
+    values. Once a shape has been rendered twice with matching results,
+    later builds of it only collect the parameters. The least recently used
+    entries are dropped past `max_entries` entries or `max_bytes` bytes.
+    """
+    ...
+
+def disable_sql_cache() -> None:
+    """Stop caching rendered SQL and drop the cached entries."""
+    ...
+
+def clear_sql_cache() -> None:
+    """Drop the cached entries and reset the hit and miss counters."""
+    ...
+
+def sql_cache_info() -> SqlCacheInfo:
+    """Return the counters and limits of the SQL cache."""
+    ...
+
+def enable_metrics() -> None:
+    """Record the statements built, their size and how long they took.
+
+    Statements are counted by kind (select, insert, update, delete or ddl)
+    and engine, by `to_string`, `build`, `build_chunks`, `compile` and
+    `build_many`.
+    """
+    ...
+
+def disable_metrics() -> None:
+    """Stop recording metrics, keeping the ones recorded so far."""
+    ...
+
+def reset_metrics() -> None:
+    """Set every recorded metric back to zero."""
+    ...
+
+def metrics_snapshot() -> dict[str, dict[str, dict[str, Any]]]:
+    """Return the metrics by kind of statement, then engine.
+
+    Each entry has the number of `statements`, the `bytes` of SQL and the
+    `params` collected, the total build time in `seconds`, and `buckets`
+    mapping latency bounds in seconds to the cumulative number of builds.
+    """
+    ...
+
+def metrics_prometheus() -> str:
+    """Return the metrics in the Prometheus text exposition format."""
+    ...
+
+class BuildEvent:
+    kind: str
+    engine: str
+    fingerprint: int
+    sql_length: int
+    params: int
+    nanos: int
+    slow: bool
+
+def set_build_hook(
+    callback: Callable[[BuildEvent], Any],
+    sample_rate: float = 1.0,
+    slow_threshold_ns: Optional[int] = None,
+) -> None:
+    """Call `callback` after statements are built.
+
+    Only a `sample_rate` fraction of builds is passed to the callback, along
+    with every build taking at least `slow_threshold_ns`, which is flagged as
+    slow. Exceptions raised by the callback are reported as unraisable and
+    don't fail the build.
+    """
+    ...
+
+def clear_build_hook() -> None:
+    """Remove the build hook."""
+    ...
+
 class ForeignKeyAction(IntEnum):
     Restrict = 1
     Cascade = 2
@@ -218,12 +611,20 @@ class ForeignKeyCreateStatement:
     def to_column(self, name: str) -> Self: ...
     def on_delete(self, action: ForeignKeyAction) -> Self: ...
     def on_update(self, action: ForeignKeyAction) -> Self: ...
+    def fingerprint(self) -> int: ...
+    def to_bytes(self) -> bytes: ...
+    @classmethod
+    def from_bytes(cls, data: bytes) -> Self: ...
     def to_string(self, engine: DBEngine) -> str: ...
 
 class ForeignKeyDropStatement:
     def __init__(self) -> None: ...
     def name(self, name: str) -> Self: ...
     def table(self, name: str) -> Self: ...
+    def fingerprint(self) -> int: ...
+    def to_bytes(self) -> bytes: ...
+    @classmethod
+    def from_bytes(cls, data: bytes) -> Self: ...
     def to_string(self, engine: DBEngine) -> str: ...
 
 class ForeignKey:
@@ -248,6 +649,10 @@ class IndexCreateStatement:
     def nulls_not_distinct(self) -> Self: ...
     def full_text(self) -> Self: ...
     def index_type(self, index_type: IndexType) -> Self: ...
+    def fingerprint(self) -> int: ...
+    def to_bytes(self) -> bytes: ...
+    @classmethod
+    def from_bytes(cls, data: bytes) -> Self: ...
     def to_string(self, engine: DBEngine) -> str: ...
 
 class IndexDropStatement:
@@ -255,6 +660,10 @@ class IndexDropStatement:
     def name(self, name: str) -> Self: ...
     def table(self, name: str) -> Self: ...
     def if_exists(self) -> Self: ...
+    def fingerprint(self) -> int: ...
+    def to_bytes(self) -> bytes: ...
+    @classmethod
+    def from_bytes(cls, data: bytes) -> Self: ...
     def to_string(self, engine: DBEngine) -> str: ...
 
 class Index:
@@ -330,6 +739,9 @@ class Column:
     def uuid(self) -> Self: ...
     def check(self, expr: SimpleExpr) -> Self: ...
     def comment(self, comment: str) -> Self: ...
+    def to_bytes(self) -> bytes: ...
+    @classmethod
+    def from_bytes(cls, data: bytes) -> Self: ...
 
 class TableCreateStatement:
     def __init__(self) -> None: ...
@@ -342,6 +754,10 @@ class TableCreateStatement:
     def foreign_key(self, foreign_key: ForeignKeyCreateStatement) -> Self: ...
     def extra(self, extra: str) -> Self: ...
     def comment(self, comment: str) -> Self: ...
+    def fingerprint(self) -> int: ...
+    def to_bytes(self) -> bytes: ...
+    @classmethod
+    def from_bytes(cls, data: bytes) -> Self: ...
     def to_string(self, engine: DBEngine) -> str: ...
 
 class TableAlterStatement:
@@ -354,6 +770,10 @@ class TableAlterStatement:
     def drop_column(self, name: str) -> Self: ...
     def add_foreign_key(self, foreign_key: ForeignKeyCreateStatement) -> Self: ...
     def drop_foreign_key(self, name: str) -> Self: ...
+    def fingerprint(self) -> int: ...
+    def to_bytes(self) -> bytes: ...
+    @classmethod
+    def from_bytes(cls, data: bytes) -> Self: ...
     def to_string(self, engine: DBEngine) -> str: ...
 
 class TableDropStatement:
@@ -362,16 +782,28 @@ class TableDropStatement:
     def if_exists(self) -> Self: ...
     def restrict(self) -> Self: ...
     def cascade(self) -> Self: ...
+    def fingerprint(self) -> int: ...
+    def to_bytes(self) -> bytes: ...
+    @classmethod
+    def from_bytes(cls, data: bytes) -> Self: ...
     def to_string(self, engine: DBEngine) -> str: ...
 
 class TableRenameStatement:
     def __init__(self) -> None: ...
     def table(self, old_name: str, new_name: str) -> Self: ...
+    def fingerprint(self) -> int: ...
+    def to_bytes(self) -> bytes: ...
+    @classmethod
+    def from_bytes(cls, data: bytes) -> Self: ...
     def to_string(self, engine: DBEngine) -> str: ...
 
 class TableTruncateStatement:
     def __init__(self) -> None: ...
     def table(self, name: str) -> Self: ...
+    def fingerprint(self) -> int: ...
+    def to_bytes(self) -> bytes: ...
+    @classmethod
+    def from_bytes(cls, data: bytes) -> Self: ...
     def to_string(self, engine: DBEngine) -> str: ...
 
 class Table:
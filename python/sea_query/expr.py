@@ -1,3 +1,3 @@
-from ._internal import Condition, Expr, SimpleExpr
+from ._internal import Condition, Expr, Param, SimpleExpr
 
-__all__ = ["Condition", "Expr", "SimpleExpr"]
+__all__ = ["Condition", "Expr", "Param", "SimpleExpr"]
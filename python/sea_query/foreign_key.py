@@ -1,9 +1,12 @@
-from ._internal import (
-    ForeignKey,
-    ForeignKeyAction,
-    ForeignKeyCreateStatement,
-    ForeignKeyDropStatement,
-)
+from ._internal import _ddl_classes
+
+# Created by the extension on first import, so applications that only build
+# queries don't create them.
+_classes = _ddl_classes()
+ForeignKey = _classes["ForeignKey"]
+ForeignKeyAction = _classes["ForeignKeyAction"]
+ForeignKeyCreateStatement = _classes["ForeignKeyCreateStatement"]
+ForeignKeyDropStatement = _classes["ForeignKeyDropStatement"]
 
 __all__ = [
     "ForeignKey",
@@ -0,0 +1,6 @@
+from ._internal import (
+    ForeignKey as ForeignKey,
+    ForeignKeyAction as ForeignKeyAction,
+    ForeignKeyCreateStatement as ForeignKeyCreateStatement,
+    ForeignKeyDropStatement as ForeignKeyDropStatement,
+)
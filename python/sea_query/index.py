@@ -1,10 +1,12 @@
-from ._internal import (
-    Index,
-    IndexCreateStatement,
-    IndexDropStatement,
-    IndexType,
-    OrderBy,
-)
+from ._internal import OrderBy, _ddl_classes
+
+# Created by the extension on first import, so applications that only build
+# queries don't create them.
+_classes = _ddl_classes()
+Index = _classes["Index"]
+IndexCreateStatement = _classes["IndexCreateStatement"]
+IndexDropStatement = _classes["IndexDropStatement"]
+IndexType = _classes["IndexType"]
 
 __all__ = [
     "Index",
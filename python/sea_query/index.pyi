@@ -0,0 +1,7 @@
+from ._internal import (
+    Index as Index,
+    IndexCreateStatement as IndexCreateStatement,
+    IndexDropStatement as IndexDropStatement,
+    IndexType as IndexType,
+    OrderBy as OrderBy,
+)
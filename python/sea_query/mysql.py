@@ -1,53 +1,22 @@
-from typing import Any, List, Tuple
-
-from ._internal import (
-    DBEngine,
-    DeleteStatement as _DeleteStatement,
-    ForeignKeyCreateStatement as _ForeignKeyCreateStatement,
-    ForeignKeyDropStatement as _ForeignKeyDropStatement,
-    IndexCreateStatement as _IndexCreateStatement,
-    IndexDropStatement as _IndexDropStatement,
-    InsertStatement as _InsertStatement,
-    SelectStatement as _SelectStatement,
-    TableAlterStatement as _TableAlterStatement,
-    TableCreateStatement as _TableCreateStatement,
-    TableDropStatement as _TableDropStatement,
-    TableRenameStatement as _TableRenameStatement,
-    TableTruncateStatement as _TableTruncateStatement,
-    UpdateStatement as _UpdateStatement,
-)
-
-
-class SelectStatement(_SelectStatement):
-    def to_string(self) -> str:
-        return super().to_string(DBEngine.Mysql)
-
-    def build(self) -> Tuple[str, List[Any]]:
-        return super().build(DBEngine.Mysql)
-
-
-class UpdateStatement(_UpdateStatement):
-    def to_string(self) -> str:
-        return super().to_string(DBEngine.Mysql)
-
-    def build(self) -> Tuple[str, List[Any]]:
-        return super().build(DBEngine.Mysql)
-
-
-class InsertStatement(_InsertStatement):
-    def to_string(self) -> str:
-        return super().to_string(DBEngine.Mysql)
-
-    def build(self) -> Tuple[str, List[Any]]:
-        return super().build(DBEngine.Mysql)
-
-
-class DeleteStatement(_DeleteStatement):
-    def to_string(self) -> str:
-        return super().to_string(DBEngine.Mysql)
-
-    def build(self) -> Tuple[str, List[Any]]:
-        return super().build(DBEngine.Mysql)
+from ._internal import DBEngine, _bound_classes
+
+# Created by the extension on first import, named after the statements they
+# extend, together with the classes only this engine has.
+_classes = _bound_classes(DBEngine.Mysql)
+DeleteStatement = _classes["DeleteStatement"]
+ForeignKeyCreateStatement = _classes["ForeignKeyCreateStatement"]
+ForeignKeyDropStatement = _classes["ForeignKeyDropStatement"]
+IndexCreateStatement = _classes["IndexCreateStatement"]
+IndexDropStatement = _classes["IndexDropStatement"]
+InsertStatement = _classes["InsertStatement"]
+LoadDataStatement = _classes["LoadDataStatement"]
+SelectStatement = _classes["SelectStatement"]
+TableAlterStatement = _classes["TableAlterStatement"]
+TableCreateStatement = _classes["TableCreateStatement"]
+TableDropStatement = _classes["TableDropStatement"]
+TableRenameStatement = _classes["TableRenameStatement"]
+TableTruncateStatement = _classes["TableTruncateStatement"]
+UpdateStatement = _classes["UpdateStatement"]
 
 
 class Query:
@@ -67,30 +36,9 @@ class Query:
     def delete() -> DeleteStatement:
         return DeleteStatement()
 
-
-class TableCreateStatement(_TableCreateStatement):
-    def to_string(self) -> str:
-        return super().to_string(DBEngine.Mysql)
-
-
-class TableAlterStatement(_TableAlterStatement):
-    def to_string(self) -> str:
-        return super().to_string(DBEngine.Mysql)
-
-
-class TableRenameStatement(_TableRenameStatement):
-    def to_string(self) -> str:
-        return super().to_string(DBEngine.Mysql)
-
-
-class TableDropStatement(_TableDropStatement):
-    def to_string(self) -> str:
-        return super().to_string(DBEngine.Mysql)
-
-
-class TableTruncateStatement(_TableTruncateStatement):
-    def to_string(self) -> str:
-        return super().to_string(DBEngine.Mysql)
+    @staticmethod
+    def load_data() -> LoadDataStatement:
+        return LoadDataStatement()
 
 
 class Table:
@@ -115,16 +63,6 @@ class Table:
         return TableTruncateStatement()
 
 
-class IndexCreateStatement(_IndexCreateStatement):
-    def to_string(self) -> str:
-        return super().to_string(DBEngine.Mysql)
-
-
-class IndexDropStatement(_IndexDropStatement):
-    def to_string(self) -> str:
-        return super().to_string(DBEngine.Mysql)
-
-
 class Index:
     @staticmethod
     def create() -> IndexCreateStatement:
@@ -135,16 +73,6 @@ class Index:
         return IndexDropStatement()
 
 
-class ForeignKeyCreateStatement(_ForeignKeyCreateStatement):
-    def to_string(self) -> str:
-        return super().to_string(DBEngine.Mysql)
-
-
-class ForeignKeyDropStatement(_ForeignKeyDropStatement):
-    def to_string(self) -> str:
-        return super().to_string(DBEngine.Mysql)
-
-
 class ForeignKey:
     @staticmethod
     def create() -> ForeignKeyCreateStatement:
@@ -1,53 +1,23 @@
-from typing import Any, List, Tuple
-
-from ._internal import (
-    DBEngine,
-    DeleteStatement as _DeleteStatement,
-    ForeignKeyCreateStatement as _ForeignKeyCreateStatement,
-    ForeignKeyDropStatement as _ForeignKeyDropStatement,
-    IndexCreateStatement as _IndexCreateStatement,
-    IndexDropStatement as _IndexDropStatement,
-    InsertStatement as _InsertStatement,
-    SelectStatement as _SelectStatement,
-    TableAlterStatement as _TableAlterStatement,
-    TableCreateStatement as _TableCreateStatement,
-    TableDropStatement as _TableDropStatement,
-    TableRenameStatement as _TableRenameStatement,
-    TableTruncateStatement as _TableTruncateStatement,
-    UpdateStatement as _UpdateStatement,
-)
-
-
-class SelectStatement(_SelectStatement):
-    def to_string(self) -> str:
-        return super().to_string(DBEngine.Postgres)
-
-    def build(self) -> Tuple[str, List[Any]]:
-        return super().build(DBEngine.Postgres)
-
-
-class UpdateStatement(_UpdateStatement):
-    def to_string(self) -> str:
-        return super().to_string(DBEngine.Postgres)
-
-    def build(self) -> Tuple[str, List[Any]]:
-        return super().build(DBEngine.Postgres)
-
-
-class InsertStatement(_InsertStatement):
-    def to_string(self) -> str:
-        return super().to_string(DBEngine.Postgres)
-
-    def build(self) -> Tuple[str, List[Any]]:
-        return super().build(DBEngine.Postgres)
-
-
-class DeleteStatement(_DeleteStatement):
-    def to_string(self) -> str:
-        return super().to_string(DBEngine.Postgres)
-
-    def build(self) -> Tuple[str, List[Any]]:
-        return super().build(DBEngine.Postgres)
+from ._internal import DBEngine, _bound_classes
+
+# Created by the extension on first import, named after the statements they
+# extend, together with the classes only this engine has.
+_classes = _bound_classes(DBEngine.Postgres)
+CopyFormat = _classes["CopyFormat"]
+CopyStatement = _classes["CopyStatement"]
+DeleteStatement = _classes["DeleteStatement"]
+ForeignKeyCreateStatement = _classes["ForeignKeyCreateStatement"]
+ForeignKeyDropStatement = _classes["ForeignKeyDropStatement"]
+IndexCreateStatement = _classes["IndexCreateStatement"]
+IndexDropStatement = _classes["IndexDropStatement"]
+InsertStatement = _classes["InsertStatement"]
+SelectStatement = _classes["SelectStatement"]
+TableAlterStatement = _classes["TableAlterStatement"]
+TableCreateStatement = _classes["TableCreateStatement"]
+TableDropStatement = _classes["TableDropStatement"]
+TableRenameStatement = _classes["TableRenameStatement"]
+TableTruncateStatement = _classes["TableTruncateStatement"]
+UpdateStatement = _classes["UpdateStatement"]
 
 
 class Query:
@@ -67,30 +37,9 @@ class Query:
     def delete() -> DeleteStatement:
         return DeleteStatement()
 
-
-class TableCreateStatement(_TableCreateStatement):
-    def to_string(self) -> str:
-        return super().to_string(DBEngine.Postgres)
-
-
-class TableAlterStatement(_TableAlterStatement):
-    def to_string(self) -> str:
-        return super().to_string(DBEngine.Postgres)
-
-
-class TableRenameStatement(_TableRenameStatement):
-    def to_string(self) -> str:
-        return super().to_string(DBEngine.Postgres)
-
-
-class TableDropStatement(_TableDropStatement):
-    def to_string(self) -> str:
-        return super().to_string(DBEngine.Postgres)
-
-
-class TableTruncateStatement(_TableTruncateStatement):
-    def to_string(self) -> str:
-        return super().to_string(DBEngine.Postgres)
+    @staticmethod
+    def copy() -> CopyStatement:
+        return CopyStatement()
 
 
 class Table:
@@ -115,16 +64,6 @@ class Table:
         return TableTruncateStatement()
 
 
-class IndexCreateStatement(_IndexCreateStatement):
-    def to_string(self) -> str:
-        return super().to_string(DBEngine.Postgres)
-
-
-class IndexDropStatement(_IndexDropStatement):
-    def to_string(self) -> str:
-        return super().to_string(DBEngine.Postgres)
-
-
 class Index:
     @staticmethod
     def create() -> IndexCreateStatement:
@@ -135,16 +74,6 @@ class Index:
         return IndexDropStatement()
 
 
-class ForeignKeyCreateStatement(_ForeignKeyCreateStatement):
-    def to_string(self) -> str:
-        return super().to_string(DBEngine.Postgres)
-
-
-class ForeignKeyDropStatement(_ForeignKeyDropStatement):
-    def to_string(self) -> str:
-        return super().to_string(DBEngine.Postgres)
-
-
 class ForeignKey:
     @staticmethod
     def create() -> ForeignKeyCreateStatement:
@@ -1,6 +1,8 @@
 from ._internal import (
+    CompiledStatement,
     DeleteStatement,
     InsertStatement,
+    InsertStream,
     LockBehavior,
     LockType,
     NullsOrder,
@@ -10,11 +12,14 @@ from ._internal import (
     SelectStatement,
     UnionType,
     UpdateStatement,
+    build_many,
 )
 
 __all__ = [
+    "CompiledStatement",
     "DeleteStatement",
     "InsertStatement",
+    "InsertStream",
     "LockBehavior",
     "LockType",
     "NullsOrder",
@@ -24,4 +29,5 @@ __all__ = [
     "SelectStatement",
     "UnionType",
     "UpdateStatement",
+    "build_many",
 ]
@@ -1,50 +1,18 @@
-from typing import Any, List, Tuple
-
-from ._internal import (
-    DBEngine,
-    DeleteStatement as _DeleteStatement,
-    IndexCreateStatement as _IndexCreateStatement,
-    IndexDropStatement as _IndexDropStatement,
-    InsertStatement as _InsertStatement,
-    SelectStatement as _SelectStatement,
-    TableAlterStatement as _TableAlterStatement,
-    TableCreateStatement as _TableCreateStatement,
-    TableDropStatement as _TableDropStatement,
-    TableRenameStatement as _TableRenameStatement,
-    UpdateStatement as _UpdateStatement,
-)
-
-
-class SelectStatement(_SelectStatement):
-    def to_string(self) -> str:
-        return super().to_string(DBEngine.Sqlite)
-
-    def build(self) -> Tuple[str, List[Any]]:
-        return super().build(DBEngine.Sqlite)
-
-
-class UpdateStatement(_UpdateStatement):
-    def to_string(self) -> str:
-        return super().to_string(DBEngine.Sqlite)
-
-    def build(self) -> Tuple[str, List[Any]]:
-        return super().build(DBEngine.Sqlite)
-
-
-class InsertStatement(_InsertStatement):
-    def to_string(self) -> str:
-        return super().to_string(DBEngine.Sqlite)
-
-    def build(self) -> Tuple[str, List[Any]]:
-        return super().build(DBEngine.Sqlite)
-
-
-class DeleteStatement(_DeleteStatement):
-    def to_string(self) -> str:
-        return super().to_string(DBEngine.Sqlite)
-
-    def build(self) -> Tuple[str, List[Any]]:
-        return super().build(DBEngine.Sqlite)
+from ._internal import DBEngine, _bound_classes
+
+# Created by the extension on first import, named after the statements they
+# extend.
+_classes = _bound_classes(DBEngine.Sqlite)
+DeleteStatement = _classes["DeleteStatement"]
+IndexCreateStatement = _classes["IndexCreateStatement"]
+IndexDropStatement = _classes["IndexDropStatement"]
+InsertStatement = _classes["InsertStatement"]
+SelectStatement = _classes["SelectStatement"]
+TableAlterStatement = _classes["TableAlterStatement"]
+TableCreateStatement = _classes["TableCreateStatement"]
+TableDropStatement = _classes["TableDropStatement"]
+TableRenameStatement = _classes["TableRenameStatement"]
+UpdateStatement = _classes["UpdateStatement"]
 
 
 class Query:
@@ -65,26 +33,6 @@ class Query:
         return DeleteStatement()
 
 
-class TableCreateStatement(_TableCreateStatement):
-    def to_string(self) -> str:
-        return super().to_string(DBEngine.Sqlite)
-
-
-class TableAlterStatement(_TableAlterStatement):
-    def to_string(self) -> str:
-        return super().to_string(DBEngine.Sqlite)
-
-
-class TableRenameStatement(_TableRenameStatement):
-    def to_string(self) -> str:
-        return super().to_string(DBEngine.Sqlite)
-
-
-class TableDropStatement(_TableDropStatement):
-    def to_string(self) -> str:
-        return super().to_string(DBEngine.Sqlite)
-
-
 class Table:
     @staticmethod
     def create() -> TableCreateStatement:
@@ -103,16 +51,6 @@ class Table:
         return TableDropStatement()
 
 
-class IndexCreateStatement(_IndexCreateStatement):
-    def to_string(self) -> str:
-        return super().to_string(DBEngine.Sqlite)
-
-
-class IndexDropStatement(_IndexDropStatement):
-    def to_string(self) -> str:
-        return super().to_string(DBEngine.Sqlite)
-
-
 class Index:
     @staticmethod
     def create() -> IndexCreateStatement:
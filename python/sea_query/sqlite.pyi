@@ -0,0 +1,112 @@
+from typing import Any, Iterable, Optional, Sequence
+
+from ._internal import (
+    CompiledStatement,
+    DeleteStatement as _DeleteStatement,
+    IndexCreateStatement as _IndexCreateStatement,
+    IndexDropStatement as _IndexDropStatement,
+    InsertStatement as _InsertStatement,
+    InsertStream,
+    SelectStatement as _SelectStatement,
+    TableAlterStatement as _TableAlterStatement,
+    TableCreateStatement as _TableCreateStatement,
+    TableDropStatement as _TableDropStatement,
+    TableRenameStatement as _TableRenameStatement,
+    UpdateStatement as _UpdateStatement,
+    ValueType,
+)
+
+class SelectStatement(_SelectStatement):
+    def to_string(self) -> str: ...  # type: ignore[override]
+    def build(  # type: ignore[override]
+        self, **params: ValueType
+    ) -> tuple[str, list[Any]]: ...
+    def compile(self) -> CompiledStatement: ...  # type: ignore[override]
+
+class UpdateStatement(_UpdateStatement):
+    def to_string(self) -> str: ...  # type: ignore[override]
+    def build(  # type: ignore[override]
+        self, **params: ValueType
+    ) -> tuple[str, list[Any]]: ...
+    def build_executemany(  # type: ignore[override]
+        self, rows: list[dict[str, ValueType]]
+    ) -> tuple[str, list[tuple[Any, ...]]]: ...
+    def compile(self) -> CompiledStatement: ...  # type: ignore[override]
+
+class DeleteStatement(_DeleteStatement):
+    def to_string(self) -> str: ...  # type: ignore[override]
+    def build(  # type: ignore[override]
+        self, **params: ValueType
+    ) -> tuple[str, list[Any]]: ...
+    def build_executemany(  # type: ignore[override]
+        self, rows: list[dict[str, ValueType]]
+    ) -> tuple[str, list[tuple[Any, ...]]]: ...
+    def compile(self) -> CompiledStatement: ...  # type: ignore[override]
+
+class InsertStatement(_InsertStatement):
+    def to_string(self) -> str: ...  # type: ignore[override]
+    def build(  # type: ignore[override]
+        self, **params: ValueType
+    ) -> tuple[str, list[Any]]: ...
+    def build_chunks(  # type: ignore[override]
+        self,
+        max_params: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        **params: ValueType,
+    ) -> list[tuple[str, list[Any]]]: ...
+    def stream(  # type: ignore[override]
+        self,
+        rows: Iterable[Sequence[ValueType]],
+        batch_rows: Optional[int] = None,
+        max_params: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        **params: ValueType,
+    ) -> InsertStream: ...
+    def build_executemany(  # type: ignore[override]
+        self, **params: ValueType
+    ) -> tuple[str, list[tuple[Any, ...]]]: ...
+    def compile(self) -> CompiledStatement: ...  # type: ignore[override]
+
+class TableCreateStatement(_TableCreateStatement):
+    def to_string(self) -> str: ...  # type: ignore[override]
+
+class TableAlterStatement(_TableAlterStatement):
+    def to_string(self) -> str: ...  # type: ignore[override]
+
+class TableDropStatement(_TableDropStatement):
+    def to_string(self) -> str: ...  # type: ignore[override]
+
+class TableRenameStatement(_TableRenameStatement):
+    def to_string(self) -> str: ...  # type: ignore[override]
+
+class IndexCreateStatement(_IndexCreateStatement):
+    def to_string(self) -> str: ...  # type: ignore[override]
+
+class IndexDropStatement(_IndexDropStatement):
+    def to_string(self) -> str: ...  # type: ignore[override]
+
+class Query:
+    @staticmethod
+    def select() -> SelectStatement: ...
+    @staticmethod
+    def update() -> UpdateStatement: ...
+    @staticmethod
+    def insert() -> InsertStatement: ...
+    @staticmethod
+    def delete() -> DeleteStatement: ...
+
+class Table:
+    @staticmethod
+    def create() -> TableCreateStatement: ...
+    @staticmethod
+    def alter() -> TableAlterStatement: ...
+    @staticmethod
+    def rename() -> TableRenameStatement: ...
+    @staticmethod
+    def drop() -> TableDropStatement: ...
+
+class Index:
+    @staticmethod
+    def create() -> IndexCreateStatement: ...
+    @staticmethod
+    def drop() -> IndexDropStatement: ...
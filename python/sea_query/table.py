@@ -1,13 +1,16 @@
-from ._internal import (
-    Column,
-    ColumnType,
-    Table,
-    TableAlterStatement,
-    TableCreateStatement,
-    TableDropStatement,
-    TableRenameStatement,
-    TableTruncateStatement,
-)
+from ._internal import _ddl_classes
+
+# Created by the extension on first import, so applications that only build
+# queries don't create them.
+_classes = _ddl_classes()
+Column = _classes["Column"]
+ColumnType = _classes["ColumnType"]
+Table = _classes["Table"]
+TableAlterStatement = _classes["TableAlterStatement"]
+TableCreateStatement = _classes["TableCreateStatement"]
+TableDropStatement = _classes["TableDropStatement"]
+TableRenameStatement = _classes["TableRenameStatement"]
+TableTruncateStatement = _classes["TableTruncateStatement"]
 
 __all__ = [
     "Column",
@@ -0,0 +1,10 @@
+from ._internal import (
+    Column as Column,
+    ColumnType as ColumnType,
+    Table as Table,
+    TableAlterStatement as TableAlterStatement,
+    TableCreateStatement as TableCreateStatement,
+    TableDropStatement as TableDropStatement,
+    TableRenameStatement as TableRenameStatement,
+    TableTruncateStatement as TableTruncateStatement,
+)
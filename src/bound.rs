@@ -0,0 +1,218 @@
+/// Define classes extending a statement that render for a single engine, so
+/// `to_string` and the other rendering methods don't take it.
+///
+/// The engine is fixed by the class, which keeps instances as small as the
+/// statement they extend. Each class takes the name of its statement in the
+/// module of its engine, where `bound_classes` puts it when first imported.
+///
+/// `dml` statements, updates and deletes, can also be built for
+/// `executemany`.
+macro_rules! bound_statements {
+    (query $base:ident($py_name:tt) -> $built:ty { $($engine:ident($module:tt): $name:ident),* $(,)? }) => {
+        $(
+            #[::pyo3::pyclass(extends = $base, subclass, name = $py_name, module = $module)]
+            pub struct $name;
+
+            #[::pyo3::pymethods]
+            impl $name {
+                #[new]
+                fn new() -> (Self, $base) {
+                    (Self, $base::new())
+                }
+
+                fn to_string(
+                    slf: ::pyo3::PyRef<'_, Self>,
+                    py: ::pyo3::Python,
+                ) -> ::pyo3::PyResult<String> {
+                    let statement: &$base = slf.as_ref();
+                    statement.to_string(py, &$crate::types::DBEngine::$engine)
+                }
+
+                #[pyo3(signature = (**params))]
+                fn build(
+                    slf: ::pyo3::PyRef<'_, Self>,
+                    py: ::pyo3::Python,
+                    params: Option<&::pyo3::Bound<'_, ::pyo3::types::PyDict>>,
+                ) -> ::pyo3::PyResult<(String, Vec<$built>)> {
+                    let statement: &$base = slf.as_ref();
+                    statement.build(py, &$crate::types::DBEngine::$engine, params)
+                }
+
+                fn compile(
+                    slf: ::pyo3::PyRef<'_, Self>,
+                    py: ::pyo3::Python,
+                ) -> ::pyo3::PyResult<$crate::query::CompiledStatement> {
+                    let statement: &$base = slf.as_ref();
+                    statement.compile(py, &$crate::types::DBEngine::$engine)
+                }
+            }
+        )*
+    };
+    (dml $base:ident($py_name:tt) -> $built:ty { $($engine:ident($module:tt): $name:ident),* $(,)? }) => {
+        $(
+            #[::pyo3::pyclass(extends = $base, subclass, name = $py_name, module = $module)]
+            pub struct $name;
+
+            #[::pyo3::pymethods]
+            impl $name {
+                #[new]
+                fn new() -> (Self, $base) {
+                    (Self, $base::new())
+                }
+
+                fn to_string(
+                    slf: ::pyo3::PyRef<'_, Self>,
+                    py: ::pyo3::Python,
+                ) -> ::pyo3::PyResult<String> {
+                    let statement: &$base = slf.as_ref();
+                    statement.to_string(py, &$crate::types::DBEngine::$engine)
+                }
+
+                #[pyo3(signature = (**params))]
+                fn build(
+                    slf: ::pyo3::PyRef<'_, Self>,
+                    py: ::pyo3::Python,
+                    params: Option<&::pyo3::Bound<'_, ::pyo3::types::PyDict>>,
+                ) -> ::pyo3::PyResult<(String, Vec<$built>)> {
+                    let statement: &$base = slf.as_ref();
+                    statement.build(py, &$crate::types::DBEngine::$engine, params)
+                }
+
+                fn build_executemany<'py>(
+                    slf: ::pyo3::PyRef<'py, Self>,
+                    py: ::pyo3::Python<'py>,
+                    rows: Vec<::pyo3::Bound<'py, ::pyo3::types::PyDict>>,
+                ) -> ::pyo3::PyResult<(String, Vec<::pyo3::Bound<'py, ::pyo3::types::PyTuple>>)> {
+                    let statement: &$base = slf.as_ref();
+                    statement.build_executemany(py, &$crate::types::DBEngine::$engine, rows)
+                }
+
+                fn compile(
+                    slf: ::pyo3::PyRef<'_, Self>,
+                    py: ::pyo3::Python,
+                ) -> ::pyo3::PyResult<$crate::query::CompiledStatement> {
+                    let statement: &$base = slf.as_ref();
+                    statement.compile(py, &$crate::types::DBEngine::$engine)
+                }
+            }
+        )*
+    };
+    (insert $base:ident($py_name:tt) { $($engine:ident($module:tt): $name:ident),* $(,)? }) => {
+        $(
+            #[::pyo3::pyclass(extends = $base, subclass, name = $py_name, module = $module)]
+            pub struct $name;
+
+            #[::pyo3::pymethods]
+            impl $name {
+                #[new]
+                fn new() -> (Self, $base) {
+                    (Self, $base::new())
+                }
+
+                fn to_string(
+                    slf: ::pyo3::PyRef<'_, Self>,
+                    py: ::pyo3::Python,
+                ) -> ::pyo3::PyResult<String> {
+                    let statement: &$base = slf.as_ref();
+                    statement.to_string(py, &$crate::types::DBEngine::$engine)
+                }
+
+                #[pyo3(signature = (**params))]
+                fn build(
+                    slf: ::pyo3::PyRef<'_, Self>,
+                    py: ::pyo3::Python,
+                    params: Option<&::pyo3::Bound<'_, ::pyo3::types::PyDict>>,
+                ) -> ::pyo3::PyResult<(String, Vec<::pyo3::PyObject>)> {
+                    let statement: &$base = slf.as_ref();
+                    statement.build(py, &$crate::types::DBEngine::$engine, params)
+                }
+
+                #[pyo3(signature = (max_params=None, max_bytes=None, **params))]
+                fn build_chunks(
+                    slf: ::pyo3::PyRef<'_, Self>,
+                    py: ::pyo3::Python,
+                    max_params: Option<usize>,
+                    max_bytes: Option<usize>,
+                    params: Option<&::pyo3::Bound<'_, ::pyo3::types::PyDict>>,
+                ) -> ::pyo3::PyResult<Vec<(String, Vec<::pyo3::PyObject>)>> {
+                    let statement: &$base = slf.as_ref();
+                    statement.build_chunks(
+                        py,
+                        &$crate::types::DBEngine::$engine,
+                        max_params,
+                        max_bytes,
+                        params,
+                    )
+                }
+
+                #[pyo3(signature = (rows, batch_rows=None, max_params=None, max_bytes=None, **params))]
+                fn stream(
+                    slf: ::pyo3::PyRef<'_, Self>,
+                    rows: &::pyo3::Bound<'_, ::pyo3::PyAny>,
+                    batch_rows: Option<usize>,
+                    max_params: Option<usize>,
+                    max_bytes: Option<usize>,
+                    params: Option<&::pyo3::Bound<'_, ::pyo3::types::PyDict>>,
+                ) -> ::pyo3::PyResult<$crate::query::InsertStream> {
+                    let statement: &$base = slf.as_ref();
+                    statement.stream(
+                        rows,
+                        &$crate::types::DBEngine::$engine,
+                        batch_rows,
+                        max_params,
+                        max_bytes,
+                        params,
+                    )
+                }
+
+                #[pyo3(signature = (**params))]
+                fn build_executemany<'py>(
+                    slf: ::pyo3::PyRef<'py, Self>,
+                    py: ::pyo3::Python<'py>,
+                    params: Option<&::pyo3::Bound<'py, ::pyo3::types::PyDict>>,
+                ) -> ::pyo3::PyResult<(String, Vec<::pyo3::Bound<'py, ::pyo3::types::PyTuple>>)> {
+                    let statement: &$base = slf.as_ref();
+                    statement.build_executemany(py, &$crate::types::DBEngine::$engine, params)
+                }
+
+                #[pyo3(signature = (types=None, **params))]
+                fn build_unnest(
+                    slf: ::pyo3::PyRef<'_, Self>,
+                    py: ::pyo3::Python,
+                    types: Option<::std::collections::HashMap<String, $crate::types::ColumnType>>,
+                    params: Option<&::pyo3::Bound<'_, ::pyo3::types::PyDict>>,
+                ) -> ::pyo3::PyResult<(String, Vec<::pyo3::PyObject>)> {
+                    let statement: &$base = slf.as_ref();
+                    statement.build_unnest(py, &$crate::types::DBEngine::$engine, types, params)
+                }
+
+                fn compile(
+                    slf: ::pyo3::PyRef<'_, Self>,
+                    py: ::pyo3::Python,
+                ) -> ::pyo3::PyResult<$crate::query::CompiledStatement> {
+                    let statement: &$base = slf.as_ref();
+                    statement.compile(py, &$crate::types::DBEngine::$engine)
+                }
+            }
+        )*
+    };
+    (schema $base:ident($py_name:tt) { $($engine:ident($module:tt): $name:ident),* $(,)? }) => {
+        $(
+            #[::pyo3::pyclass(extends = $base, subclass, name = $py_name, module = $module)]
+            pub struct $name;
+
+            #[::pyo3::pymethods]
+            impl $name {
+                #[new]
+                fn new() -> (Self, $base) {
+                    (Self, $base::new())
+                }
+
+                fn to_string(slf: ::pyo3::PyRef<'_, Self>, py: ::pyo3::Python) -> String {
+                    let statement: &$base = slf.as_ref();
+                    statement.to_string(py, &$crate::types::DBEngine::$engine)
+                }
+            }
+        )*
+    };
+}
@@ -0,0 +1,316 @@
+use std::{
+    collections::{BTreeMap, HashMap},
+    sync::{
+        atomic::{AtomicBool, AtomicU64, Ordering},
+        Arc, Mutex, MutexGuard, OnceLock, PoisonError,
+    },
+};
+
+use pyo3::{exceptions::PyValueError, prelude::*};
+use sea_query::value::Values;
+
+use crate::recipe::value_key;
+use crate::types::{DBEngine, PyValue};
+
+// Statements of the same shape render to the same SQL, only their values
+// change. The cache keeps the SQL of each shape together with where each of
+// its parameters comes from among the values of the statement, so a hit
+// only has to pick the values.
+
+static ENABLED: AtomicBool = AtomicBool::new(false);
+static HITS: AtomicU64 = AtomicU64::new(0);
+static MISSES: AtomicU64 = AtomicU64::new(0);
+static CACHE: OnceLock<Mutex<Cache>> = OnceLock::new();
+
+const DEFAULT_MAX_ENTRIES: usize = 1024;
+// Bookkeeping of an entry besides its SQL and slots.
+const ENTRY_OVERHEAD: usize = 64;
+
+/// What the cache knows of a statement without rendering it.
+pub struct Shape {
+    pub fingerprint: u128,
+    /// Everything that can end up as a parameter, in an order fixed by the
+    /// shape.
+    pub values: Vec<PyValue>,
+}
+
+type Key = (u128, u8);
+
+/// For each parameter, the index of its value in `Shape::values`.
+#[derive(Clone)]
+enum Slots {
+    /// Not found by the last render, a value being there more than once or
+    /// a parameter not at all.
+    Unknown,
+    /// Found by matching the parameters of one render, which are kept until
+    /// a render with other values agrees with the slots.
+    Found(Arc<[u32]>, Arc<[PyValue]>),
+    Verified(Arc<[u32]>),
+}
+
+impl Slots {
+    /// Find the slots of a render.
+    fn find(params: &[PyValue], values: &[PyValue]) -> Self {
+        match find_slots(params, values) {
+            Some(slots) => Slots::Found(slots, params.into()),
+            None => Slots::Unknown,
+        }
+    }
+
+    fn size(&self) -> usize {
+        match self {
+            Slots::Unknown => 0,
+            Slots::Found(slots, params) => slots.len() * 4 + std::mem::size_of_val(&**params),
+            Slots::Verified(slots) => slots.len() * 4,
+        }
+    }
+}
+
+#[derive(Clone)]
+struct Entry {
+    sql: Arc<str>,
+    slots: Slots,
+    tick: u64,
+}
+
+impl Entry {
+    fn size(&self) -> usize {
+        ENTRY_OVERHEAD + self.sql.len() + self.slots.size()
+    }
+}
+
+struct Cache {
+    entries: HashMap<Key, Entry>,
+    // Entries by last use, the least recently used first.
+    order: BTreeMap<u64, Key>,
+    tick: u64,
+    bytes: usize,
+    max_entries: usize,
+    max_bytes: Option<usize>,
+}
+
+impl Cache {
+    fn get(&mut self, key: &Key) -> Option<Entry> {
+        self.tick += 1;
+        let entry = self.entries.get_mut(key)?;
+        self.order.remove(&entry.tick);
+        entry.tick = self.tick;
+        self.order.insert(self.tick, *key);
+        Some(entry.clone())
+    }
+
+    fn insert(&mut self, key: Key, sql: Arc<str>, slots: Slots) {
+        self.remove(&key);
+        self.tick += 1;
+        let entry = Entry {
+            sql,
+            slots,
+            tick: self.tick,
+        };
+        self.bytes += entry.size();
+        self.order.insert(self.tick, key);
+        self.entries.insert(key, entry);
+        self.evict();
+    }
+
+    /// Drop the least recently used entries until within the limits.
+    fn evict(&mut self) {
+        while self.entries.len() > self.max_entries
+            || self.max_bytes.is_some_and(|max| self.bytes > max)
+        {
+            let Some((_, key)) = self.order.pop_first() else {
+                break;
+            };
+            if let Some(entry) = self.entries.remove(&key) {
+                self.bytes -= entry.size();
+            }
+        }
+    }
+
+    fn remove(&mut self, key: &Key) {
+        if let Some(entry) = self.entries.remove(key) {
+            self.order.remove(&entry.tick);
+            self.bytes -= entry.size();
+        }
+    }
+
+    fn clear(&mut self) {
+        self.entries.clear();
+        self.order.clear();
+        self.bytes = 0;
+    }
+}
+
+fn cache() -> MutexGuard<'static, Cache> {
+    CACHE
+        .get_or_init(|| {
+            Mutex::new(Cache {
+                entries: HashMap::new(),
+                order: BTreeMap::new(),
+                tick: 0,
+                bytes: 0,
+                max_entries: DEFAULT_MAX_ENTRIES,
+                max_bytes: None,
+            })
+        })
+        .lock()
+        .unwrap_or_else(PoisonError::into_inner)
+}
+
+pub fn engine_id(engine: &DBEngine) -> u8 {
+    match engine {
+        DBEngine::Mysql => 0,
+        DBEngine::Postgres => 1,
+        DBEngine::Sqlite => 2,
+    }
+}
+
+/// Where each of `params` is found in `values`, if each is found once.
+fn find_slots(params: &[PyValue], values: &[PyValue]) -> Option<Arc<[u32]>> {
+    let mut positions: HashMap<Vec<u8>, Option<u32>> = HashMap::with_capacity(values.len());
+    for (i, value) in values.iter().enumerate() {
+        positions
+            .entry(value_key(value))
+            .and_modify(|position| *position = None)
+            .or_insert(Some(i as u32));
+    }
+    params
+        .iter()
+        .map(|param| positions.get(&value_key(param)).copied().flatten())
+        .collect()
+}
+
+fn pick(slots: &[u32], values: &[PyValue]) -> Vec<PyValue> {
+    slots.iter().map(|&i| values[i as usize].clone()).collect()
+}
+
+/// Render a statement, through the cache when it is enabled.
+///
+/// `render` builds the statement for real and `shape` describes it to the
+/// cache, if it can: statements built while recording was off have no
+/// shape. The first `skip` parameters are left out of the result.
+pub fn render(
+    engine: &DBEngine,
+    shape: impl FnOnce() -> Option<Shape>,
+    skip: usize,
+    render: impl FnOnce() -> PyResult<(String, Values)>,
+) -> PyResult<(String, Vec<PyValue>)> {
+    let shape = match ENABLED.load(Ordering::Relaxed) {
+        true => shape(),
+        false => None,
+    };
+    let Some(shape) = shape else {
+        let (sql, values) = render()?;
+        return Ok((
+            sql,
+            values.0.into_iter().skip(skip).map(PyValue::from).collect(),
+        ));
+    };
+
+    let key = (shape.fingerprint, engine_id(engine));
+    let entry = cache().get(&key);
+    if let Some(Entry {
+        sql,
+        slots: Slots::Verified(slots),
+        ..
+    }) = &entry
+    {
+        HITS.fetch_add(1, Ordering::Relaxed);
+        return Ok((
+            sql.to_string(),
+            pick(&slots[skip.min(slots.len())..], &shape.values),
+        ));
+    }
+
+    MISSES.fetch_add(1, Ordering::Relaxed);
+    let (sql, values) = render()?;
+    let mut params: Vec<PyValue> = values.0.into_iter().map(PyValue::from).collect();
+    // Slots that failed, or were never found, are looked for again, the
+    // values of this render telling apart what the last ones didn't.
+    let slots = match entry {
+        Some(Entry {
+            sql: cached,
+            slots: Slots::Found(slots, first),
+            ..
+        }) if *cached == *sql => {
+            if *first == *params {
+                // The same values again, which can't confirm anything.
+                Slots::Found(slots, first)
+            } else if pick(&slots, &shape.values) == params {
+                Slots::Verified(slots)
+            } else {
+                Slots::find(&params, &shape.values)
+            }
+        }
+        _ => Slots::find(&params, &shape.values),
+    };
+    cache().insert(key, sql.as_str().into(), slots);
+    params.drain(..skip.min(params.len()));
+    Ok((sql, params))
+}
+
+#[pyclass(frozen, get_all)]
+pub struct SqlCacheInfo {
+    hits: u64,
+    misses: u64,
+    entries: usize,
+    bytes: usize,
+    max_entries: usize,
+    max_bytes: Option<usize>,
+}
+
+#[pymethods]
+impl SqlCacheInfo {
+    fn __repr__(&self) -> String {
+        format!(
+            "SqlCacheInfo(hits={}, misses={}, entries={}, bytes={}, max_entries={}, max_bytes={})",
+            self.hits,
+            self.misses,
+            self.entries,
+            self.bytes,
+            self.max_entries,
+            self.max_bytes
+                .map_or_else(|| "None".to_owned(), |max| max.to_string())
+        )
+    }
+}
+
+#[pyfunction]
+#[pyo3(signature = (max_entries=DEFAULT_MAX_ENTRIES, max_bytes=None))]
+pub fn enable_sql_cache(max_entries: usize, max_bytes: Option<usize>) -> PyResult<()> {
+    if max_entries == 0 {
+        return Err(PyValueError::new_err("max_entries must be at least 1"));
+    }
+    let mut cache = cache();
+    cache.max_entries = max_entries;
+    cache.max_bytes = max_bytes;
+    cache.evict();
+    ENABLED.store(true, Ordering::Relaxed);
+    Ok(())
+}
+
+#[pyfunction]
+pub fn disable_sql_cache() {
+    ENABLED.store(false, Ordering::Relaxed);
+    cache().clear();
+}
+
+#[pyfunction]
+pub fn clear_sql_cache() {
+    cache().clear();
+    HITS.store(0, Ordering::Relaxed);
+    MISSES.store(0, Ordering::Relaxed);
+}
+
+#[pyfunction]
+pub fn sql_cache_info() -> SqlCacheInfo {
+    let cache = cache();
+    SqlCacheInfo {
+        hits: HITS.load(Ordering::Relaxed),
+        misses: MISSES.load(Ordering::Relaxed),
+        entries: cache.entries.len(),
+        bytes: cache.bytes,
+        max_entries: cache.max_entries,
+        max_bytes: cache.max_bytes,
+    }
+}
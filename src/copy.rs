@@ -0,0 +1,438 @@
+use std::{collections::HashMap, sync::Arc};
+
+use chrono::{NaiveDate, NaiveDateTime, NaiveTime, Timelike};
+use pyo3::{exceptions::PyValueError, prelude::*, types::PyBytes};
+
+use crate::iden::Ident;
+use crate::types::{ColumnType, PyValue};
+
+const BINARY_HEADER: &[u8] = b"PGCOPY\n\xff\r\n\0\0\0\0\0\0\0\0\0";
+const BINARY_TRAILER: &[u8] = &(-1i16).to_be_bytes();
+const DEFAULT_CHUNK_SIZE: usize = 64 * 1024;
+
+#[pyclass(eq, eq_int)]
+#[derive(Clone, Copy, PartialEq)]
+pub enum CopyFormat {
+    Text,
+    Binary,
+}
+
+/// Rows loaded with PostgreSQL's `COPY ... FROM STDIN`.
+#[pyclass(subclass)]
+pub struct CopyStatement {
+    table: Option<Ident>,
+    columns: Vec<Ident>,
+    format: CopyFormat,
+    // The type of each column by name, which the binary format is sent in.
+    types: HashMap<String, ColumnType>,
+    // Shared with the iterators over the payload, and copied if changed
+    // while they run.
+    rows: Arc<Vec<Vec<PyValue>>>,
+}
+
+/// Check a row of a bulk load holds a value for each of the `columns`.
+pub(crate) fn check_row(columns: &[Ident], row: &[PyValue]) -> PyResult<()> {
+    if row.len() != columns.len() {
+        return Err(PyValueError::new_err(format!(
+            "Number of values ({}) does not match number of columns ({})",
+            row.len(),
+            columns.len()
+        )));
+    }
+    if row.iter().any(|value| matches!(value, PyValue::Param(_))) {
+        return Err(PyValueError::new_err(
+            "Bulk loaded rows can't hold placeholders, only values",
+        ));
+    }
+    Ok(())
+}
+
+impl CopyStatement {
+    fn push_row(&mut self, row: Vec<PyValue>) -> PyResult<()> {
+        check_row(&self.columns, &row)?;
+        Arc::make_mut(&mut self.rows).push(row);
+        Ok(())
+    }
+
+    /// How each column is sent in the binary format.
+    fn binary_columns(&self) -> PyResult<Vec<BinaryColumn>> {
+        if self.columns.is_empty() {
+            return Err(PyValueError::new_err(
+                "The binary format needs the columns to be listed",
+            ));
+        }
+        self.columns
+            .iter()
+            .map(|column| {
+                let name = column.name();
+                let ty = self.types.get(&name).ok_or_else(|| {
+                    PyValueError::new_err(format!(
+                        "The binary format needs the type of column '{}'",
+                        name
+                    ))
+                })?;
+                let binary = BinaryType::of(ty).ok_or_else(|| {
+                    PyValueError::new_err(format!(
+                        "Column '{}' is a {}, which can only be copied in the text format",
+                        name,
+                        ty.postgres_name()
+                    ))
+                })?;
+                Ok(BinaryColumn { name, ty: binary })
+            })
+            .collect()
+    }
+}
+
+fn quote(name: &Ident) -> String {
+    format!("\"{}\"", name.name().replace('"', "\"\""))
+}
+
+#[pymethods]
+impl CopyStatement {
+    #[new]
+    fn new() -> Self {
+        Self {
+            table: None,
+            columns: Vec::new(),
+            format: CopyFormat::Text,
+            types: HashMap::new(),
+            rows: Arc::new(Vec::new()),
+        }
+    }
+
+    fn into(mut slf: PyRefMut<Self>, table: Ident) -> PyRefMut<Self> {
+        slf.table = Some(table);
+        slf
+    }
+
+    fn columns(mut slf: PyRefMut<Self>, columns: Vec<Ident>) -> PyRefMut<Self> {
+        slf.columns = columns;
+        slf
+    }
+
+    #[pyo3(signature = (format, types=None))]
+    fn format(
+        mut slf: PyRefMut<Self>,
+        format: CopyFormat,
+        types: Option<HashMap<String, ColumnType>>,
+    ) -> PyResult<PyRefMut<Self>> {
+        if format == CopyFormat::Binary && types.is_none() {
+            return Err(PyValueError::new_err(
+                "The binary format needs the type of each column",
+            ));
+        }
+        slf.format = format;
+        slf.types = types.unwrap_or_default();
+        Ok(slf)
+    }
+
+    fn values(mut slf: PyRefMut<Self>, values: Vec<PyValue>) -> PyResult<PyRefMut<Self>> {
+        slf.push_row(values)?;
+        Ok(slf)
+    }
+
+    fn values_many(mut slf: PyRefMut<Self>, rows: Vec<Vec<PyValue>>) -> PyResult<PyRefMut<Self>> {
+        Arc::make_mut(&mut slf.rows).reserve(rows.len());
+        for row in rows {
+            slf.push_row(row)?;
+        }
+        Ok(slf)
+    }
+
+    fn __len__(&self) -> usize {
+        self.rows.len()
+    }
+
+    /// The `COPY` command the payload is sent with.
+    fn to_string(&self) -> PyResult<String> {
+        let table = self
+            .table
+            .as_ref()
+            .ok_or_else(|| PyValueError::new_err("COPY needs a table"))?;
+        let mut sql = format!("COPY {}", quote(table));
+        if !self.columns.is_empty() {
+            let columns: Vec<String> = self.columns.iter().map(quote).collect();
+            sql.push_str(&format!(" ({})", columns.join(", ")));
+        }
+        sql.push_str(" FROM STDIN");
+        if self.format == CopyFormat::Binary {
+            sql.push_str(" WITH (FORMAT binary)");
+        }
+        Ok(sql)
+    }
+
+    /// The whole payload at once.
+    fn payload<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyBytes>> {
+        let mut chunks = CopyChunks::new(self, usize::MAX)?;
+        let payload = py.allow_threads(|| chunks.encode_next())?;
+        Ok(PyBytes::new_bound(py, &payload))
+    }
+
+    /// The payload in chunks of about `size` bytes, encoded as they are read.
+    #[pyo3(signature = (size=DEFAULT_CHUNK_SIZE))]
+    fn chunks(&self, size: usize) -> PyResult<CopyChunks> {
+        if size == 0 {
+            return Err(PyValueError::new_err("size must be at least 1"));
+        }
+        CopyChunks::new(self, size)
+    }
+}
+
+#[pyclass]
+pub struct CopyChunks {
+    rows: Arc<Vec<Vec<PyValue>>>,
+    format: CopyFormat,
+    // For the binary format.
+    columns: Vec<BinaryColumn>,
+    size: usize,
+    next_row: usize,
+    started: bool,
+    done: bool,
+}
+
+impl CopyChunks {
+    fn new(statement: &CopyStatement, size: usize) -> PyResult<Self> {
+        let columns = match statement.format {
+            CopyFormat::Text => Vec::new(),
+            CopyFormat::Binary => statement.binary_columns()?,
+        };
+        Ok(Self {
+            rows: Arc::clone(&statement.rows),
+            format: statement.format,
+            columns,
+            size,
+            next_row: 0,
+            started: false,
+            done: false,
+        })
+    }
+
+    /// Encode rows until the chunk is full, with the header before the
+    /// first and the trailer after the last.
+    fn encode_next(&mut self) -> PyResult<Vec<u8>> {
+        let mut out = Vec::with_capacity(self.size.min(DEFAULT_CHUNK_SIZE));
+        if self.done {
+            return Ok(out);
+        }
+        if !self.started && self.format == CopyFormat::Binary {
+            out.extend_from_slice(BINARY_HEADER);
+        }
+        self.started = true;
+        while self.next_row < self.rows.len() && out.len() < self.size {
+            let row = &self.rows[self.next_row];
+            match self.format {
+                CopyFormat::Text => write_text_row(&mut out, row),
+                CopyFormat::Binary => write_binary_row(&mut out, &self.columns, row)?,
+            }
+            self.next_row += 1;
+        }
+        if self.next_row == self.rows.len() {
+            if self.format == CopyFormat::Binary {
+                out.extend_from_slice(BINARY_TRAILER);
+            }
+            self.done = true;
+        }
+        Ok(out)
+    }
+}
+
+#[pymethods]
+impl CopyChunks {
+    fn __iter__(slf: PyRef<Self>) -> PyRef<Self> {
+        slf
+    }
+
+    fn __next__<'py>(&mut self, py: Python<'py>) -> PyResult<Option<Bound<'py, PyBytes>>> {
+        let chunk = py.allow_threads(|| self.encode_next())?;
+        Ok((!chunk.is_empty()).then(|| PyBytes::new_bound(py, &chunk)))
+    }
+}
+
+fn write_text_row(out: &mut Vec<u8>, row: &[PyValue]) {
+    for (i, value) in row.iter().enumerate() {
+        if i > 0 {
+            out.push(b'\t');
+        }
+        write_text(out, value);
+    }
+    out.push(b'\n');
+}
+
+fn write_text(out: &mut Vec<u8>, value: &PyValue) {
+    let text = match value {
+        PyValue::None(_) | PyValue::Param(_) => {
+            out.extend_from_slice(b"\\N");
+            return;
+        }
+        PyValue::String(v) => {
+            for byte in v.bytes() {
+                match byte {
+                    b'\\' => out.extend_from_slice(b"\\\\"),
+                    b'\t' => out.extend_from_slice(b"\\t"),
+                    b'\n' => out.extend_from_slice(b"\\n"),
+                    b'\r' => out.extend_from_slice(b"\\r"),
+                    byte => out.push(byte),
+                }
+            }
+            return;
+        }
+        PyValue::Bool(v) => (if *v { "t" } else { "f" }).to_owned(),
+        PyValue::Int(v) => v.to_string(),
+        PyValue::Float(v) if v.is_nan() => "NaN".to_owned(),
+        PyValue::Float(v) if v.is_infinite() => {
+            (if *v > 0.0 { "Infinity" } else { "-Infinity" }).to_owned()
+        }
+        PyValue::Float(v) => v.to_string(),
+        PyValue::DateTimeTz(v) => v.format("%Y-%m-%d %H:%M:%S%.f%:z").to_string(),
+        PyValue::DateTime(v) => v.format("%Y-%m-%d %H:%M:%S%.f").to_string(),
+        PyValue::Date(v) => v.format("%Y-%m-%d").to_string(),
+        PyValue::Time(v) => v.format("%H:%M:%S%.f").to_string(),
+    };
+    out.extend_from_slice(text.as_bytes());
+}
+
+// Binary values use the send format of the type of their column, which
+// must be declared.
+
+/// The send formats values can be written in.
+#[derive(Clone, Copy)]
+enum BinaryType {
+    Bool,
+    Int2,
+    Int4,
+    Int8,
+    Float4,
+    Float8,
+    Text,
+    Jsonb,
+    Timestamp,
+    TimestampTz,
+    Date,
+    Time,
+}
+
+impl BinaryType {
+    /// The send format of a column type, None when it has no value it can
+    /// be written from.
+    fn of(ty: &ColumnType) -> Option<Self> {
+        Some(match ty {
+            ColumnType::Boolean => BinaryType::Bool,
+            ColumnType::TinyInteger
+            | ColumnType::TinyUnsigned
+            | ColumnType::SmallInteger
+            | ColumnType::SmallUnsigned => BinaryType::Int2,
+            ColumnType::Integer | ColumnType::Unsigned => BinaryType::Int4,
+            ColumnType::BigInteger | ColumnType::BigUnsigned => BinaryType::Int8,
+            ColumnType::Float => BinaryType::Float4,
+            ColumnType::Double => BinaryType::Float8,
+            // json is sent as its text, jsonb with a version first.
+            ColumnType::Char | ColumnType::String | ColumnType::Text | ColumnType::Json => {
+                BinaryType::Text
+            }
+            ColumnType::Jsonb => BinaryType::Jsonb,
+            ColumnType::DateTime | ColumnType::Timestamp => BinaryType::Timestamp,
+            ColumnType::TimestampWithTz => BinaryType::TimestampTz,
+            ColumnType::Date => BinaryType::Date,
+            ColumnType::Time => BinaryType::Time,
+            ColumnType::Decimal | ColumnType::Blob | ColumnType::Uuid => return None,
+        })
+    }
+}
+
+#[derive(Clone)]
+struct BinaryColumn {
+    name: String,
+    ty: BinaryType,
+}
+
+fn postgres_epoch() -> NaiveDateTime {
+    NaiveDate::from_ymd_opt(2000, 1, 1)
+        .unwrap()
+        .and_time(NaiveTime::from_hms_opt(0, 0, 0).unwrap())
+}
+
+fn write_binary_row(out: &mut Vec<u8>, columns: &[BinaryColumn], row: &[PyValue]) -> PyResult<()> {
+    out.extend_from_slice(&(row.len() as i16).to_be_bytes());
+    for (column, value) in columns.iter().zip(row) {
+        write_binary(out, column, value)?;
+    }
+    Ok(())
+}
+
+fn write_field(out: &mut Vec<u8>, bytes: &[u8]) {
+    out.extend_from_slice(&(bytes.len() as i32).to_be_bytes());
+    out.extend_from_slice(bytes);
+}
+
+/// The name of the python type a value came from, for errors.
+fn python_type(value: &PyValue) -> &'static str {
+    match value {
+        PyValue::Bool(_) => "a bool",
+        PyValue::Int(_) => "an int",
+        PyValue::Float(_) => "a float",
+        PyValue::DateTimeTz(_) => "an aware datetime",
+        PyValue::DateTime(_) => "a naive datetime",
+        PyValue::Date(_) => "a date",
+        PyValue::Time(_) => "a time",
+        PyValue::String(_) => "a str",
+        PyValue::Param(_) => "a placeholder",
+        PyValue::None(_) => "None",
+    }
+}
+
+fn write_binary(out: &mut Vec<u8>, column: &BinaryColumn, value: &PyValue) -> PyResult<()> {
+    let out_of_range =
+        || PyValueError::new_err(format!("Value out of range for column '{}'", column.name));
+    match (column.ty, value) {
+        (_, PyValue::None(_)) => out.extend_from_slice(&(-1i32).to_be_bytes()),
+        (BinaryType::Bool, PyValue::Bool(v)) => write_field(out, &[*v as u8]),
+        (BinaryType::Int2, PyValue::Int(v)) => {
+            let v = i16::try_from(*v).map_err(|_| out_of_range())?;
+            write_field(out, &v.to_be_bytes());
+        }
+        (BinaryType::Int4, PyValue::Int(v)) => {
+            let v = i32::try_from(*v).map_err(|_| out_of_range())?;
+            write_field(out, &v.to_be_bytes());
+        }
+        (BinaryType::Int8, PyValue::Int(v)) => write_field(out, &v.to_be_bytes()),
+        (BinaryType::Float4, PyValue::Float(v)) => write_field(out, &(*v as f32).to_be_bytes()),
+        (BinaryType::Float4, PyValue::Int(v)) => write_field(out, &(*v as f32).to_be_bytes()),
+        (BinaryType::Float8, PyValue::Float(v)) => write_field(out, &v.to_be_bytes()),
+        (BinaryType::Float8, PyValue::Int(v)) => write_field(out, &(*v as f64).to_be_bytes()),
+        (BinaryType::Text, PyValue::String(v)) => write_field(out, v.as_bytes()),
+        (BinaryType::Jsonb, PyValue::String(v)) => {
+            out.extend_from_slice(&(v.len() as i32 + 1).to_be_bytes());
+            out.push(1);
+            out.extend_from_slice(v.as_bytes());
+        }
+        (BinaryType::Timestamp, PyValue::DateTime(v)) => write_timestamp(out, *v),
+        (BinaryType::TimestampTz, PyValue::DateTimeTz(v)) => write_timestamp(out, v.naive_utc()),
+        (BinaryType::Date, PyValue::Date(v)) => {
+            let days = v.signed_duration_since(postgres_epoch().date()).num_days();
+            write_field(out, &(days as i32).to_be_bytes());
+        }
+        (BinaryType::Time, PyValue::Time(v)) => {
+            let micros =
+                v.num_seconds_from_midnight() as i64 * 1_000_000 + (v.nanosecond() / 1_000) as i64;
+            write_field(out, &micros.to_be_bytes());
+        }
+        _ => {
+            return Err(PyValueError::new_err(format!(
+                "Column '{}' can't be copied from {} in the binary format",
+                column.name,
+                python_type(value)
+            )))
+        }
+    }
+    Ok(())
+}
+
+fn write_timestamp(out: &mut Vec<u8>, value: NaiveDateTime) {
+    // Microseconds overflow only 292,000 years away from 2000.
+    let micros = value
+        .signed_duration_since(postgres_epoch())
+        .num_microseconds()
+        .unwrap_or(i64::MAX);
+    write_field(out, &micros.to_be_bytes());
+}
@@ -1,35 +1,152 @@
-use pyo3::prelude::*;
+use std::sync::Arc;
+
+use pyo3::{
+    prelude::*,
+    types::{PyBytes, PyTuple, PyType},
+};
 use sea_query::{
     expr::{Expr as SeaExpr, SimpleExpr as SeaSimpleExpr},
     query::{CaseStatement as SeaCaseStatement, Condition as SeaCondition},
-    Alias, IntoCondition,
+    IntoCondition,
 };
 
-use crate::query::SelectStatement;
-use crate::types::PyValue;
+use crate::iden::Ident;
+use crate::query::{Select, SelectStatement};
+use crate::recipe::{Recipe, ToArg};
+use crate::types::{Param, PyValue};
+
+// Expressions, conditions and case statements are immutable trees of shared
+// nodes: combining them links the operands instead of copying them, and the
+// sea-query values are only built when attached to a statement.
+
+enum ExprNode {
+    Leaf(SeaSimpleExpr),
+    And(Arc<ExprNode>, Arc<ExprNode>),
+    Or(Arc<ExprNode>, Arc<ExprNode>),
+    Not(Arc<ExprNode>),
+    Exists(Arc<Select>),
+}
+
+// A step of building an expression tree: a node to visit, or an operator to
+// apply to the operands built last.
+enum BuildStep<'a> {
+    Visit(&'a ExprNode),
+    And,
+    Or,
+    Not,
+}
+
+impl ExprNode {
+    fn build(&self) -> SeaSimpleExpr {
+        // Walk the tree with a stack of its own instead of recursing,
+        // expressions built from user input can nest thousands of operators.
+        let mut steps = vec![BuildStep::Visit(self)];
+        let mut built: Vec<SeaSimpleExpr> = Vec::new();
+        while let Some(step) = steps.pop() {
+            match step {
+                BuildStep::Visit(ExprNode::Leaf(expr)) => built.push(expr.clone()),
+                BuildStep::Visit(ExprNode::And(left, right)) => steps.extend([
+                    BuildStep::And,
+                    BuildStep::Visit(right),
+                    BuildStep::Visit(left),
+                ]),
+                BuildStep::Visit(ExprNode::Or(left, right)) => steps.extend([
+                    BuildStep::Or,
+                    BuildStep::Visit(right),
+                    BuildStep::Visit(left),
+                ]),
+                BuildStep::Visit(ExprNode::Not(expr)) => {
+                    steps.extend([BuildStep::Not, BuildStep::Visit(expr)])
+                }
+                BuildStep::Visit(ExprNode::Exists(select)) => {
+                    built.push(SeaExpr::exists(select.statement().clone()))
+                }
+                BuildStep::Not => {
+                    let expr = built.pop().unwrap();
+                    built.push(expr.not());
+                }
+                BuildStep::And | BuildStep::Or => {
+                    let right = built.pop().unwrap();
+                    let left = built.pop().unwrap();
+                    built.push(match step {
+                        BuildStep::And => left.and(right),
+                        _ => left.or(right),
+                    });
+                }
+            }
+        }
+        built.pop().unwrap()
+    }
+}
 
 #[pyclass]
 #[derive(Clone)]
-pub struct SimpleExpr(pub SeaSimpleExpr);
+pub struct SimpleExpr(Arc<ExprNode>, pub(crate) Recipe);
+
+impl SimpleExpr {
+    fn new(expr: SeaSimpleExpr, recipe: Recipe) -> Self {
+        Self(Arc::new(ExprNode::Leaf(expr)), recipe)
+    }
+}
+
+impl From<SimpleExpr> for SeaSimpleExpr {
+    fn from(expr: SimpleExpr) -> Self {
+        expr.0.build()
+    }
+}
 
 #[pymethods]
 impl SimpleExpr {
     fn __or__(&self, other: &Self) -> Self {
-        Self(self.0.clone().or(other.0.clone()))
+        Self(
+            Arc::new(ExprNode::Or(self.0.clone(), other.0.clone())),
+            self.1.call("__or__", || vec![other.to_arg()]),
+        )
     }
 
     fn __and__(&self, other: &Self) -> Self {
-        Self(self.0.clone().and(other.0.clone()))
+        Self(
+            Arc::new(ExprNode::And(self.0.clone(), other.0.clone())),
+            self.1.call("__and__", || vec![other.to_arg()]),
+        )
     }
 
     fn __invert__(&self) -> Self {
-        Self(self.0.clone().not())
+        Self(
+            Arc::new(ExprNode::Not(self.0.clone())),
+            self.1.call("__invert__", || vec![]),
+        )
+    }
+
+    fn fingerprint(&self) -> PyResult<u128> {
+        Ok(self.1.recorded()?.fingerprint())
+    }
+
+    fn __hash__(&self) -> u64 {
+        self.1.hash()
+    }
+
+    fn __eq__(&self, other: &Self) -> bool {
+        self.1.same(&other.1)
+    }
+
+    fn to_bytes<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyBytes>> {
+        self.1.to_bytes(py)
+    }
+
+    #[classmethod]
+    fn from_bytes<'py>(cls: &Bound<'py, PyType>, data: &[u8]) -> PyResult<Bound<'py, PyAny>> {
+        Recipe::from_bytes(cls, data)
+    }
+
+    fn __reduce__<'py>(slf: &Bound<'py, Self>) -> PyResult<Bound<'py, PyTuple>> {
+        slf.borrow().1.reduce(slf.as_any())
     }
 }
 
 #[pyclass]
 #[derive(Clone)]
-pub struct Expr(Option<SeaExpr>);
+pub struct Expr(Option<SeaExpr>, pub(crate) Recipe);
 
 impl Expr {
     pub fn take(&mut self) -> SeaExpr {
@@ -41,176 +158,353 @@ impl Expr {
 impl Expr {
     #[staticmethod]
     #[pyo3(signature = (name, table=None))]
-    fn column(name: String, table: Option<String>) -> Self {
+    fn column(name: Ident, table: Option<Ident>) -> Self {
+        let recipe = Recipe::constructor("Expr", "column", || vec![name.to_arg(), table.to_arg()]);
         if let Some(table) = table {
-            return Self(Some(SeaExpr::col((Alias::new(table), Alias::new(name)))));
+            return Self(Some(SeaExpr::col((table, name))), recipe);
         }
-        Self(Some(SeaExpr::col(Alias::new(name))))
+        Self(Some(SeaExpr::col(name)), recipe)
     }
 
     #[staticmethod]
     fn value(value: PyValue) -> Self {
-        Self(Some(SeaExpr::val(&value)))
+        let recipe = Recipe::constructor("Expr", "value", || vec![value.to_arg()]);
+        Self(Some(SeaExpr::val(&value)), recipe)
+    }
+
+    #[staticmethod]
+    fn param(name: String) -> Param {
+        Param(name)
     }
 
     #[allow(clippy::self_named_constructors)]
     #[staticmethod]
     fn expr(mut expr: Expr) -> Self {
-        Self(Some(SeaExpr::expr(expr.take())))
+        let recipe = Recipe::constructor("Expr", "expr", || vec![expr.to_arg()]);
+        Self(Some(SeaExpr::expr(expr.take())), recipe)
     }
 
     #[pyo3(signature = (column, table=None))]
-    fn equals(&mut self, column: String, table: Option<String>) -> SimpleExpr {
+    fn equals(&mut self, column: Ident, table: Option<Ident>) -> SimpleExpr {
+        let recipe = self
+            .1
+            .call("equals", || vec![column.to_arg(), table.to_arg()]);
         if let Some(table) = table {
-            return SimpleExpr(self.take().equals((Alias::new(table), Alias::new(column))));
+            return SimpleExpr::new(self.take().equals((table, column)), recipe);
         }
-        SimpleExpr(self.take().equals(Alias::new(column)))
+        SimpleExpr::new(self.take().equals(column), recipe)
     }
 
     #[pyo3(signature = (column, table=None))]
-    fn not_equals(&mut self, column: String, table: Option<String>) -> SimpleExpr {
+    fn not_equals(&mut self, column: Ident, table: Option<Ident>) -> SimpleExpr {
+        let recipe = self
+            .1
+            .call("not_equals", || vec![column.to_arg(), table.to_arg()]);
         if let Some(table) = table {
-            return SimpleExpr(self.take().equals((Alias::new(table), Alias::new(column))));
+            return SimpleExpr::new(self.take().equals((table, column)), recipe);
         }
-        SimpleExpr(self.take().equals(Alias::new(column)))
+        SimpleExpr::new(self.take().equals(column), recipe)
     }
 
     fn eq(&mut self, value: PyValue) -> SimpleExpr {
-        SimpleExpr(self.take().eq(&value))
+        SimpleExpr::new(
+            self.take().eq(&value),
+            self.1.call("eq", || vec![value.to_arg()]),
+        )
     }
 
     fn ne(&mut self, value: PyValue) -> SimpleExpr {
-        SimpleExpr(self.take().ne(&value))
+        SimpleExpr::new(
+            self.take().ne(&value),
+            self.1.call("ne", || vec![value.to_arg()]),
+        )
     }
 
     fn gt(&mut self, value: PyValue) -> SimpleExpr {
-        SimpleExpr(self.take().gt(&value))
+        SimpleExpr::new(
+            self.take().gt(&value),
+            self.1.call("gt", || vec![value.to_arg()]),
+        )
     }
 
     fn gte(&mut self, value: PyValue) -> SimpleExpr {
-        SimpleExpr(self.take().gte(&value))
+        SimpleExpr::new(
+            self.take().gte(&value),
+            self.1.call("gte", || vec![value.to_arg()]),
+        )
     }
 
     fn lt(&mut self, value: PyValue) -> SimpleExpr {
-        SimpleExpr(self.take().lt(&value))
+        SimpleExpr::new(
+            self.take().lt(&value),
+            self.1.call("lt", || vec![value.to_arg()]),
+        )
     }
 
     fn lte(&mut self, value: PyValue) -> SimpleExpr {
-        SimpleExpr(self.take().lte(&value))
+        SimpleExpr::new(
+            self.take().lte(&value),
+            self.1.call("lte", || vec![value.to_arg()]),
+        )
     }
 
     fn is_(&mut self, value: PyValue) -> SimpleExpr {
-        SimpleExpr(self.take().is(&value))
+        SimpleExpr::new(
+            self.take().is(&value),
+            self.1.call("is_", || vec![value.to_arg()]),
+        )
     }
 
     fn is_not(&mut self, value: PyValue) -> SimpleExpr {
-        SimpleExpr(self.take().is_not(&value))
+        SimpleExpr::new(
+            self.take().is_not(&value),
+            self.1.call("is_not", || vec![value.to_arg()]),
+        )
     }
 
     fn is_in(&mut self, values: Vec<PyValue>) -> SimpleExpr {
-        SimpleExpr(self.take().is_in(&values))
+        SimpleExpr::new(
+            self.take().is_in(&values),
+            self.1.call("is_in", || vec![values.to_arg()]),
+        )
     }
 
     fn is_not_in(&mut self, values: Vec<PyValue>) -> SimpleExpr {
-        SimpleExpr(self.take().is_not_in(&values))
+        SimpleExpr::new(
+            self.take().is_not_in(&values),
+            self.1.call("is_not_in", || vec![values.to_arg()]),
+        )
     }
 
     fn between(&mut self, start: PyValue, end: PyValue) -> SimpleExpr {
-        SimpleExpr(self.take().between(&start, &end))
+        SimpleExpr::new(
+            self.take().between(&start, &end),
+            self.1
+                .call("between", || vec![start.to_arg(), end.to_arg()]),
+        )
     }
 
     fn not_between(&mut self, start: PyValue, end: PyValue) -> SimpleExpr {
-        SimpleExpr(self.take().not_between(&start, &end))
+        SimpleExpr::new(
+            self.take().not_between(&start, &end),
+            self.1
+                .call("not_between", || vec![start.to_arg(), end.to_arg()]),
+        )
     }
 
     fn like(&mut self, value: String) -> SimpleExpr {
-        SimpleExpr(self.take().like(&value))
+        SimpleExpr::new(
+            self.take().like(&value),
+            // The pattern is rendered as a parameter, so recorded as a value.
+            self.1
+                .call("like", || vec![PyValue::String(value.clone()).to_arg()]),
+        )
     }
 
     fn not_like(&mut self, value: String) -> SimpleExpr {
-        SimpleExpr(self.take().not_like(&value))
+        SimpleExpr::new(
+            self.take().not_like(&value),
+            // The pattern is rendered as a parameter, so recorded as a value.
+            self.1
+                .call("not_like", || vec![PyValue::String(value.clone()).to_arg()]),
+        )
     }
 
     fn is_null(&mut self) -> SimpleExpr {
-        SimpleExpr(self.take().is_null())
+        SimpleExpr::new(self.take().is_null(), self.1.call("is_null", || vec![]))
     }
 
     fn is_not_null(&mut self) -> SimpleExpr {
-        SimpleExpr(self.take().is_not_null())
+        SimpleExpr::new(
+            self.take().is_not_null(),
+            self.1.call("is_not_null", || vec![]),
+        )
     }
 
     fn max(&mut self) -> SimpleExpr {
-        SimpleExpr(self.take().max())
+        SimpleExpr::new(self.take().max(), self.1.call("max", || vec![]))
     }
 
     fn min(&mut self) -> SimpleExpr {
-        SimpleExpr(self.take().min())
+        SimpleExpr::new(self.take().min(), self.1.call("min", || vec![]))
     }
 
     fn sum(&mut self) -> SimpleExpr {
-        SimpleExpr(self.take().sum())
+        SimpleExpr::new(self.take().sum(), self.1.call("sum", || vec![]))
     }
 
     fn count(&mut self) -> SimpleExpr {
-        SimpleExpr(self.take().count())
+        SimpleExpr::new(self.take().count(), self.1.call("count", || vec![]))
     }
 
     fn count_distinct(&mut self) -> SimpleExpr {
-        SimpleExpr(self.take().count_distinct())
+        SimpleExpr::new(
+            self.take().count_distinct(),
+            self.1.call("count_distinct", || vec![]),
+        )
     }
 
     fn if_null(&mut self, value: PyValue) -> SimpleExpr {
-        SimpleExpr(self.take().if_null(&value))
+        SimpleExpr::new(
+            self.take().if_null(&value),
+            self.1.call("if_null", || vec![value.to_arg()]),
+        )
     }
 
     #[staticmethod]
     fn current_timestamp() -> Expr {
-        Expr(Some(SeaExpr::current_timestamp()))
+        Expr(
+            Some(SeaExpr::current_timestamp()),
+            Recipe::constructor("Expr", "current_timestamp", || vec![]),
+        )
     }
 
     #[staticmethod]
     fn current_date() -> Expr {
-        Expr(Some(SeaExpr::current_date()))
+        Expr(
+            Some(SeaExpr::current_date()),
+            Recipe::constructor("Expr", "current_date", || vec![]),
+        )
     }
 
     #[staticmethod]
     fn current_time() -> Expr {
-        Expr(Some(SeaExpr::current_time()))
+        Expr(
+            Some(SeaExpr::current_time()),
+            Recipe::constructor("Expr", "current_time", || vec![]),
+        )
     }
 
     #[staticmethod]
     fn exists(query: SelectStatement) -> SimpleExpr {
-        SimpleExpr(SeaExpr::exists(query.0))
+        let recipe = Recipe::constructor("Expr", "exists", || vec![query.to_arg()]);
+        SimpleExpr(Arc::new(ExprNode::Exists(query.0)), recipe)
     }
 
     #[staticmethod]
     fn case() -> CaseStatement {
         CaseStatement::new()
     }
+
+    fn to_bytes<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyBytes>> {
+        self.1.to_bytes(py)
+    }
+
+    #[classmethod]
+    fn from_bytes<'py>(cls: &Bound<'py, PyType>, data: &[u8]) -> PyResult<Bound<'py, PyAny>> {
+        Recipe::from_bytes(cls, data)
+    }
+
+    fn __reduce__<'py>(slf: &Bound<'py, Self>) -> PyResult<Bound<'py, PyTuple>> {
+        slf.borrow().1.reduce(slf.as_any())
+    }
+}
+
+enum ConditionNode {
+    All,
+    Any,
+    Add(Arc<ConditionNode>, ConditionItem),
+    Not(Arc<ConditionNode>),
+}
+
+enum ConditionItem {
+    Condition(Arc<ConditionNode>),
+    Expr(Arc<ExprNode>),
+}
+
+impl ConditionNode {
+    fn build(&self) -> SeaCondition {
+        // Walk the chain of `add` calls without recursing, conditions built
+        // from user input can have thousands of them.
+        let mut items = Vec::new();
+        let mut node = self;
+        while let ConditionNode::Add(base, item) = node {
+            items.push(item);
+            node = &**base;
+        }
+        let condition = match node {
+            ConditionNode::All => SeaCondition::all(),
+            ConditionNode::Any => SeaCondition::any(),
+            ConditionNode::Not(inner) => inner.build().not(),
+            ConditionNode::Add(..) => unreachable!(),
+        };
+        items
+            .into_iter()
+            .rev()
+            .fold(condition, |condition, item| match item {
+                ConditionItem::Condition(cond) => condition.add(cond.build()),
+                ConditionItem::Expr(expr) => condition.add(expr.build().into_condition()),
+            })
+    }
 }
 
 #[pyclass]
 #[derive(Clone)]
-pub struct Condition(pub SeaCondition);
+pub struct Condition(Arc<ConditionNode>, pub(crate) Recipe);
+
+impl IntoCondition for Condition {
+    fn into_condition(self) -> SeaCondition {
+        self.0.build()
+    }
+}
 
 #[pymethods]
 impl Condition {
     #[staticmethod]
     fn all() -> Self {
-        Self(SeaCondition::all())
+        Self(
+            Arc::new(ConditionNode::All),
+            Recipe::constructor("Condition", "all", || vec![]),
+        )
     }
 
     #[staticmethod]
     fn any() -> Self {
-        Self(SeaCondition::any())
+        Self(
+            Arc::new(ConditionNode::Any),
+            Recipe::constructor("Condition", "any", || vec![]),
+        )
     }
 
     fn add(&self, expr: ConditionExpression) -> Self {
-        Self(self.0.clone().add(expr.into_condition()))
+        let recipe = self.1.call("add", || vec![expr.to_arg()]);
+        let item = match expr {
+            ConditionExpression::Condition(cond) => ConditionItem::Condition(cond.0),
+            ConditionExpression::SimpleExpr(expr) => ConditionItem::Expr(expr.0),
+        };
+        Self(Arc::new(ConditionNode::Add(self.0.clone(), item)), recipe)
     }
 
     fn __invert__(&self) -> Self {
-        Self(self.0.clone().not())
+        Self(
+            Arc::new(ConditionNode::Not(self.0.clone())),
+            self.1.call("__invert__", || vec![]),
+        )
+    }
+
+    fn fingerprint(&self) -> PyResult<u128> {
+        Ok(self.1.recorded()?.fingerprint())
+    }
+
+    fn __hash__(&self) -> u64 {
+        self.1.hash()
+    }
+
+    fn __eq__(&self, other: &Self) -> bool {
+        self.1.same(&other.1)
+    }
+
+    fn to_bytes<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyBytes>> {
+        self.1.to_bytes(py)
+    }
+
+    #[classmethod]
+    fn from_bytes<'py>(cls: &Bound<'py, PyType>, data: &[u8]) -> PyResult<Bound<'py, PyAny>> {
+        Recipe::from_bytes(cls, data)
+    }
+
+    fn __reduce__<'py>(slf: &Bound<'py, Self>) -> PyResult<Bound<'py, PyTuple>> {
+        slf.borrow().1.reduce(slf.as_any())
     }
 }
 
@@ -223,29 +517,96 @@ pub enum ConditionExpression {
 impl IntoCondition for ConditionExpression {
     fn into_condition(self) -> SeaCondition {
         match self {
-            ConditionExpression::Condition(cond) => cond.0,
-            ConditionExpression::SimpleExpr(expr) => expr.0.into_condition(),
+            ConditionExpression::Condition(cond) => cond.into_condition(),
+            ConditionExpression::SimpleExpr(expr) => SeaSimpleExpr::from(expr).into_condition(),
+        }
+    }
+}
+
+enum CaseNode {
+    Empty,
+    When(Arc<CaseNode>, Arc<ConditionNode>, SeaSimpleExpr),
+    Else(Arc<CaseNode>, SeaSimpleExpr),
+}
+
+impl CaseNode {
+    fn build(&self) -> SeaCaseStatement {
+        let mut branches = Vec::new();
+        let mut node = self;
+        loop {
+            match node {
+                CaseNode::Empty => break,
+                CaseNode::When(base, ..) | CaseNode::Else(base, _) => {
+                    branches.push(node);
+                    node = &**base;
+                }
+            }
         }
+        branches
+            .into_iter()
+            .rev()
+            .fold(SeaCaseStatement::new(), |case, branch| match branch {
+                CaseNode::When(_, cond, then) => case.case(cond.build(), then.clone()),
+                CaseNode::Else(_, expr) => case.finally(expr.clone()),
+                CaseNode::Empty => case,
+            })
     }
 }
 
 #[pyclass]
 #[derive(Clone)]
-pub struct CaseStatement(pub(crate) SeaCaseStatement);
+pub struct CaseStatement(Arc<CaseNode>, pub(crate) Recipe);
 
 #[pymethods]
 impl CaseStatement {
     #[staticmethod]
     fn new() -> Self {
-        Self(SeaCaseStatement::new())
+        // Not exported on its own, created through `Expr.case`.
+        Self(
+            Arc::new(CaseNode::Empty),
+            Recipe::constructor("Expr", "case", || vec![]),
+        )
     }
 
     fn when(&self, condition: ConditionExpression, mut then: Expr) -> Self {
-        Self(self.0.clone().case(condition.into_condition(), then.take()))
+        let recipe = self
+            .1
+            .call("when", || vec![condition.to_arg(), then.to_arg()]);
+        let condition = match condition {
+            ConditionExpression::Condition(cond) => cond.0,
+            ConditionExpression::SimpleExpr(expr) => Arc::new(ConditionNode::Add(
+                Arc::new(ConditionNode::All),
+                ConditionItem::Expr(expr.0),
+            )),
+        };
+        Self(
+            Arc::new(CaseNode::When(
+                self.0.clone(),
+                condition,
+                then.take().into(),
+            )),
+            recipe,
+        )
     }
 
     fn else_(&self, mut expr: Expr) -> Self {
-        Self(self.0.clone().finally(expr.take()))
+        Self(
+            Arc::new(CaseNode::Else(self.0.clone(), expr.take().into())),
+            self.1.call("else_", || vec![expr.to_arg()]),
+        )
+    }
+
+    fn to_bytes<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyBytes>> {
+        self.1.to_bytes(py)
+    }
+
+    #[classmethod]
+    fn from_bytes<'py>(cls: &Bound<'py, PyType>, data: &[u8]) -> PyResult<Bound<'py, PyAny>> {
+        Recipe::from_bytes(cls, data)
+    }
+
+    fn __reduce__<'py>(slf: &Bound<'py, Self>) -> PyResult<Bound<'py, PyTuple>> {
+        slf.borrow().1.reduce(slf.as_any())
     }
 }
 
@@ -260,9 +621,9 @@ pub(crate) enum IntoSimpleExpr {
 impl From<IntoSimpleExpr> for SeaSimpleExpr {
     fn from(expr: IntoSimpleExpr) -> Self {
         match expr {
-            IntoSimpleExpr::SimpleExpr(expr) => expr.0,
+            IntoSimpleExpr::SimpleExpr(expr) => expr.into(),
             IntoSimpleExpr::Expr(mut expr) => expr.take().into(),
-            IntoSimpleExpr::CaseStatement(case) => case.0.into(),
+            IntoSimpleExpr::CaseStatement(case) => case.0.build().into(),
         }
     }
 }
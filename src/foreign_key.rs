@@ -1,5 +1,12 @@
+use crate::iden::Ident;
+use crate::metrics::{self, Kind};
+use crate::recipe::{Recipe, ToArg};
 use crate::types::DBEngine;
-use pyo3::{pyclass, pymethods, PyRefMut};
+use pyo3::{
+    pyclass, pymethods,
+    types::{PyBytes, PyTuple, PyType},
+    Bound, PyAny, PyRefMut, PyResult, Python,
+};
 use sea_query::{
     backend::{MysqlQueryBuilder, PostgresQueryBuilder, SqliteQueryBuilder},
     foreign_key::{
@@ -7,7 +14,6 @@ use sea_query::{
         ForeignKeyCreateStatement as SeaForeignKeyCreateStatement,
         ForeignKeyDropStatement as SeaForeignKeyDropStatement,
     },
-    Alias,
 };
 
 #[pyclass(eq, eq_int)]
@@ -34,85 +40,164 @@ impl From<ForeignKeyAction> for SeaForeignKeyAction {
 
 #[pyclass(subclass)]
 #[derive(Clone)]
-pub struct ForeignKeyCreateStatement(pub SeaForeignKeyCreateStatement);
+pub struct ForeignKeyCreateStatement(pub SeaForeignKeyCreateStatement, pub(crate) Recipe);
 
 #[pymethods]
 impl ForeignKeyCreateStatement {
     #[new]
     fn new() -> Self {
-        Self(SeaForeignKeyCreateStatement::new())
+        Self(
+            SeaForeignKeyCreateStatement::new(),
+            Recipe::new("ForeignKeyCreateStatement", || vec![]),
+        )
     }
 
     fn name(mut slf: PyRefMut<Self>, name: String) -> PyRefMut<Self> {
+        slf.1.record("name", || vec![name.to_arg()]);
         slf.0.name(name);
         slf
     }
 
-    fn from_table(mut slf: PyRefMut<Self>, name: String) -> PyRefMut<Self> {
-        slf.0.from_tbl(Alias::new(name));
+    fn from_table(mut slf: PyRefMut<Self>, name: Ident) -> PyRefMut<Self> {
+        slf.1.record("from_table", || vec![name.to_arg()]);
+        slf.0.from_tbl(name);
         slf
     }
 
-    fn from_column(mut slf: PyRefMut<Self>, name: String) -> PyRefMut<Self> {
-        slf.0.from_col(Alias::new(name));
+    fn from_column(mut slf: PyRefMut<Self>, name: Ident) -> PyRefMut<Self> {
+        slf.1.record("from_column", || vec![name.to_arg()]);
+        slf.0.from_col(name);
         slf
     }
 
-    fn to_table(mut slf: PyRefMut<Self>, name: String) -> PyRefMut<Self> {
-        slf.0.to_tbl(Alias::new(name));
+    fn to_table(mut slf: PyRefMut<Self>, name: Ident) -> PyRefMut<Self> {
+        slf.1.record("to_table", || vec![name.to_arg()]);
+        slf.0.to_tbl(name);
         slf
     }
 
-    fn to_column(mut slf: PyRefMut<Self>, name: String) -> PyRefMut<Self> {
-        slf.0.to_col(Alias::new(name));
+    fn to_column(mut slf: PyRefMut<Self>, name: Ident) -> PyRefMut<Self> {
+        slf.1.record("to_column", || vec![name.to_arg()]);
+        slf.0.to_col(name);
         slf
     }
 
     fn on_delete(mut slf: PyRefMut<Self>, action: ForeignKeyAction) -> PyRefMut<Self> {
+        slf.1.record("on_delete", || vec![action.to_arg()]);
         slf.0.on_delete(action.into());
         slf
     }
 
     fn on_update(mut slf: PyRefMut<Self>, action: ForeignKeyAction) -> PyRefMut<Self> {
+        slf.1.record("on_update", || vec![action.to_arg()]);
         slf.0.on_update(action.into());
         slf
     }
 
-    fn to_string(&self, engine: &DBEngine) -> String {
-        match engine {
-            DBEngine::Mysql => self.0.to_string(MysqlQueryBuilder),
-            DBEngine::Postgres => self.0.to_string(PostgresQueryBuilder),
-            DBEngine::Sqlite => self.0.to_string(SqliteQueryBuilder),
-        }
+    fn fingerprint(&self) -> PyResult<u128> {
+        Ok(self.1.recorded()?.fingerprint())
+    }
+
+    fn __hash__(&self) -> u64 {
+        self.1.hash()
+    }
+
+    fn __eq__(&self, other: &Self) -> bool {
+        self.1.same(&other.1)
+    }
+
+    fn to_bytes<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyBytes>> {
+        self.1.to_bytes(py)
+    }
+
+    #[classmethod]
+    fn from_bytes<'py>(cls: &Bound<'py, PyType>, data: &[u8]) -> PyResult<Bound<'py, PyAny>> {
+        Recipe::from_bytes(cls, data)
+    }
+
+    fn __reduce__<'py>(slf: &Bound<'py, Self>) -> PyResult<Bound<'py, PyTuple>> {
+        slf.borrow().1.reduce(slf.as_any())
+    }
+
+    fn to_string(&self, py: Python, engine: &DBEngine) -> String {
+        py.allow_threads(|| {
+            metrics::timed(
+                Kind::Ddl,
+                engine,
+                || self.1.fingerprint(),
+                || match engine {
+                    DBEngine::Mysql => self.0.to_string(MysqlQueryBuilder),
+                    DBEngine::Postgres => self.0.to_string(PostgresQueryBuilder),
+                    DBEngine::Sqlite => self.0.to_string(SqliteQueryBuilder),
+                },
+            )
+        })
     }
 }
 
 #[pyclass(subclass)]
-pub struct ForeignKeyDropStatement(pub SeaForeignKeyDropStatement);
+pub struct ForeignKeyDropStatement(pub SeaForeignKeyDropStatement, pub(crate) Recipe);
 
 #[pymethods]
 impl ForeignKeyDropStatement {
     #[new]
     fn new() -> Self {
-        Self(SeaForeignKeyDropStatement::new())
+        Self(
+            SeaForeignKeyDropStatement::new(),
+            Recipe::new("ForeignKeyDropStatement", || vec![]),
+        )
     }
 
     fn name(mut slf: PyRefMut<Self>, name: String) -> PyRefMut<Self> {
+        slf.1.record("name", || vec![name.to_arg()]);
         slf.0.name(name);
         slf
     }
 
-    fn table(mut slf: PyRefMut<Self>, name: String) -> PyRefMut<Self> {
-        slf.0.table(Alias::new(name));
+    fn table(mut slf: PyRefMut<Self>, name: Ident) -> PyRefMut<Self> {
+        slf.1.record("table", || vec![name.to_arg()]);
+        slf.0.table(name);
         slf
     }
 
-    fn to_string(&self, engine: &DBEngine) -> String {
-        match engine {
-            DBEngine::Mysql => self.0.to_string(MysqlQueryBuilder),
-            DBEngine::Postgres => self.0.to_string(PostgresQueryBuilder),
-            DBEngine::Sqlite => self.0.to_string(SqliteQueryBuilder),
-        }
+    fn fingerprint(&self) -> PyResult<u128> {
+        Ok(self.1.recorded()?.fingerprint())
+    }
+
+    fn __hash__(&self) -> u64 {
+        self.1.hash()
+    }
+
+    fn __eq__(&self, other: &Self) -> bool {
+        self.1.same(&other.1)
+    }
+
+    fn to_bytes<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyBytes>> {
+        self.1.to_bytes(py)
+    }
+
+    #[classmethod]
+    fn from_bytes<'py>(cls: &Bound<'py, PyType>, data: &[u8]) -> PyResult<Bound<'py, PyAny>> {
+        Recipe::from_bytes(cls, data)
+    }
+
+    fn __reduce__<'py>(slf: &Bound<'py, Self>) -> PyResult<Bound<'py, PyTuple>> {
+        slf.borrow().1.reduce(slf.as_any())
+    }
+
+    fn to_string(&self, py: Python, engine: &DBEngine) -> String {
+        py.allow_threads(|| {
+            metrics::timed(
+                Kind::Ddl,
+                engine,
+                || self.1.fingerprint(),
+                || match engine {
+                    DBEngine::Mysql => self.0.to_string(MysqlQueryBuilder),
+                    DBEngine::Postgres => self.0.to_string(PostgresQueryBuilder),
+                    DBEngine::Sqlite => self.0.to_string(SqliteQueryBuilder),
+                },
+            )
+        })
     }
 }
 
@@ -131,3 +216,13 @@ impl ForeignKey {
         ForeignKeyDropStatement::new()
     }
 }
+
+bound_statements!(schema ForeignKeyCreateStatement("ForeignKeyCreateStatement") {
+    Mysql("sea_query.mysql"): MysqlForeignKeyCreateStatement,
+    Postgres("sea_query.postgres"): PostgresForeignKeyCreateStatement,
+});
+
+bound_statements!(schema ForeignKeyDropStatement("ForeignKeyDropStatement") {
+    Mysql("sea_query.mysql"): MysqlForeignKeyDropStatement,
+    Postgres("sea_query.postgres"): PostgresForeignKeyDropStatement,
+});
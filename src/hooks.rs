@@ -0,0 +1,129 @@
+use std::sync::{
+    atomic::{AtomicBool, AtomicU64, Ordering},
+    Arc, PoisonError, RwLock,
+};
+
+use pyo3::{exceptions::PyValueError, prelude::*};
+
+// A hook is only looked up when set, so builds pay a single atomic load
+// otherwise.
+static ACTIVE: AtomicBool = AtomicBool::new(false);
+static HOOK: RwLock<Option<Arc<Hook>>> = RwLock::new(None);
+static SAMPLES: AtomicU64 = AtomicU64::new(0);
+
+struct Hook {
+    callback: PyObject,
+    // A build is sampled when its draw is below this.
+    sample_below: u64,
+    sample_all: bool,
+    slow_nanos: Option<u64>,
+}
+
+/// What the build hook is told about a build.
+#[pyclass(frozen, get_all)]
+pub struct BuildEvent {
+    kind: &'static str,
+    engine: &'static str,
+    fingerprint: u128,
+    sql_length: usize,
+    params: usize,
+    nanos: u64,
+    slow: bool,
+}
+
+#[pymethods]
+impl BuildEvent {
+    fn __repr__(&self) -> String {
+        format!(
+            "BuildEvent(kind={:?}, engine={:?}, fingerprint={:#x}, sql_length={}, params={}, nanos={}, slow={})",
+            self.kind,
+            self.engine,
+            self.fingerprint,
+            self.sql_length,
+            self.params,
+            self.nanos,
+            if self.slow { "True" } else { "False" }
+        )
+    }
+}
+
+pub fn active() -> bool {
+    ACTIVE.load(Ordering::Relaxed)
+}
+
+/// SplitMix64 over a shared counter: cheap, and spread evenly enough to
+/// sample by.
+fn draw() -> u64 {
+    let mut z = SAMPLES
+        .fetch_add(1, Ordering::Relaxed)
+        .wrapping_add(0x9e37_79b9_7f4a_7c15);
+    z = (z ^ (z >> 30)).wrapping_mul(0xbf58_476d_1ce4_e5b9);
+    z = (z ^ (z >> 27)).wrapping_mul(0x94d0_49bb_1331_11eb);
+    z ^ (z >> 31)
+}
+
+/// Call the build hook if the build is sampled or slow.
+///
+/// Builds may run without the GIL, which is only taken when the hook is
+/// called. Errors raised by the hook are reported as unraisable rather than
+/// failing the build.
+pub fn after_build(
+    kind: &'static str,
+    engine: &'static str,
+    fingerprint: impl FnOnce() -> u128,
+    sql_length: usize,
+    params: usize,
+    nanos: u64,
+) {
+    if !active() {
+        return;
+    }
+    let Some(hook) = HOOK.read().unwrap_or_else(PoisonError::into_inner).clone() else {
+        return;
+    };
+    let slow = hook.slow_nanos.is_some_and(|slow| nanos >= slow);
+    if !slow && !hook.sample_all && draw() >= hook.sample_below {
+        return;
+    }
+    let event = BuildEvent {
+        kind,
+        engine,
+        fingerprint: fingerprint(),
+        sql_length,
+        params,
+        nanos,
+        slow,
+    };
+    Python::with_gil(|py| {
+        if let Err(err) = hook.callback.call1(py, (event,)) {
+            err.write_unraisable_bound(py, Some(hook.callback.bind(py)));
+        }
+    });
+}
+
+#[pyfunction]
+#[pyo3(signature = (callback, sample_rate=1.0, slow_threshold_ns=None))]
+pub fn set_build_hook(
+    callback: PyObject,
+    sample_rate: f64,
+    slow_threshold_ns: Option<u64>,
+) -> PyResult<()> {
+    if !(0.0..=1.0).contains(&sample_rate) {
+        return Err(PyValueError::new_err("sample_rate must be between 0 and 1"));
+    }
+    let hook = Hook {
+        callback,
+        sample_below: (sample_rate * u64::MAX as f64) as u64,
+        sample_all: sample_rate == 1.0,
+        slow_nanos: slow_threshold_ns,
+    };
+    *HOOK.write().unwrap_or_else(PoisonError::into_inner) = Some(Arc::new(hook));
+    ACTIVE.store(true, Ordering::Relaxed);
+    Ok(())
+}
+
+#[pyfunction]
+pub fn clear_build_hook() {
+    ACTIVE.store(false, Ordering::Relaxed);
+    *HOOK.write().unwrap_or_else(PoisonError::into_inner) = None;
+}
@@ -0,0 +1,64 @@
+use std::{
+    collections::HashMap,
+    sync::{OnceLock, PoisonError, RwLock},
+};
+
+use pyo3::{prelude::*, types::PyString};
+use sea_query::{Alias, DynIden, Iden, IntoIden};
+
+// Keeps a program building names on the fly from growing the table forever;
+// names past the limit are still usable, just not shared.
+const MAX_INTERNED: usize = 65_536;
+
+static INTERNED: OnceLock<RwLock<HashMap<Box<str>, DynIden>>> = OnceLock::new();
+
+/// The shared identifier for `name`, created on first use.
+pub fn intern(name: &str) -> DynIden {
+    let interned = INTERNED.get_or_init(Default::default);
+    if let Some(iden) = interned
+        .read()
+        .unwrap_or_else(PoisonError::into_inner)
+        .get(name)
+    {
+        return iden.clone();
+    }
+
+    let iden = Alias::new(name).into_iden();
+    let mut interned = interned.write().unwrap_or_else(PoisonError::into_inner);
+    if interned.len() >= MAX_INTERNED {
+        return iden;
+    }
+    interned.entry(name.into()).or_insert(iden).clone()
+}
+
+/// A table, column or alias name given from python.
+///
+/// Extracted straight from the python string, without copying it, into the
+/// interned identifier.
+#[derive(Clone)]
+pub struct Ident(DynIden);
+
+impl Ident {
+    pub fn name(&self) -> String {
+        Iden::to_string(&*self.0)
+    }
+}
+
+impl<'py> FromPyObject<'py> for Ident {
+    fn extract_bound(ob: &Bound<'py, PyAny>) -> PyResult<Self> {
+        Ok(Self(intern(ob.downcast::<PyString>()?.to_str()?)))
+    }
+}
+
+impl IntoIden for Ident {
+    fn into_iden(self) -> DynIden {
+        self.0
+    }
+}
+
+#[pyfunction]
+pub fn register_identifiers(names: Vec<String>) {
+    for name in names {
+        intern(&name);
+    }
+}
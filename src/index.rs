@@ -1,117 +1,205 @@
-use pyo3::{pyclass, pymethods, PyRefMut};
+use pyo3::{
+    pyclass, pymethods,
+    types::{PyBytes, PyTuple, PyType},
+    Bound, PyAny, PyRefMut, PyResult, Python,
+};
 use sea_query::{
     backend::{MysqlQueryBuilder, PostgresQueryBuilder, SqliteQueryBuilder},
     index::{
         Index as SeaIndex, IndexCreateStatement as SeaIndexCreateStatement,
         IndexDropStatement as SeaIndexDropStatement, IndexOrder,
     },
-    Alias,
 };
 
+use crate::iden::Ident;
+use crate::metrics::{self, Kind};
+use crate::recipe::{Recipe, ToArg};
 use crate::types::{DBEngine, IndexType, OrderBy};
 
 #[pyclass(subclass)]
 #[derive(Clone)]
-pub struct IndexCreateStatement(pub(crate) SeaIndexCreateStatement);
+pub struct IndexCreateStatement(pub(crate) SeaIndexCreateStatement, pub(crate) Recipe);
 
 #[pymethods]
 impl IndexCreateStatement {
     #[new]
     fn new() -> Self {
-        Self(SeaIndexCreateStatement::new())
+        Self(
+            SeaIndexCreateStatement::new(),
+            Recipe::new("IndexCreateStatement", || vec![]),
+        )
     }
 
     fn if_not_exists(mut slf: PyRefMut<Self>) -> PyRefMut<Self> {
+        slf.1.record("if_not_exists", || vec![]);
         slf.0.if_not_exists();
         slf
     }
 
     fn name(mut slf: PyRefMut<Self>, name: String) -> PyRefMut<Self> {
+        slf.1.record("name", || vec![name.to_arg()]);
         slf.0.name(name);
         slf
     }
 
-    fn table(mut slf: PyRefMut<Self>, name: String) -> PyRefMut<Self> {
-        slf.0.table(Alias::new(name));
+    fn table(mut slf: PyRefMut<Self>, name: Ident) -> PyRefMut<Self> {
+        slf.1.record("table", || vec![name.to_arg()]);
+        slf.0.table(name);
         slf
     }
 
     #[pyo3(signature = (name, order=None))]
-    fn column(mut slf: PyRefMut<Self>, name: String, order: Option<OrderBy>) -> PyRefMut<Self> {
+    fn column(mut slf: PyRefMut<Self>, name: Ident, order: Option<OrderBy>) -> PyRefMut<Self> {
+        slf.1
+            .record("column", || vec![name.to_arg(), order.to_arg()]);
         if let Some(order) = order {
-            slf.0
-                .col::<(Alias, IndexOrder)>((Alias::new(name), order.into()));
+            slf.0.col((name, IndexOrder::from(order)));
         } else {
-            slf.0.col(Alias::new(name));
+            slf.0.col(name);
         }
         slf
     }
 
     fn primary(mut slf: PyRefMut<Self>) -> PyRefMut<Self> {
+        slf.1.record("primary", || vec![]);
         slf.0.primary();
         slf
     }
 
     fn unique(mut slf: PyRefMut<Self>) -> PyRefMut<Self> {
+        slf.1.record("unique", || vec![]);
         slf.0.unique();
         slf
     }
 
     fn nulls_not_distinct(mut slf: PyRefMut<Self>) -> PyRefMut<Self> {
+        slf.1.record("nulls_not_distinct", || vec![]);
         slf.0.nulls_not_distinct();
         slf
     }
 
     fn full_text(mut slf: PyRefMut<Self>) -> PyRefMut<Self> {
+        slf.1.record("full_text", || vec![]);
         slf.0.full_text();
         slf
     }
 
     fn index_type(mut slf: PyRefMut<Self>, index_type: IndexType) -> PyRefMut<Self> {
+        slf.1.record("index_type", || vec![index_type.to_arg()]);
         slf.0.index_type(index_type.into());
         slf
     }
 
-    fn to_string(&self, engine: &DBEngine) -> String {
-        match engine {
-            DBEngine::Mysql => self.0.to_string(MysqlQueryBuilder),
-            DBEngine::Postgres => self.0.to_string(PostgresQueryBuilder),
-            DBEngine::Sqlite => self.0.to_string(SqliteQueryBuilder),
-        }
+    fn fingerprint(&self) -> PyResult<u128> {
+        Ok(self.1.recorded()?.fingerprint())
+    }
+
+    fn __hash__(&self) -> u64 {
+        self.1.hash()
+    }
+
+    fn __eq__(&self, other: &Self) -> bool {
+        self.1.same(&other.1)
+    }
+
+    fn to_bytes<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyBytes>> {
+        self.1.to_bytes(py)
+    }
+
+    #[classmethod]
+    fn from_bytes<'py>(cls: &Bound<'py, PyType>, data: &[u8]) -> PyResult<Bound<'py, PyAny>> {
+        Recipe::from_bytes(cls, data)
+    }
+
+    fn __reduce__<'py>(slf: &Bound<'py, Self>) -> PyResult<Bound<'py, PyTuple>> {
+        slf.borrow().1.reduce(slf.as_any())
+    }
+
+    fn to_string(&self, py: Python, engine: &DBEngine) -> String {
+        py.allow_threads(|| {
+            metrics::timed(
+                Kind::Ddl,
+                engine,
+                || self.1.fingerprint(),
+                || match engine {
+                    DBEngine::Mysql => self.0.to_string(MysqlQueryBuilder),
+                    DBEngine::Postgres => self.0.to_string(PostgresQueryBuilder),
+                    DBEngine::Sqlite => self.0.to_string(SqliteQueryBuilder),
+                },
+            )
+        })
     }
 }
 
 #[pyclass(subclass)]
-pub struct IndexDropStatement(pub(crate) SeaIndexDropStatement);
+pub struct IndexDropStatement(pub(crate) SeaIndexDropStatement, pub(crate) Recipe);
 
 #[pymethods]
 impl IndexDropStatement {
     #[new]
     fn new() -> Self {
-        Self(SeaIndexDropStatement::new())
+        Self(
+            SeaIndexDropStatement::new(),
+            Recipe::new("IndexDropStatement", || vec![]),
+        )
     }
 
     fn name(mut slf: PyRefMut<Self>, name: String) -> PyRefMut<Self> {
+        slf.1.record("name", || vec![name.to_arg()]);
         slf.0.name(name);
         slf
     }
 
-    fn table(mut slf: PyRefMut<Self>, name: String) -> PyRefMut<Self> {
-        slf.0.table(Alias::new(name));
+    fn table(mut slf: PyRefMut<Self>, name: Ident) -> PyRefMut<Self> {
+        slf.1.record("table", || vec![name.to_arg()]);
+        slf.0.table(name);
         slf
     }
 
     fn if_exists(mut slf: PyRefMut<Self>) -> PyRefMut<Self> {
+        slf.1.record("if_exists", || vec![]);
         slf.0.if_exists();
         slf
     }
 
-    fn to_string(&self, engine: &DBEngine) -> String {
-        match engine {
-            DBEngine::Mysql => self.0.to_string(MysqlQueryBuilder),
-            DBEngine::Postgres => self.0.to_string(PostgresQueryBuilder),
-            DBEngine::Sqlite => self.0.to_string(SqliteQueryBuilder),
-        }
+    fn fingerprint(&self) -> PyResult<u128> {
+        Ok(self.1.recorded()?.fingerprint())
+    }
+
+    fn __hash__(&self) -> u64 {
+        self.1.hash()
+    }
+
+    fn __eq__(&self, other: &Self) -> bool {
+        self.1.same(&other.1)
+    }
+
+    fn to_bytes<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyBytes>> {
+        self.1.to_bytes(py)
+    }
+
+    #[classmethod]
+    fn from_bytes<'py>(cls: &Bound<'py, PyType>, data: &[u8]) -> PyResult<Bound<'py, PyAny>> {
+        Recipe::from_bytes(cls, data)
+    }
+
+    fn __reduce__<'py>(slf: &Bound<'py, Self>) -> PyResult<Bound<'py, PyTuple>> {
+        slf.borrow().1.reduce(slf.as_any())
+    }
+
+    fn to_string(&self, py: Python, engine: &DBEngine) -> String {
+        py.allow_threads(|| {
+            metrics::timed(
+                Kind::Ddl,
+                engine,
+                || self.1.fingerprint(),
+                || match engine {
+                    DBEngine::Mysql => self.0.to_string(MysqlQueryBuilder),
+                    DBEngine::Postgres => self.0.to_string(PostgresQueryBuilder),
+                    DBEngine::Sqlite => self.0.to_string(SqliteQueryBuilder),
+                },
+            )
+        })
     }
 }
 
@@ -130,3 +218,15 @@ impl Index {
         IndexDropStatement::new()
     }
 }
+
+bound_statements!(schema IndexCreateStatement("IndexCreateStatement") {
+    Mysql("sea_query.mysql"): MysqlIndexCreateStatement,
+    Postgres("sea_query.postgres"): PostgresIndexCreateStatement,
+    Sqlite("sea_query.sqlite"): SqliteIndexCreateStatement,
+});
+
+bound_statements!(schema IndexDropStatement("IndexDropStatement") {
+    Mysql("sea_query.mysql"): MysqlIndexDropStatement,
+    Postgres("sea_query.postgres"): PostgresIndexDropStatement,
+    Sqlite("sea_query.sqlite"): SqliteIndexDropStatement,
+});
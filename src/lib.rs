@@ -1,12 +1,32 @@
-use pyo3::prelude::*;
+use pyo3::{
+    prelude::*,
+    types::{PyDict, PyType},
+};
 
+use crate::types::DBEngine;
+
+#[macro_use]
+mod bound;
+mod cache;
+mod copy;
 mod expr;
 mod foreign_key;
+mod hooks;
+mod iden;
 mod index;
+mod load_data;
+mod memo;
+mod metrics;
 mod query;
+mod recipe;
 mod table;
 mod types;
 
+// Only the classes used to build and render queries are created with the
+// module. Schema, COPY and LOAD DATA classes are created when the module
+// exposing them is first imported, through `_ddl_classes` and
+// `_bound_classes`, and the cache info when `sql_cache_info` first returns
+// one.
 #[pymodule]
 fn _internal(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_class::<types::OrderBy>()?;
@@ -14,31 +34,135 @@ fn _internal(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_class::<types::UnionType>()?;
     m.add_class::<types::LockType>()?;
     m.add_class::<types::LockBehavior>()?;
-    m.add_class::<types::IndexType>()?;
-    m.add_class::<types::ColumnType>()?;
     m.add_class::<types::DBEngine>()?;
+    m.add_class::<types::Param>()?;
     m.add_class::<expr::SimpleExpr>()?;
     m.add_class::<expr::Expr>()?;
     m.add_class::<expr::Condition>()?;
     m.add_class::<query::Query>()?;
     m.add_class::<query::OnConflict>()?;
+    m.add_class::<query::CompiledStatement>()?;
     m.add_class::<query::SelectStatement>()?;
     m.add_class::<query::InsertStatement>()?;
+    m.add_class::<query::InsertStream>()?;
     m.add_class::<query::UpdateStatement>()?;
     m.add_class::<query::DeleteStatement>()?;
-    m.add_class::<table::Column>()?;
-    m.add_class::<table::Table>()?;
-    m.add_class::<table::TableCreateStatement>()?;
-    m.add_class::<table::TableAlterStatement>()?;
-    m.add_class::<table::TableDropStatement>()?;
-    m.add_class::<table::TableRenameStatement>()?;
-    m.add_class::<table::TableTruncateStatement>()?;
-    m.add_class::<foreign_key::ForeignKey>()?;
-    m.add_class::<foreign_key::ForeignKeyAction>()?;
-    m.add_class::<foreign_key::ForeignKeyCreateStatement>()?;
-    m.add_class::<foreign_key::ForeignKeyDropStatement>()?;
-    m.add_class::<index::Index>()?;
-    m.add_class::<index::IndexCreateStatement>()?;
-    m.add_class::<index::IndexDropStatement>()?;
+    m.add_class::<hooks::BuildEvent>()?;
+    m.add_function(wrap_pyfunction!(query::build_many, m)?)?;
+    m.add_function(wrap_pyfunction!(iden::register_identifiers, m)?)?;
+    m.add_function(wrap_pyfunction!(recipe::restore, m)?)?;
+    m.add_function(wrap_pyfunction!(recipe::enable_recording, m)?)?;
+    m.add_function(wrap_pyfunction!(recipe::disable_recording, m)?)?;
+    m.add_function(wrap_pyfunction!(ddl_classes, m)?)?;
+    m.add_function(wrap_pyfunction!(bound_classes, m)?)?;
+    m.add_function(wrap_pyfunction!(cache::enable_sql_cache, m)?)?;
+    m.add_function(wrap_pyfunction!(cache::disable_sql_cache, m)?)?;
+    m.add_function(wrap_pyfunction!(cache::clear_sql_cache, m)?)?;
+    m.add_function(wrap_pyfunction!(cache::sql_cache_info, m)?)?;
+    m.add_function(wrap_pyfunction!(metrics::enable_metrics, m)?)?;
+    m.add_function(wrap_pyfunction!(metrics::disable_metrics, m)?)?;
+    m.add_function(wrap_pyfunction!(metrics::reset_metrics, m)?)?;
+    m.add_function(wrap_pyfunction!(metrics::metrics_snapshot, m)?)?;
+    m.add_function(wrap_pyfunction!(metrics::metrics_prometheus, m)?)?;
+    m.add_function(wrap_pyfunction!(hooks::set_build_hook, m)?)?;
+    m.add_function(wrap_pyfunction!(hooks::clear_build_hook, m)?)?;
     Ok(())
 }
+
+/// The classes building schema statements for any engine, by name.
+#[pyfunction]
+#[pyo3(name = "_ddl_classes")]
+fn ddl_classes(py: Python<'_>) -> PyResult<Bound<'_, PyDict>> {
+    by_name(
+        py,
+        [
+            py.get_type_bound::<types::ColumnType>(),
+            py.get_type_bound::<types::IndexType>(),
+            py.get_type_bound::<table::Column>(),
+            py.get_type_bound::<table::Table>(),
+            py.get_type_bound::<table::TableCreateStatement>(),
+            py.get_type_bound::<table::TableAlterStatement>(),
+            py.get_type_bound::<table::TableDropStatement>(),
+            py.get_type_bound::<table::TableRenameStatement>(),
+            py.get_type_bound::<table::TableTruncateStatement>(),
+            py.get_type_bound::<foreign_key::ForeignKey>(),
+            py.get_type_bound::<foreign_key::ForeignKeyAction>(),
+            py.get_type_bound::<foreign_key::ForeignKeyCreateStatement>(),
+            py.get_type_bound::<foreign_key::ForeignKeyDropStatement>(),
+            py.get_type_bound::<index::Index>(),
+            py.get_type_bound::<index::IndexCreateStatement>(),
+            py.get_type_bound::<index::IndexDropStatement>(),
+        ],
+    )
+}
+
+/// The statement classes bound to `engine`, by name, with the classes only
+/// that engine has.
+///
+/// Their types are only created here, when the module of an engine is first
+/// imported, rather than with the extension.
+#[pyfunction]
+#[pyo3(name = "_bound_classes")]
+fn bound_classes<'py>(py: Python<'py>, engine: &DBEngine) -> PyResult<Bound<'py, PyDict>> {
+    let classes = match engine {
+        DBEngine::Mysql => vec![
+            py.get_type_bound::<query::MysqlSelectStatement>(),
+            py.get_type_bound::<query::MysqlInsertStatement>(),
+            py.get_type_bound::<query::MysqlUpdateStatement>(),
+            py.get_type_bound::<query::MysqlDeleteStatement>(),
+            py.get_type_bound::<table::MysqlTableCreateStatement>(),
+            py.get_type_bound::<table::MysqlTableAlterStatement>(),
+            py.get_type_bound::<table::MysqlTableDropStatement>(),
+            py.get_type_bound::<table::MysqlTableRenameStatement>(),
+            py.get_type_bound::<table::MysqlTableTruncateStatement>(),
+            py.get_type_bound::<index::MysqlIndexCreateStatement>(),
+            py.get_type_bound::<index::MysqlIndexDropStatement>(),
+            py.get_type_bound::<foreign_key::MysqlForeignKeyCreateStatement>(),
+            py.get_type_bound::<foreign_key::MysqlForeignKeyDropStatement>(),
+            py.get_type_bound::<load_data::LoadDataStatement>(),
+            py.get_type_bound::<load_data::LoadDataChunks>(),
+        ],
+        DBEngine::Postgres => vec![
+            py.get_type_bound::<query::PostgresSelectStatement>(),
+            py.get_type_bound::<query::PostgresInsertStatement>(),
+            py.get_type_bound::<query::PostgresUpdateStatement>(),
+            py.get_type_bound::<query::PostgresDeleteStatement>(),
+            py.get_type_bound::<table::PostgresTableCreateStatement>(),
+            py.get_type_bound::<table::PostgresTableAlterStatement>(),
+            py.get_type_bound::<table::PostgresTableDropStatement>(),
+            py.get_type_bound::<table::PostgresTableRenameStatement>(),
+            py.get_type_bound::<table::PostgresTableTruncateStatement>(),
+            py.get_type_bound::<index::PostgresIndexCreateStatement>(),
+            py.get_type_bound::<index::PostgresIndexDropStatement>(),
+            py.get_type_bound::<foreign_key::PostgresForeignKeyCreateStatement>(),
+            py.get_type_bound::<foreign_key::PostgresForeignKeyDropStatement>(),
+            py.get_type_bound::<copy::CopyFormat>(),
+            py.get_type_bound::<copy::CopyStatement>(),
+            py.get_type_bound::<copy::CopyChunks>(),
+        ],
+        DBEngine::Sqlite => vec![
+            py.get_type_bound::<query::SqliteSelectStatement>(),
+            py.get_type_bound::<query::SqliteInsertStatement>(),
+            py.get_type_bound::<query::SqliteUpdateStatement>(),
+            py.get_type_bound::<query::SqliteDeleteStatement>(),
+            py.get_type_bound::<table::SqliteTableCreateStatement>(),
+            py.get_type_bound::<table::SqliteTableAlterStatement>(),
+            py.get_type_bound::<table::SqliteTableDropStatement>(),
+            py.get_type_bound::<table::SqliteTableRenameStatement>(),
+            py.get_type_bound::<index::SqliteIndexCreateStatement>(),
+            py.get_type_bound::<index::SqliteIndexDropStatement>(),
+        ],
+    };
+    by_name(py, classes)
+}
+
+fn by_name<'py>(
+    py: Python<'py>,
+    classes: impl IntoIterator<Item = Bound<'py, PyType>>,
+) -> PyResult<Bound<'py, PyDict>> {
+    let dict = PyDict::new_bound(py);
+    for class in classes {
+        dict.set_item(class.name()?, class)?;
+    }
+    Ok(dict)
+}
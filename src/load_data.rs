@@ -0,0 +1,333 @@
+use std::sync::Arc;
+
+use pyo3::{exceptions::PyValueError, prelude::*, types::PyBytes};
+
+use crate::copy::check_row;
+use crate::iden::Ident;
+use crate::types::PyValue;
+
+const DEFAULT_CHUNK_SIZE: usize = 64 * 1024;
+
+#[derive(Clone, Copy, PartialEq)]
+enum Duplicates {
+    Error,
+    Ignore,
+    Replace,
+}
+
+/// The layout of the rows, shared by the statement and the rows it encodes
+/// so the two always agree.
+#[derive(Clone)]
+struct Layout {
+    fields_terminated_by: String,
+    enclosed_by: Option<char>,
+}
+
+/// Rows loaded with MySQL's `LOAD DATA LOCAL INFILE`.
+#[pyclass(subclass)]
+pub struct LoadDataStatement {
+    infile: Option<String>,
+    table: Option<Ident>,
+    columns: Vec<Ident>,
+    duplicates: Duplicates,
+    layout: Layout,
+    rows: Arc<Vec<Vec<PyValue>>>,
+}
+
+impl LoadDataStatement {
+    fn push_row(&mut self, row: Vec<PyValue>) -> PyResult<()> {
+        check_row(&self.columns, &row)?;
+        if row
+            .iter()
+            .any(|value| matches!(value, PyValue::Float(v) if !v.is_finite()))
+        {
+            return Err(PyValueError::new_err(
+                "MySQL can't load NaN or infinite floats",
+            ));
+        }
+        Arc::make_mut(&mut self.rows).push(row);
+        Ok(())
+    }
+}
+
+fn quote(name: &Ident) -> String {
+    format!("`{}`", name.name().replace('`', "``"))
+}
+
+/// A MySQL string literal.
+fn literal(value: &str) -> String {
+    let mut out = String::with_capacity(value.len() + 2);
+    out.push('\'');
+    for c in value.chars() {
+        match c {
+            '\\' => out.push_str("\\\\"),
+            '\'' => out.push_str("\\'"),
+            '\n' => out.push_str("\\n"),
+            '\r' => out.push_str("\\r"),
+            '\t' => out.push_str("\\t"),
+            '\0' => out.push_str("\\0"),
+            c => out.push(c),
+        }
+    }
+    out.push('\'');
+    out
+}
+
+// Characters written escaped are read back as themselves, except for these,
+// which MySQL reads as something else after its escape character.
+fn is_reserved(c: char) -> bool {
+    c.is_ascii_alphanumeric() || c == '\\'
+}
+
+#[pymethods]
+impl LoadDataStatement {
+    #[new]
+    fn new() -> Self {
+        Self {
+            infile: None,
+            table: None,
+            columns: Vec::new(),
+            duplicates: Duplicates::Error,
+            layout: Layout {
+                fields_terminated_by: "\t".to_owned(),
+                enclosed_by: None,
+            },
+            rows: Arc::new(Vec::new()),
+        }
+    }
+
+    fn infile(mut slf: PyRefMut<Self>, path: String) -> PyRefMut<Self> {
+        slf.infile = Some(path);
+        slf
+    }
+
+    fn into(mut slf: PyRefMut<Self>, table: Ident) -> PyRefMut<Self> {
+        slf.table = Some(table);
+        slf
+    }
+
+    fn columns(mut slf: PyRefMut<Self>, columns: Vec<Ident>) -> PyRefMut<Self> {
+        slf.columns = columns;
+        slf
+    }
+
+    fn ignore(mut slf: PyRefMut<Self>) -> PyRefMut<Self> {
+        slf.duplicates = Duplicates::Ignore;
+        slf
+    }
+
+    fn replace(mut slf: PyRefMut<Self>) -> PyRefMut<Self> {
+        slf.duplicates = Duplicates::Replace;
+        slf
+    }
+
+    fn fields_terminated_by(
+        mut slf: PyRefMut<Self>,
+        separator: String,
+    ) -> PyResult<PyRefMut<Self>> {
+        if separator.is_empty() || separator.chars().any(is_reserved) {
+            return Err(PyValueError::new_err(
+                "The separator can't be empty, hold letters, digits or backslashes",
+            ));
+        }
+        slf.layout.fields_terminated_by = separator;
+        Ok(slf)
+    }
+
+    #[pyo3(signature = (quote=Some('"')))]
+    fn enclosed_by(mut slf: PyRefMut<Self>, quote: Option<char>) -> PyResult<PyRefMut<Self>> {
+        if quote.is_some_and(is_reserved) {
+            return Err(PyValueError::new_err(
+                "The quote can't be a letter, digit or backslash",
+            ));
+        }
+        slf.layout.enclosed_by = quote;
+        Ok(slf)
+    }
+
+    fn values(mut slf: PyRefMut<Self>, values: Vec<PyValue>) -> PyResult<PyRefMut<Self>> {
+        slf.push_row(values)?;
+        Ok(slf)
+    }
+
+    fn values_many(mut slf: PyRefMut<Self>, rows: Vec<Vec<PyValue>>) -> PyResult<PyRefMut<Self>> {
+        Arc::make_mut(&mut slf.rows).reserve(rows.len());
+        for row in rows {
+            slf.push_row(row)?;
+        }
+        Ok(slf)
+    }
+
+    fn __len__(&self) -> usize {
+        self.rows.len()
+    }
+
+    /// The `LOAD DATA` statement reading the rows from the infile.
+    fn to_string(&self) -> PyResult<String> {
+        let infile = self
+            .infile
+            .as_ref()
+            .ok_or_else(|| PyValueError::new_err("LOAD DATA needs an infile"))?;
+        let table = self
+            .table
+            .as_ref()
+            .ok_or_else(|| PyValueError::new_err("LOAD DATA needs a table"))?;
+        let mut sql = format!("LOAD DATA LOCAL INFILE {}", literal(infile));
+        match self.duplicates {
+            Duplicates::Error => {}
+            Duplicates::Ignore => sql.push_str(" IGNORE"),
+            Duplicates::Replace => sql.push_str(" REPLACE"),
+        }
+        sql.push_str(&format!(
+            " INTO TABLE {} CHARACTER SET utf8mb4 FIELDS TERMINATED BY {}",
+            quote(table),
+            literal(&self.layout.fields_terminated_by)
+        ));
+        if let Some(quote) = self.layout.enclosed_by {
+            sql.push_str(&format!(
+                " OPTIONALLY ENCLOSED BY {}",
+                literal(&quote.to_string())
+            ));
+        }
+        sql.push_str(" ESCAPED BY '\\\\' LINES TERMINATED BY '\\n'");
+        if !self.columns.is_empty() {
+            let columns: Vec<String> = self.columns.iter().map(quote).collect();
+            sql.push_str(&format!(" ({})", columns.join(", ")));
+        }
+        Ok(sql)
+    }
+
+    /// The whole infile at once.
+    fn payload<'py>(&self, py: Python<'py>) -> Bound<'py, PyBytes> {
+        let mut chunks = LoadDataChunks::new(self, usize::MAX);
+        let payload = py.allow_threads(|| chunks.encode_next());
+        PyBytes::new_bound(py, &payload)
+    }
+
+    /// The infile in chunks of about `size` bytes, encoded as they are read.
+    #[pyo3(signature = (size=DEFAULT_CHUNK_SIZE))]
+    fn chunks(&self, size: usize) -> PyResult<LoadDataChunks> {
+        if size == 0 {
+            return Err(PyValueError::new_err("size must be at least 1"));
+        }
+        Ok(LoadDataChunks::new(self, size))
+    }
+
+    /// Write the infile to a binary file, a chunk at a time, and return the
+    /// number of bytes written.
+    #[pyo3(signature = (file, size=DEFAULT_CHUNK_SIZE))]
+    fn write_to(&self, py: Python<'_>, file: &Bound<'_, PyAny>, size: usize) -> PyResult<usize> {
+        let mut chunks = self.chunks(size)?;
+        let mut written = 0;
+        loop {
+            let chunk = py.allow_threads(|| chunks.encode_next());
+            if chunk.is_empty() {
+                return Ok(written);
+            }
+            written += chunk.len();
+            file.call_method1("write", (PyBytes::new_bound(py, &chunk),))?;
+        }
+    }
+}
+
+#[pyclass]
+pub struct LoadDataChunks {
+    rows: Arc<Vec<Vec<PyValue>>>,
+    layout: Layout,
+    size: usize,
+    next_row: usize,
+}
+
+impl LoadDataChunks {
+    fn new(statement: &LoadDataStatement, size: usize) -> Self {
+        Self {
+            rows: Arc::clone(&statement.rows),
+            layout: statement.layout.clone(),
+            size,
+            next_row: 0,
+        }
+    }
+
+    /// Encode rows until the chunk is full.
+    fn encode_next(&mut self) -> Vec<u8> {
+        let mut out = Vec::with_capacity(self.size.min(DEFAULT_CHUNK_SIZE));
+        while self.next_row < self.rows.len() && out.len() < self.size {
+            self.write_row(&mut out, &self.rows[self.next_row]);
+            self.next_row += 1;
+        }
+        out
+    }
+
+    fn write_row(&self, out: &mut Vec<u8>, row: &[PyValue]) {
+        for (i, value) in row.iter().enumerate() {
+            if i > 0 {
+                out.extend_from_slice(self.layout.fields_terminated_by.as_bytes());
+            }
+            self.write_field(out, value);
+        }
+        out.push(b'\n');
+    }
+
+    fn write_field(&self, out: &mut Vec<u8>, value: &PyValue) {
+        let text = match value {
+            PyValue::None(_) | PyValue::Param(_) => {
+                out.extend_from_slice(b"\\N");
+                return;
+            }
+            PyValue::String(v) => {
+                self.write_string(out, v);
+                return;
+            }
+            PyValue::Bool(v) => (if *v { "1" } else { "0" }).to_owned(),
+            PyValue::Int(v) => v.to_string(),
+            PyValue::Float(v) => v.to_string(),
+            // DATETIME and TIMESTAMP columns don't keep offsets, so times
+            // are loaded in UTC.
+            PyValue::DateTimeTz(v) => v.naive_utc().format("%Y-%m-%d %H:%M:%S%.f").to_string(),
+            PyValue::DateTime(v) => v.format("%Y-%m-%d %H:%M:%S%.f").to_string(),
+            PyValue::Date(v) => v.format("%Y-%m-%d").to_string(),
+            PyValue::Time(v) => v.format("%H:%M:%S%.f").to_string(),
+        };
+        out.extend_from_slice(text.as_bytes());
+    }
+
+    fn write_string(&self, out: &mut Vec<u8>, value: &str) {
+        let Layout {
+            fields_terminated_by,
+            enclosed_by,
+        } = &self.layout;
+        if let Some(quote) = enclosed_by {
+            out.extend_from_slice(quote.encode_utf8(&mut [0; 4]).as_bytes());
+        }
+        let mut buf = [0; 4];
+        for c in value.chars() {
+            match c {
+                '\\' => out.extend_from_slice(b"\\\\"),
+                '\n' => out.extend_from_slice(b"\\n"),
+                '\r' => out.extend_from_slice(b"\\r"),
+                '\t' => out.extend_from_slice(b"\\t"),
+                '\0' => out.extend_from_slice(b"\\0"),
+                c if Some(c) == *enclosed_by || fields_terminated_by.contains(c) => {
+                    out.push(b'\\');
+                    out.extend_from_slice(c.encode_utf8(&mut buf).as_bytes());
+                }
+                c => out.extend_from_slice(c.encode_utf8(&mut buf).as_bytes()),
+            }
+        }
+        if let Some(quote) = enclosed_by {
+            out.extend_from_slice(quote.encode_utf8(&mut [0; 4]).as_bytes());
+        }
+    }
+}
+
+#[pymethods]
+impl LoadDataChunks {
+    fn __iter__(slf: PyRef<Self>) -> PyRef<Self> {
+        slf
+    }
+
+    fn __next__<'py>(&mut self, py: Python<'py>) -> Option<Bound<'py, PyBytes>> {
+        let chunk = py.allow_threads(|| self.encode_next());
+        (!chunk.is_empty()).then(|| PyBytes::new_bound(py, &chunk))
+    }
+}
@@ -0,0 +1,86 @@
+use std::sync::{Arc, Mutex, PoisonError};
+
+use pyo3::PyResult;
+
+use crate::cache::engine_id;
+use crate::recipe::Recipe;
+use crate::types::{DBEngine, PyValue};
+
+type Slot<T> = Mutex<Option<(Recipe, usize, T)>>;
+
+/// The SQL of a statement and its parameters, shared with the memo so a hit
+/// doesn't copy the parameters.
+pub type Built = Arc<(String, Vec<PyValue>)>;
+
+/// The last SQL a statement rendered for each engine.
+///
+/// Every builder method records a call in the recipe of the statement, so
+/// an output is only reused while the statement still has the recipe, and
+/// for an insert the rows, it was rendered with. Keeping the recipe alive
+/// makes sure no other recipe is later found at the same address.
+#[derive(Default)]
+pub struct Memo {
+    built: [Slot<Built>; 3],
+    strings: [Slot<String>; 3],
+}
+
+// A copy of a statement starts without outputs, they are cheap to render
+// again when used.
+impl Clone for Memo {
+    fn clone(&self) -> Self {
+        Self::default()
+    }
+}
+
+fn get_or_try_init<T: Clone>(
+    slot: &Slot<T>,
+    recipe: &Recipe,
+    rows: usize,
+    init: impl FnOnce() -> PyResult<T>,
+) -> PyResult<T> {
+    if let Some((memo_recipe, memo_rows, output)) =
+        &*slot.lock().unwrap_or_else(PoisonError::into_inner)
+    {
+        if memo_recipe.is(recipe) && *memo_rows == rows {
+            return Ok(output.clone());
+        }
+    }
+    // Rendered without the lock, so a slow statement doesn't hold up others
+    // sharing it.
+    let output = init()?;
+    *slot.lock().unwrap_or_else(PoisonError::into_inner) =
+        Some((recipe.clone(), rows, output.clone()));
+    Ok(output)
+}
+
+impl Memo {
+    pub fn built(
+        &self,
+        engine: &DBEngine,
+        recipe: &Recipe,
+        rows: usize,
+        render: impl FnOnce() -> PyResult<(String, Vec<PyValue>)>,
+    ) -> PyResult<Built> {
+        get_or_try_init(
+            &self.built[engine_id(engine) as usize],
+            recipe,
+            rows,
+            || render().map(Arc::new),
+        )
+    }
+
+    pub fn string(
+        &self,
+        engine: &DBEngine,
+        recipe: &Recipe,
+        rows: usize,
+        render: impl FnOnce() -> PyResult<String>,
+    ) -> PyResult<String> {
+        get_or_try_init(
+            &self.strings[engine_id(engine) as usize],
+            recipe,
+            rows,
+            render,
+        )
+    }
+}
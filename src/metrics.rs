@@ -0,0 +1,252 @@
+use std::{
+    fmt::Write,
+    sync::{
+        atomic::{AtomicBool, AtomicU64, Ordering},
+        Arc,
+    },
+    time::Instant,
+};
+
+use pyo3::{prelude::*, types::PyDict};
+
+use crate::cache::engine_id;
+use crate::hooks;
+use crate::types::{DBEngine, PyValue};
+
+// Counters are plain atomics, so recording a build never takes a lock. A
+// snapshot may be taken while builds are being recorded, and then be off by
+// the builds in flight.
+
+static ENABLED: AtomicBool = AtomicBool::new(false);
+
+/// Upper bounds of the latency buckets, in nanoseconds.
+const BUCKETS: [u64; 11] = [
+    1_000, 5_000, 10_000, 25_000, 50_000, 100_000, 250_000, 500_000, 1_000_000, 5_000_000,
+    10_000_000,
+];
+const ENGINES: [&str; 3] = ["mysql", "postgres", "sqlite"];
+
+#[derive(Clone, Copy)]
+pub enum Kind {
+    Select,
+    Insert,
+    Update,
+    Delete,
+    Ddl,
+}
+
+const KINDS: [&str; 5] = ["select", "insert", "update", "delete", "ddl"];
+
+const COUNTERS: [(&str, &str); 3] = [
+    ("sea_query_statements_total", "Statements built."),
+    ("sea_query_sql_bytes_total", "Bytes of SQL rendered."),
+    ("sea_query_params_total", "Parameters collected."),
+];
+
+struct Stats {
+    statements: AtomicU64,
+    bytes: AtomicU64,
+    params: AtomicU64,
+    nanos: AtomicU64,
+    // Not cumulative, the last one counts the builds above every bound.
+    buckets: [AtomicU64; BUCKETS.len() + 1],
+}
+
+impl Stats {
+    /// The counters in the order of `COUNTERS`.
+    fn counters(&self) -> [&AtomicU64; COUNTERS.len()] {
+        [&self.statements, &self.bytes, &self.params]
+    }
+}
+
+#[allow(clippy::declare_interior_mutable_const)]
+const ZERO: AtomicU64 = AtomicU64::new(0);
+#[allow(clippy::declare_interior_mutable_const)]
+const EMPTY: Stats = Stats {
+    statements: ZERO,
+    bytes: ZERO,
+    params: ZERO,
+    nanos: ZERO,
+    buckets: [ZERO; BUCKETS.len() + 1],
+};
+
+#[allow(clippy::declare_interior_mutable_const)]
+const EMPTY_KIND: [Stats; ENGINES.len()] = [EMPTY; ENGINES.len()];
+
+static STATS: [[Stats; ENGINES.len()]; KINDS.len()] = [EMPTY_KIND; KINDS.len()];
+
+/// A build output the metrics can measure.
+pub trait Rendered {
+    /// The size of the SQL and the number of parameters, if built.
+    fn measure(&self) -> Option<(usize, usize)>;
+}
+
+impl Rendered for String {
+    fn measure(&self) -> Option<(usize, usize)> {
+        Some((self.len(), 0))
+    }
+}
+
+impl Rendered for (String, Vec<PyValue>) {
+    fn measure(&self) -> Option<(usize, usize)> {
+        Some((self.0.len(), self.1.len()))
+    }
+}
+
+impl<T: Rendered> Rendered for Arc<T> {
+    fn measure(&self) -> Option<(usize, usize)> {
+        (**self).measure()
+    }
+}
+
+impl<T: Rendered> Rendered for PyResult<T> {
+    fn measure(&self) -> Option<(usize, usize)> {
+        self.as_ref().ok().and_then(Rendered::measure)
+    }
+}
+
+/// Run `build`, recording its output and how long it took for the metrics
+/// and the build hook, when either is on.
+///
+/// `fingerprint` is only called when the hook is.
+pub fn timed<T: Rendered>(
+    kind: Kind,
+    engine: &DBEngine,
+    fingerprint: impl FnOnce() -> u128,
+    build: impl FnOnce() -> T,
+) -> T {
+    let enabled = ENABLED.load(Ordering::Relaxed);
+    if !enabled && !hooks::active() {
+        return build();
+    }
+    let start = Instant::now();
+    let output = build();
+    let nanos = start.elapsed().as_nanos().min(u64::MAX as u128) as u64;
+    let Some((bytes, params)) = output.measure() else {
+        return output;
+    };
+    let engine = engine_id(engine) as usize;
+    if enabled {
+        let stats = &STATS[kind as usize][engine];
+        stats.statements.fetch_add(1, Ordering::Relaxed);
+        stats.bytes.fetch_add(bytes as u64, Ordering::Relaxed);
+        stats.params.fetch_add(params as u64, Ordering::Relaxed);
+        stats.nanos.fetch_add(nanos, Ordering::Relaxed);
+        let bucket = BUCKETS.partition_point(|&bound| bound < nanos);
+        stats.buckets[bucket].fetch_add(1, Ordering::Relaxed);
+    }
+    hooks::after_build(
+        KINDS[kind as usize],
+        ENGINES[engine],
+        fingerprint,
+        bytes,
+        params,
+        nanos,
+    );
+    output
+}
+
+fn seconds(nanos: u64) -> f64 {
+    nanos as f64 / 1e9
+}
+
+/// The statistics of every kind and engine that built anything.
+fn recorded() -> impl Iterator<Item = (&'static str, &'static str, &'static Stats)> {
+    KINDS.iter().zip(&STATS).flat_map(|(kind, stats)| {
+        ENGINES
+            .iter()
+            .zip(stats)
+            .filter(|(_, stats)| stats.statements.load(Ordering::Relaxed) > 0)
+            .map(move |(engine, stats)| (*kind, *engine, stats))
+    })
+}
+
+#[pyfunction]
+pub fn enable_metrics() {
+    ENABLED.store(true, Ordering::Relaxed);
+}
+
+#[pyfunction]
+pub fn disable_metrics() {
+    ENABLED.store(false, Ordering::Relaxed);
+}
+
+#[pyfunction]
+pub fn reset_metrics() {
+    for stats in STATS.iter().flatten() {
+        for counter in stats
+            .counters()
+            .into_iter()
+            .chain([&stats.nanos])
+            .chain(&stats.buckets)
+        {
+            counter.store(0, Ordering::Relaxed);
+        }
+    }
+}
+
+/// The metrics as nested dicts, by kind of statement then engine.
+#[pyfunction]
+pub fn metrics_snapshot(py: Python<'_>) -> PyResult<Bound<'_, PyDict>> {
+    let snapshot = PyDict::new_bound(py);
+    for (kind, engine, stats) in recorded() {
+        let buckets = PyDict::new_bound(py);
+        let mut count = 0;
+        for (bound, bucket) in BUCKETS.iter().zip(&stats.buckets) {
+            count += bucket.load(Ordering::Relaxed);
+            buckets.set_item(seconds(*bound), count)?;
+        }
+        count += stats.buckets[BUCKETS.len()].load(Ordering::Relaxed);
+        buckets.set_item(f64::INFINITY, count)?;
+
+        let engines = match snapshot.get_item(kind)? {
+            Some(engines) => engines.downcast_into::<PyDict>()?,
+            None => {
+                let engines = PyDict::new_bound(py);
+                snapshot.set_item(kind, &engines)?;
+                engines
+            }
+        };
+        let entry = PyDict::new_bound(py);
+        entry.set_item("statements", stats.statements.load(Ordering::Relaxed))?;
+        entry.set_item("bytes", stats.bytes.load(Ordering::Relaxed))?;
+        entry.set_item("params", stats.params.load(Ordering::Relaxed))?;
+        entry.set_item("seconds", seconds(stats.nanos.load(Ordering::Relaxed)))?;
+        entry.set_item("buckets", buckets)?;
+        engines.set_item(engine, entry)?;
+    }
+    Ok(snapshot)
+}
+
+/// The metrics in the Prometheus text exposition format.
+#[pyfunction]
+pub fn metrics_prometheus() -> String {
+    let mut out = String::new();
+    for (i, (name, help)) in COUNTERS.iter().enumerate() {
+        let _ = writeln!(out, "# HELP {name} {help}");
+        let _ = writeln!(out, "# TYPE {name} counter");
+        for (kind, engine, stats) in recorded() {
+            let value = stats.counters()[i].load(Ordering::Relaxed);
+            let _ = writeln!(out, "{name}{{kind=\"{kind}\",engine=\"{engine}\"}} {value}");
+        }
+    }
+
+    let name = "sea_query_build_seconds";
+    let _ = writeln!(out, "# HELP {name} Time spent building statements.");
+    let _ = writeln!(out, "# TYPE {name} histogram");
+    for (kind, engine, stats) in recorded() {
+        let labels = format!("kind=\"{kind}\",engine=\"{engine}\"");
+        let mut count = 0;
+        for (bound, bucket) in BUCKETS.iter().zip(&stats.buckets) {
+            count += bucket.load(Ordering::Relaxed);
+            let le = seconds(*bound);
+            let _ = writeln!(out, "{name}_bucket{{{labels},le=\"{le}\"}} {count}");
+        }
+        count += stats.buckets[BUCKETS.len()].load(Ordering::Relaxed);
+        let sum = seconds(stats.nanos.load(Ordering::Relaxed));
+        let _ = writeln!(out, "{name}_bucket{{{labels},le=\"+Inf\"}} {count}");
+        let _ = writeln!(out, "{name}_sum{{{labels}}} {sum}");
+        let _ = writeln!(out, "{name}_count{{{labels}}} {count}");
+    }
+    out
+}
@@ -1,17 +1,186 @@
-use pyo3::prelude::*;
+use std::{
+    borrow::Cow,
+    collections::HashMap,
+    ops::Range,
+    sync::{Arc, OnceLock},
+};
+
+use pyo3::{
+    exceptions::{PyKeyError, PyValueError},
+    prelude::*,
+    types::{PyBytes, PyDict, PyIterator, PyList, PyMapping, PyString, PyTuple, PyType},
+};
 use sea_query::{
     backend::{MysqlQueryBuilder, PostgresQueryBuilder, SqliteQueryBuilder},
     expr::SimpleExpr as SeaSimpleExpr,
     query::{
         DeleteStatement as SeaDeleteStatement, InsertStatement as SeaInsertStatement,
-        OnConflict as SeaOnConflict, Returning, SelectStatement as SeaSelectStatement,
-        UpdateStatement as SeaUpdateStatement,
+        OnConflict as SeaOnConflict, QueryStatementBuilder, QueryStatementWriter, Returning,
+        SelectStatement as SeaSelectStatement, UpdateStatement as SeaUpdateStatement,
     },
-    Alias, Asterisk,
+    value::Value,
+    Alias, Asterisk, Func,
 };
 
+use crate::cache::{self, Shape};
 use crate::expr::{Condition, ConditionExpression, IntoSimpleExpr, SimpleExpr};
-use crate::types::{DBEngine, LockBehavior, LockType, NullsOrder, OrderBy, PyValue, UnionType};
+use crate::iden::Ident;
+use crate::memo::{Built, Memo};
+use crate::metrics::{self, Kind};
+use crate::recipe::{Arg, Recipe, ToArg};
+use crate::types::{
+    ColumnType, DBEngine, LockBehavior, LockType, NullsOrder, OrderBy, Param, PyValue, UnionType,
+};
+
+// Rendering only touches rust data, so callers run these without the GIL.
+fn render<'a, S: QueryStatementBuilder + Clone + 'a>(
+    engine: &DBEngine,
+    shape: impl FnOnce() -> Option<Shape>,
+    statement: impl FnOnce() -> PyResult<Cow<'a, S>>,
+) -> PyResult<(String, Vec<PyValue>)> {
+    cache::render(engine, shape, 0, || {
+        Ok(statement()?.build_any(engine.query_builder()))
+    })
+}
+
+/// The shape of a statement built by `recipe`, for the SQL cache, unless it
+/// was built while recording was off.
+fn shape(recipe: &Recipe) -> Option<Shape> {
+    if !recipe.is_recorded() {
+        return None;
+    }
+    let mut values = Vec::new();
+    recipe.values(&mut values);
+    Some(Shape {
+        fingerprint: recipe.fingerprint(),
+        values,
+    })
+}
+
+fn render_string<S: QueryStatementWriter>(statement: &S, engine: &DBEngine) -> String {
+    match engine {
+        DBEngine::Mysql => statement.to_string(MysqlQueryBuilder),
+        DBEngine::Postgres => statement.to_string(PostgresQueryBuilder),
+        DBEngine::Sqlite => statement.to_string(SqliteQueryBuilder),
+    }
+}
+
+/// Fail on the first placeholder among `values`, which only `build` can
+/// fill in.
+fn check_bound(values: &[PyValue]) -> PyResult<()> {
+    match values.iter().find_map(|value| match value {
+        PyValue::Param(param) => Some(param),
+        _ => None,
+    }) {
+        Some(param) => Err(PyValueError::new_err(format!(
+            "Parameter '{}' has no value, build the statement to bind it",
+            param.0
+        ))),
+        None => Ok(()),
+    }
+}
+
+/// Fail on the first placeholder among the values `to_string` inlines, found
+/// in the shape of the statement or else in a render of it.
+fn check_inlined<S: QueryStatementBuilder>(
+    shape: Option<Shape>,
+    statement: &S,
+    engine: &DBEngine,
+) -> PyResult<()> {
+    match shape {
+        Some(shape) => check_bound(&shape.values),
+        None => {
+            let (_, values) = statement.build_any(engine.query_builder());
+            check_bound(&values.0.into_iter().map(PyValue::from).collect::<Vec<_>>())
+        }
+    }
+}
+
+/// Replace every placeholder in `values` with its value from `params`.
+fn bind_param(param: &Param, params: Option<&Bound<'_, PyDict>>) -> PyResult<PyValue> {
+    match params.map(|p| p.get_item(&param.0)).transpose()?.flatten() {
+        Some(value) => value.extract(),
+        None => Err(PyKeyError::new_err(format!(
+            "Missing value for parameter '{}'",
+            param.0
+        ))),
+    }
+}
+
+fn bind_params(values: Vec<PyValue>, params: Option<&Bound<'_, PyDict>>) -> PyResult<Vec<PyValue>> {
+    values
+        .into_iter()
+        .map(|value| match value {
+            PyValue::Param(param) => bind_param(&param, params),
+            value => Ok(value),
+        })
+        .collect()
+}
+
+/// The objects passed for `values`, without taking them, the placeholders
+/// filled in from `params`.
+fn bind_objects(
+    py: Python,
+    values: &[PyValue],
+    params: Option<&Bound<'_, PyDict>>,
+) -> PyResult<Vec<PyObject>> {
+    values
+        .iter()
+        .map(|value| match value {
+            PyValue::Param(param) => Ok(bind_param(param, params)?.into_py(py)),
+            value => Ok(value.to_object(py)),
+        })
+        .collect()
+}
+
+/// The objects passed for rows built from `originals`, followed by those
+/// for `values`.
+fn bind_rows(
+    py: Python,
+    originals: &[PyObject],
+    values: &[PyValue],
+    params: Option<&Bound<'_, PyDict>>,
+) -> PyResult<Vec<PyObject>> {
+    let mut objects = Vec::with_capacity(originals.len() + values.len());
+    for original in originals {
+        objects.push(match original.downcast_bound::<Param>(py) {
+            Ok(param) => bind_param(param.get(), params)?.into_py(py),
+            Err(_) => original.clone_ref(py),
+        });
+    }
+    objects.extend(bind_objects(py, values, params)?);
+    Ok(objects)
+}
+
+/// One tuple of parameters per dict of `rows`, filling the placeholders
+/// among `values` by name.
+fn param_rows<'py>(
+    py: Python<'py>,
+    values: &[PyValue],
+    rows: &[Bound<'py, PyDict>],
+) -> PyResult<Vec<Bound<'py, PyTuple>>> {
+    // Values other than placeholders are the same in every row, so they are
+    // converted once.
+    let slots: Vec<Result<PyObject, &Param>> = values
+        .iter()
+        .map(|value| match value {
+            PyValue::Param(param) => Err(param),
+            value => Ok(value.clone().into_py(py)),
+        })
+        .collect();
+    rows.iter()
+        .map(|row| -> PyResult<Bound<'py, PyTuple>> {
+            let objects = slots
+                .iter()
+                .map(|slot| match slot {
+                    Ok(object) => Ok(object.clone_ref(py)),
+                    Err(param) => bind_param(param, Some(row)).map(|value| value.into_py(py)),
+                })
+                .collect::<PyResult<Vec<_>>>()?;
+            Ok(PyTuple::new_bound(py, objects))
+        })
+        .collect()
+}
 
 #[pyclass]
 pub struct Query;
@@ -39,68 +208,245 @@ impl Query {
     }
 }
 
+#[pyclass(frozen)]
+pub struct CompiledStatement {
+    sql: Py<PyString>,
+    values: Vec<PyValue>,
+}
+
+impl CompiledStatement {
+    fn new(py: Python, sql: &str, values: Vec<PyValue>) -> Self {
+        Self {
+            sql: PyString::new_bound(py, sql).unbind(),
+            values,
+        }
+    }
+
+    fn positional(&self, values: Vec<PyValue>) -> PyResult<Vec<PyValue>> {
+        if values.len() != self.values.len() {
+            return Err(PyValueError::new_err(format!(
+                "Expected {} parameters, got {}",
+                self.values.len(),
+                values.len()
+            )));
+        }
+        Ok(values)
+    }
+}
+
+#[pymethods]
+impl CompiledStatement {
+    #[getter]
+    fn sql(&self, py: Python) -> Py<PyString> {
+        self.sql.clone_ref(py)
+    }
+
+    #[getter]
+    fn params(&self) -> Vec<PyValue> {
+        self.values.clone()
+    }
+
+    #[pyo3(signature = (values=None, **params))]
+    fn bind<'py>(
+        &self,
+        py: Python<'py>,
+        values: Option<&Bound<'py, PyAny>>,
+        params: Option<&Bound<'py, PyDict>>,
+    ) -> PyResult<(Py<PyString>, Vec<PyValue>)> {
+        let (values, params) = match values {
+            Some(values) => match values.downcast::<PyDict>() {
+                Ok(named) => (self.values.clone(), Some(named)),
+                Err(_) => (self.positional(values.extract()?)?, params),
+            },
+            None => (self.values.clone(), params),
+        };
+        Ok((self.sql.clone_ref(py), bind_params(values, params)?))
+    }
+}
+
 #[pyclass]
 #[derive(Clone)]
-pub struct OnConflict(pub SeaOnConflict);
+pub struct OnConflict(pub SeaOnConflict, pub(crate) Recipe);
 
 #[pymethods]
 impl OnConflict {
     #[staticmethod]
-    fn column(name: String) -> Self {
-        Self(SeaOnConflict::column(Alias::new(name)))
+    fn column(name: Ident) -> Self {
+        let recipe = Recipe::constructor("OnConflict", "column", || vec![name.to_arg()]);
+        Self(SeaOnConflict::column(name), recipe)
     }
 
     #[staticmethod]
-    fn columns(columns: Vec<String>) -> Self {
-        Self(SeaOnConflict::columns(
-            columns.iter().map(Alias::new).collect::<Vec<Alias>>(),
-        ))
+    fn columns(columns: Vec<Ident>) -> Self {
+        let recipe = Recipe::constructor("OnConflict", "columns", || vec![columns.to_arg()]);
+        Self(SeaOnConflict::columns(columns), recipe)
     }
 
     fn do_nothing(mut slf: PyRefMut<Self>) -> PyRefMut<Self> {
+        slf.1.record("do_nothing", || vec![]);
         slf.0.do_nothing();
         slf
     }
 
+    fn to_bytes<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyBytes>> {
+        self.1.to_bytes(py)
+    }
+
+    #[classmethod]
+    fn from_bytes<'py>(cls: &Bound<'py, PyType>, data: &[u8]) -> PyResult<Bound<'py, PyAny>> {
+        Recipe::from_bytes(cls, data)
+    }
+
+    fn __reduce__<'py>(slf: &Bound<'py, Self>) -> PyResult<Bound<'py, PyTuple>> {
+        slf.borrow().1.reduce(slf.as_any())
+    }
+
     // TODO: Implement missing methods
 }
 
+/// A select statement shared by the statements it is composed into, and only
+/// copied when changed while shared.
+pub(crate) struct Select {
+    statement: SeaSelectStatement,
+    // Clauses holding other statements, applied in order when built. Later
+    // FROM tables are kept here too so the order of the FROM list holds.
+    pending: Vec<Pending>,
+    // The statement with its pending clauses applied, kept until it changes
+    // so composing it again does not copy its subqueries again.
+    resolved: OnceLock<SeaSelectStatement>,
+}
+
+impl Clone for Select {
+    fn clone(&self) -> Self {
+        // Copies are only made to be changed, which drops the resolved
+        // statement anyway.
+        Self {
+            statement: self.statement.clone(),
+            pending: self.pending.clone(),
+            resolved: OnceLock::new(),
+        }
+    }
+}
+
+#[derive(Clone)]
+enum Pending {
+    From(Ident),
+    FromSubquery(Arc<Select>, Ident),
+    Union(UnionType, Arc<Select>),
+}
+
+impl Select {
+    pub(crate) fn statement(&self) -> &SeaSelectStatement {
+        if self.pending.is_empty() {
+            return &self.statement;
+        }
+        self.resolved.get_or_init(|| {
+            let mut statement = self.statement.clone();
+            for pending in &self.pending {
+                match pending {
+                    Pending::From(name) => {
+                        statement.from(name.clone());
+                    }
+                    Pending::FromSubquery(select, alias) => {
+                        statement.from_subquery(select.statement().clone(), alias.clone());
+                    }
+                    Pending::Union(union_type, select) => {
+                        statement.union(union_type.clone().into(), select.statement().clone());
+                    }
+                }
+            }
+            statement
+        })
+    }
+}
+
 #[pyclass(subclass)]
 #[derive(Clone)]
-pub struct SelectStatement(pub SeaSelectStatement);
+pub struct SelectStatement(pub(crate) Arc<Select>, pub(crate) Recipe, Memo);
+
+impl SelectStatement {
+    fn render(&self, engine: &DBEngine) -> PyResult<Built> {
+        metrics::timed(
+            Kind::Select,
+            engine,
+            || self.1.fingerprint(),
+            || {
+                self.2.built(engine, &self.1, 0, || {
+                    render(
+                        engine,
+                        || shape(&self.1),
+                        || Ok(Cow::Borrowed(self.0.statement())),
+                    )
+                })
+            },
+        )
+    }
+
+    fn select(&mut self) -> &mut Select {
+        let select = Arc::make_mut(&mut self.0);
+        // The statement is about to change, so its resolved form goes.
+        select.resolved.take();
+        select
+    }
+
+    fn statement(&mut self) -> &mut SeaSelectStatement {
+        &mut self.select().statement
+    }
+}
 
 #[pymethods]
 impl SelectStatement {
     #[new]
     fn new() -> Self {
-        Self(SeaSelectStatement::new())
-    }
-
-    fn from_table(mut slf: PyRefMut<Self>, name: String) -> PyRefMut<Self> {
-        slf.0.from(Alias::new(name));
+        Self(
+            Arc::new(Select {
+                statement: SeaSelectStatement::new(),
+                pending: Vec::new(),
+                resolved: OnceLock::new(),
+            }),
+            Recipe::new("SelectStatement", || vec![]),
+            Memo::default(),
+        )
+    }
+
+    fn from_table(mut slf: PyRefMut<Self>, name: Ident) -> PyRefMut<Self> {
+        slf.1.record("from_table", || vec![name.to_arg()]);
+        let select = slf.select();
+        if select.pending.is_empty() {
+            select.statement.from(name);
+        } else {
+            select.pending.push(Pending::From(name));
+        }
         slf
     }
 
     fn from_subquery(
         mut slf: PyRefMut<Self>,
         subquery: SelectStatement,
-        alias: String,
+        alias: Ident,
     ) -> PyRefMut<Self> {
-        slf.0.from_subquery(subquery.0, Alias::new(alias));
+        slf.1
+            .record("from_subquery", || vec![subquery.to_arg(), alias.to_arg()]);
+        slf.select()
+            .pending
+            .push(Pending::FromSubquery(subquery.0, alias));
         slf
     }
 
     fn all(mut slf: PyRefMut<Self>) -> PyRefMut<Self> {
-        slf.0.column(Asterisk);
+        slf.1.record("all", || vec![]);
+        slf.statement().column(Asterisk);
         slf
     }
 
     #[pyo3(signature = (name, table=None))]
-    fn column(mut slf: PyRefMut<Self>, name: String, table: Option<String>) -> PyRefMut<Self> {
+    fn column(mut slf: PyRefMut<Self>, name: Ident, table: Option<Ident>) -> PyRefMut<Self> {
+        slf.1
+            .record("column", || vec![name.to_arg(), table.to_arg()]);
         if let Some(table) = table {
-            slf.0.column((Alias::new(table), Alias::new(name)));
+            slf.statement().column((table, name));
         } else {
-            slf.0.column(Alias::new(name));
+            slf.statement().column(name);
         }
         slf
     }
@@ -108,137 +454,165 @@ impl SelectStatement {
     #[pyo3(signature = (columns, table=None))]
     fn columns(
         mut slf: PyRefMut<Self>,
-        columns: Vec<String>,
-        table: Option<String>,
+        columns: Vec<Ident>,
+        table: Option<Ident>,
     ) -> PyRefMut<Self> {
+        slf.1
+            .record("columns", || vec![columns.to_arg(), table.to_arg()]);
         if let Some(table) = table {
-            let table = Alias::new(table);
-            slf.0.columns(
-                columns
-                    .iter()
-                    .map(|c| (table.clone(), Alias::new(c)))
-                    .collect::<Vec<(Alias, Alias)>>(),
-            );
+            slf.statement()
+                .columns(columns.into_iter().map(|c| (table.clone(), c)));
         } else {
-            slf.0
-                .columns(columns.iter().map(Alias::new).collect::<Vec<Alias>>());
+            slf.statement().columns(columns);
         }
         slf
     }
 
     fn expr(mut slf: PyRefMut<Self>, expr: SimpleExpr) -> PyRefMut<Self> {
-        slf.0.expr(expr.0);
+        slf.1.record("expr", || vec![expr.to_arg()]);
+        slf.statement().expr(SeaSimpleExpr::from(expr));
         slf
     }
 
-    fn expr_as(mut slf: PyRefMut<Self>, expr: IntoSimpleExpr, alias: String) -> PyRefMut<Self> {
-        slf.0.expr_as(expr, Alias::new(alias));
+    fn expr_as(mut slf: PyRefMut<Self>, expr: IntoSimpleExpr, alias: Ident) -> PyRefMut<Self> {
+        slf.1
+            .record("expr_as", || vec![expr.to_arg(), alias.to_arg()]);
+        slf.statement().expr_as(expr, alias);
         slf
     }
 
     fn distinct(mut slf: PyRefMut<Self>) -> PyRefMut<Self> {
-        slf.0.distinct();
+        slf.1.record("distinct", || vec![]);
+        slf.statement().distinct();
         slf
     }
 
     fn and_where(mut slf: PyRefMut<Self>, expr: SimpleExpr) -> PyRefMut<Self> {
-        slf.0.and_where(expr.0);
+        slf.1.record("and_where", || vec![expr.to_arg()]);
+        slf.statement().and_where(expr.into());
         slf
     }
 
     fn cond_where(mut slf: PyRefMut<Self>, cond: Condition) -> PyRefMut<Self> {
-        slf.0.cond_where(cond.0);
+        slf.1.record("cond_where", || vec![cond.to_arg()]);
+        slf.statement().cond_where(cond);
         slf
     }
 
     #[pyo3(signature = (column, table=None))]
-    fn group_by(mut slf: PyRefMut<Self>, column: String, table: Option<String>) -> PyRefMut<Self> {
+    fn group_by(mut slf: PyRefMut<Self>, column: Ident, table: Option<Ident>) -> PyRefMut<Self> {
+        slf.1
+            .record("group_by", || vec![column.to_arg(), table.to_arg()]);
         if let Some(table) = table {
-            slf.0.group_by_col((Alias::new(table), Alias::new(column)));
+            slf.statement().group_by_col((table, column));
         } else {
-            slf.0.group_by_col(Alias::new(column));
+            slf.statement().group_by_col(column);
         }
         slf
     }
 
     fn and_having(mut slf: PyRefMut<Self>, expr: SimpleExpr) -> PyRefMut<Self> {
-        slf.0.and_having(expr.0);
+        slf.1.record("and_having", || vec![expr.to_arg()]);
+        slf.statement().and_having(expr.into());
         slf
     }
 
     fn cond_having(mut slf: PyRefMut<Self>, cond: Condition) -> PyRefMut<Self> {
-        slf.0.cond_having(cond.0);
+        slf.1.record("cond_having", || vec![cond.to_arg()]);
+        slf.statement().cond_having(cond);
         slf
     }
 
-    fn order_by(mut slf: PyRefMut<Self>, column: String, order: OrderBy) -> PyRefMut<Self> {
-        slf.0.order_by(Alias::new(column), order.into());
+    fn order_by(mut slf: PyRefMut<Self>, column: Ident, order: OrderBy) -> PyRefMut<Self> {
+        slf.1
+            .record("order_by", || vec![column.to_arg(), order.to_arg()]);
+        slf.statement().order_by(column, order.into());
         slf
     }
 
     fn order_by_with_nulls(
         mut slf: PyRefMut<Self>,
-        column: String,
+        column: Ident,
         order: OrderBy,
         nulls: NullsOrder,
     ) -> PyRefMut<Self> {
-        slf.0
-            .order_by_with_nulls(Alias::new(column), order.into(), nulls.into());
+        slf.1.record("order_by_with_nulls", || {
+            vec![column.to_arg(), order.to_arg(), nulls.to_arg()]
+        });
+        slf.statement()
+            .order_by_with_nulls(column, order.into(), nulls.into());
         slf
     }
 
     fn limit(mut slf: PyRefMut<Self>, limit: u64) -> PyRefMut<Self> {
-        slf.0.limit(limit);
+        // Rendered as a parameter, so recorded as a value like it.
+        slf.1
+            .record("limit", || vec![PyValue::Int(limit as i64).to_arg()]);
+        slf.statement().limit(limit);
         slf
     }
 
     fn offset(mut slf: PyRefMut<Self>, offset: u64) -> PyRefMut<Self> {
-        slf.0.offset(offset);
+        // Rendered as a parameter, so recorded as a value like it.
+        slf.1
+            .record("offset", || vec![PyValue::Int(offset as i64).to_arg()]);
+        slf.statement().offset(offset);
         slf
     }
 
     fn cross_join(
         mut slf: PyRefMut<Self>,
-        table: String,
+        table: Ident,
         condition: ConditionExpression,
     ) -> PyRefMut<Self> {
-        slf.0.cross_join(Alias::new(table), condition);
+        slf.1
+            .record("cross_join", || vec![table.to_arg(), condition.to_arg()]);
+        slf.statement().cross_join(table, condition);
         slf
     }
 
     fn left_join(
         mut slf: PyRefMut<Self>,
-        table: String,
+        table: Ident,
         condition: ConditionExpression,
     ) -> PyRefMut<Self> {
-        slf.0.left_join(Alias::new(table), condition);
+        slf.1
+            .record("left_join", || vec![table.to_arg(), condition.to_arg()]);
+        slf.statement().left_join(table, condition);
         slf
     }
 
     fn right_join(
         mut slf: PyRefMut<Self>,
-        table: String,
+        table: Ident,
         condition: ConditionExpression,
     ) -> PyRefMut<Self> {
-        slf.0.right_join(Alias::new(table), condition);
+        slf.1
+            .record("right_join", || vec![table.to_arg(), condition.to_arg()]);
+        slf.statement().right_join(table, condition);
         slf
     }
 
     fn inner_join(
         mut slf: PyRefMut<Self>,
-        table: String,
+        table: Ident,
         condition: ConditionExpression,
     ) -> PyRefMut<Self> {
-        slf.0.inner_join(Alias::new(table), condition);
+        slf.1
+            .record("inner_join", || vec![table.to_arg(), condition.to_arg()]);
+        slf.statement().inner_join(table, condition);
         slf
     }
 
     fn full_outer_join(
         mut slf: PyRefMut<Self>,
-        table: String,
+        table: Ident,
         condition: ConditionExpression,
     ) -> PyRefMut<Self> {
-        slf.0.full_outer_join(Alias::new(table), condition);
+        slf.1.record("full_outer_join", || {
+            vec![table.to_arg(), condition.to_arg()]
+        });
+        slf.statement().full_outer_join(table, condition);
         slf
     }
 
@@ -247,24 +621,29 @@ impl SelectStatement {
         query: SelectStatement,
         union_type: UnionType,
     ) -> PyRefMut<Self> {
-        slf.0.union(union_type.into(), query.0);
+        slf.1
+            .record("union", || vec![query.to_arg(), union_type.to_arg()]);
+        slf.select()
+            .pending
+            .push(Pending::Union(union_type, query.0));
         slf
     }
 
     fn lock(mut slf: PyRefMut<Self>, lock_type: LockType) -> PyRefMut<Self> {
-        slf.0.lock(lock_type.into());
+        slf.1.record("lock", || vec![lock_type.to_arg()]);
+        slf.statement().lock(lock_type.into());
         slf
     }
 
     fn lock_with_tables(
         mut slf: PyRefMut<Self>,
         lock_type: LockType,
-        tables: Vec<String>,
+        tables: Vec<Ident>,
     ) -> PyRefMut<Self> {
-        slf.0.lock_with_tables(
-            lock_type.into(),
-            tables.iter().map(Alias::new).collect::<Vec<Alias>>(),
-        );
+        slf.1.record("lock_with_tables", || {
+            vec![lock_type.to_arg(), tables.to_arg()]
+        });
+        slf.statement().lock_with_tables(lock_type.into(), tables);
         slf
     }
 
@@ -273,238 +652,1191 @@ impl SelectStatement {
         lock_type: LockType,
         behavior: LockBehavior,
     ) -> PyRefMut<Self> {
-        slf.0.lock_with_behavior(lock_type.into(), behavior.into());
+        slf.1.record("lock_with_behavior", || {
+            vec![lock_type.to_arg(), behavior.to_arg()]
+        });
+        slf.statement()
+            .lock_with_behavior(lock_type.into(), behavior.into());
         slf
     }
 
     fn lock_with_tables_behavior(
         mut slf: PyRefMut<Self>,
         lock_type: LockType,
-        tables: Vec<String>,
+        tables: Vec<Ident>,
         behavior: LockBehavior,
     ) -> PyRefMut<Self> {
-        slf.0.lock_with_tables_behavior(
-            lock_type.into(),
-            tables.iter().map(Alias::new).collect::<Vec<Alias>>(),
-            behavior.into(),
-        );
+        slf.1.record("lock_with_tables_behavior", || {
+            vec![lock_type.to_arg(), tables.to_arg(), behavior.to_arg()]
+        });
+        slf.statement()
+            .lock_with_tables_behavior(lock_type.into(), tables, behavior.into());
         slf
     }
 
     fn lock_shared(mut slf: PyRefMut<Self>) -> PyRefMut<Self> {
-        slf.0.lock_shared();
+        slf.1.record("lock_shared", || vec![]);
+        slf.statement().lock_shared();
         slf
     }
 
     fn lock_exclusive(mut slf: PyRefMut<Self>) -> PyRefMut<Self> {
-        slf.0.lock_exclusive();
+        slf.1.record("lock_exclusive", || vec![]);
+        slf.statement().lock_exclusive();
         slf
     }
 
-    fn to_string(&self, engine: &DBEngine) -> String {
-        match engine {
-            DBEngine::Mysql => self.0.to_string(MysqlQueryBuilder),
-            DBEngine::Postgres => self.0.to_string(PostgresQueryBuilder),
-            DBEngine::Sqlite => self.0.to_string(SqliteQueryBuilder),
-        }
+    fn fingerprint(&self) -> PyResult<u128> {
+        Ok(self.1.recorded()?.fingerprint())
+    }
+
+    fn __hash__(&self) -> u64 {
+        self.1.hash()
+    }
+
+    fn __eq__(&self, other: &Self) -> bool {
+        self.1.same(&other.1)
+    }
+
+    fn to_bytes<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyBytes>> {
+        self.1.to_bytes(py)
+    }
+
+    #[classmethod]
+    fn from_bytes<'py>(cls: &Bound<'py, PyType>, data: &[u8]) -> PyResult<Bound<'py, PyAny>> {
+        Recipe::from_bytes(cls, data)
+    }
+
+    fn __reduce__<'py>(slf: &Bound<'py, Self>) -> PyResult<Bound<'py, PyTuple>> {
+        slf.borrow().1.reduce(slf.as_any())
+    }
+
+    fn to_string(&self, py: Python, engine: &DBEngine) -> PyResult<String> {
+        py.allow_threads(|| {
+            metrics::timed(
+                Kind::Select,
+                engine,
+                || self.1.fingerprint(),
+                || {
+                    self.2.string(engine, &self.1, 0, || {
+                        check_inlined(shape(&self.1), self.0.statement(), engine)?;
+                        Ok(render_string(self.0.statement(), engine))
+                    })
+                },
+            )
+        })
     }
 
-    fn build(&self, engine: &DBEngine) -> (String, Vec<PyValue>) {
-        let (sql, values) = self.0.build_any(&*engine.query_builder());
-        (sql, values.iter().map(|v| v.into()).collect())
+    #[pyo3(signature = (engine, **params))]
+    fn build(
+        &self,
+        py: Python,
+        engine: &DBEngine,
+        params: Option<&Bound<'_, PyDict>>,
+    ) -> PyResult<(String, Vec<PyObject>)> {
+        let built = py.allow_threads(|| self.render(engine))?;
+        Ok((built.0.clone(), bind_objects(py, &built.1, params)?))
+    }
+
+    fn compile(&self, py: Python, engine: &DBEngine) -> PyResult<CompiledStatement> {
+        let built = py.allow_threads(|| self.render(engine))?;
+        Ok(CompiledStatement::new(py, &built.0, built.1.clone()))
     }
 }
 
 #[pyclass(subclass)]
-pub struct InsertStatement(SeaInsertStatement);
+pub struct InsertStatement {
+    // Everything but the rows, which are kept apart so they can be split
+    // into several statements sharing the same columns and clauses.
+    statement: SeaInsertStatement,
+    columns: Vec<Ident>,
+    rows: Vec<Vec<Value>>,
+    // The objects the rows were built from, flattened, when `keep_originals`
+    // is on.
+    originals: Option<Vec<PyObject>>,
+    select: Option<Arc<Select>>,
+    // How the statement was built, rows aside.
+    recipe: Recipe,
+    memo: Memo,
+}
+
+impl InsertStatement {
+    fn push_row(&mut self, row: &[Bound<'_, PyAny>]) -> PyResult<()> {
+        if row.len() != self.columns.len() {
+            return Err(PyValueError::new_err(format!(
+                "Number of values ({}) does not match number of columns ({})",
+                row.len(),
+                self.columns.len()
+            )));
+        }
+        let values = row
+            .iter()
+            .map(|value| value.extract::<PyValue>().map(Value::from))
+            .collect::<PyResult<_>>()?;
+        self.rows.push(values);
+        self.select = None;
+        if let Some(originals) = &mut self.originals {
+            originals.extend(row.iter().map(|value| value.clone().unbind()));
+        }
+        Ok(())
+    }
+
+    /// A copy of the statement without its rows, to add a batch to.
+    fn empty_copy(&self) -> Self {
+        Self {
+            statement: self.statement.clone(),
+            columns: self.columns.clone(),
+            rows: Vec::new(),
+            originals: self.originals.as_ref().map(|_| Vec::new()),
+            select: None,
+            recipe: self.recipe.clone(),
+            memo: Memo::default(),
+        }
+    }
+
+    /// The statement with the given rows as its values.
+    fn statement(&self, rows: &[Vec<Value>]) -> PyResult<Cow<'_, SeaInsertStatement>> {
+        if rows.is_empty() && self.select.is_none() {
+            return Ok(Cow::Borrowed(&self.statement));
+        }
+        let mut statement = self.statement.clone();
+        if let Some(select) = &self.select {
+            statement
+                .select_from(select.statement().clone())
+                .map_err(|e| PyValueError::new_err(e.to_string()))?;
+        }
+        for row in rows {
+            statement
+                .values(row.iter().cloned().map(SeaSimpleExpr::from))
+                .map_err(|e| PyValueError::new_err(e.to_string()))?;
+        }
+        Ok(Cow::Owned(statement))
+    }
+
+    /// Split the rows into the largest runs that stay within the limits.
+    fn chunks(&self, max_params: usize, max_bytes: Option<usize>) -> PyResult<Vec<Range<usize>>> {
+        let row_params = self.columns.len();
+        if row_params > max_params {
+            return Err(PyValueError::new_err(format!(
+                "A single row needs {} parameters, but at most {} are allowed",
+                row_params, max_params
+            )));
+        }
+
+        let mut chunks = Vec::new();
+        let (mut start, mut params, mut bytes) = (0, 0, 0);
+        for (i, row) in self.rows.iter().enumerate() {
+            let row_bytes = row.iter().map(value_size).sum::<usize>();
+            let full = params + row_params > max_params
+                || max_bytes.is_some_and(|max_bytes| bytes + row_bytes > max_bytes);
+            if full && i > start {
+                chunks.push(start..i);
+                (start, params, bytes) = (i, 0, 0);
+            }
+            params += row_params;
+            bytes += row_bytes;
+        }
+        if start < self.rows.len() || chunks.is_empty() {
+            chunks.push(start..self.rows.len());
+        }
+        Ok(chunks)
+    }
+
+    /// Build the statement for a range of the rows.
+    ///
+    /// With `keep_originals` on, the parameters of the rows, which come first
+    /// in every engine, are the objects they were created from.
+    fn build_rows(
+        &self,
+        py: Python,
+        engine: &DBEngine,
+        rows: Range<usize>,
+        params: Option<&Bound<'_, PyDict>>,
+    ) -> PyResult<(String, Vec<PyObject>)> {
+        let row_values = &self.rows[rows.clone()];
+        let width = self.columns.len();
+        let originals = self
+            .originals
+            .as_ref()
+            .map(|originals| &originals[rows.start * width..rows.end * width])
+            .unwrap_or_default();
+        // The rows come first among the parameters, so those of the rows
+        // passed as originals are skipped.
+        let (built, skip) = py.allow_threads(|| -> PyResult<(Built, usize)> {
+            if rows.len() == self.rows.len() {
+                return Ok((self.render(engine)?, originals.len()));
+            }
+            let built = metrics::timed(
+                Kind::Insert,
+                engine,
+                || self.recipe.fingerprint_rows(row_values.len()),
+                || {
+                    cache::render(
+                        engine,
+                        || self.shape(row_values),
+                        originals.len(),
+                        || {
+                            Ok(self
+                                .statement(row_values)?
+                                .build_any(engine.query_builder()))
+                        },
+                    )
+                },
+            )?;
+            Ok((Arc::new(built), 0))
+        })?;
+        let objects = bind_rows(py, originals, &built.1[skip.min(built.1.len())..], params)?;
+        // Only the SQL of a memoized output is copied.
+        let sql = Arc::try_unwrap(built).map_or_else(|built| built.0.clone(), |(sql, _)| sql);
+        Ok((sql, objects))
+    }
+
+    /// The parameters of the whole statement once rendered, the originals of
+    /// the rows first with `keep_originals` on.
+    fn objects(
+        &self,
+        py: Python,
+        values: &[PyValue],
+        params: Option<&Bound<'_, PyDict>>,
+    ) -> PyResult<Vec<PyObject>> {
+        let originals = self.originals.as_deref().unwrap_or_default();
+        bind_rows(
+            py,
+            originals,
+            &values[originals.len().min(values.len())..],
+            params,
+        )
+    }
+
+    /// The shape of the statement with the given rows, for the SQL cache.
+    ///
+    /// Rows only count by their number, the columns being in the recipe.
+    fn shape(&self, rows: &[Vec<Value>]) -> Option<Shape> {
+        if !self.recipe.is_recorded() {
+            return None;
+        }
+        let mut values = Vec::new();
+        self.recipe.values(&mut values);
+        values.extend(rows.iter().flatten().map(PyValue::from));
+        Some(Shape {
+            fingerprint: self.recipe.fingerprint_rows(rows.len()),
+            values,
+        })
+    }
+
+    fn render(&self, engine: &DBEngine) -> PyResult<Built> {
+        metrics::timed(
+            Kind::Insert,
+            engine,
+            || self.recipe.fingerprint_rows(self.rows.len()),
+            || {
+                self.memo.built(engine, &self.recipe, self.rows.len(), || {
+                    render(
+                        engine,
+                        || self.shape(&self.rows),
+                        || self.statement(&self.rows),
+                    )
+                })
+            },
+        )
+    }
+
+    /// The object passed for the `i`th value of the rows, flattened: the
+    /// original with `keep_originals` on, placeholders aside.
+    fn row_object(
+        &self,
+        py: Python,
+        i: usize,
+        value: &Value,
+        params: Option<&Bound<'_, PyDict>>,
+    ) -> PyResult<PyObject> {
+        Ok(match (PyValue::from(value), &self.originals) {
+            (PyValue::Param(param), _) => bind_param(&param, params)?.into_py(py),
+            (_, Some(originals)) => originals[i].clone_ref(py),
+            (value, None) => value.into_py(py),
+        })
+    }
+
+    /// The array type of each column, from `types` or else its values.
+    fn unnest_types(&self, types: &HashMap<String, ColumnType>) -> PyResult<Vec<String>> {
+        self.columns
+            .iter()
+            .enumerate()
+            .map(|(i, column)| {
+                let name = column.name();
+                types
+                    .get(&name)
+                    .map(ColumnType::postgres_name)
+                    .or_else(|| self.rows.iter().find_map(|row| postgres_type(&row[i])))
+                    .map(|ty| format!("{ty}[]"))
+                    .ok_or_else(|| {
+                        PyValueError::new_err(format!(
+                            "The type of column '{}' can't be told from its values, pass it in types",
+                            name
+                        ))
+                    })
+            })
+            .collect()
+    }
+
+    /// The statement inserting the rows of one array per column, whatever
+    /// their number, as `INSERT ... SELECT unnest(CAST($1 AS t1[])), ...`.
+    ///
+    /// The arrays are the first values of the statement, left null.
+    fn unnest_statement(&self, types: &[String]) -> PyResult<SeaInsertStatement> {
+        if self.select.is_some() {
+            return Err(PyValueError::new_err(
+                "An insert from a select has no rows to unnest",
+            ));
+        }
+        let mut select = SeaSelectStatement::new();
+        for ty in types {
+            select.expr(
+                Func::cust(Alias::new("unnest"))
+                    .arg(Func::cast_as(Value::Bool(None), Alias::new(ty))),
+            );
+        }
+        let mut statement = self.statement.clone();
+        statement
+            .select_from(select)
+            .map_err(|e| PyValueError::new_err(e.to_string()))?;
+        Ok(statement)
+    }
+
+    /// The recipe with the rows added as a single `values_many` call.
+    fn recipe_with_rows(&self) -> Recipe {
+        if self.rows.is_empty() || !self.recipe.is_recorded() {
+            return self.recipe.clone();
+        }
+        let rows = self
+            .rows
+            .iter()
+            .map(|row| Arg::List(row.iter().map(|v| Arg::Value(PyValue::from(v))).collect()))
+            .collect();
+        self.recipe.with_call("values_many", vec![Arg::List(rows)])
+    }
+}
+
+/// The PostgreSQL type of a value, for the columns whose type isn't given.
+fn postgres_type(value: &Value) -> Option<&'static str> {
+    match value {
+        Value::Bool(Some(_)) => Some("bool"),
+        Value::BigInt(Some(_)) => Some("bigint"),
+        Value::Double(Some(_)) => Some("double precision"),
+        Value::String(Some(_)) => Some("text"),
+        Value::ChronoDateTimeWithTimeZone(Some(_)) => Some("timestamp with time zone"),
+        Value::ChronoDateTime(Some(_)) => Some("timestamp"),
+        Value::ChronoDate(Some(_)) => Some("date"),
+        Value::ChronoTime(Some(_)) => Some("time"),
+        _ => None,
+    }
+}
+
+/// Rough number of bytes a value adds to a statement, placeholder included.
+fn value_size(value: &Value) -> usize {
+    8 + match value {
+        Value::String(Some(v)) => v.len(),
+        Value::Bytes(Some(v)) => v.len(),
+        _ => 8,
+    }
+}
 
 #[pymethods]
 impl InsertStatement {
     #[new]
     fn new() -> Self {
-        Self(SeaInsertStatement::new())
+        Self {
+            statement: SeaInsertStatement::new(),
+            columns: Vec::new(),
+            rows: Vec::new(),
+            originals: None,
+            select: None,
+            recipe: Recipe::new("InsertStatement", || vec![]),
+            memo: Memo::default(),
+        }
     }
 
-    fn into(mut slf: PyRefMut<Self>, table: String) -> PyRefMut<Self> {
-        slf.0.into_table(Alias::new(table));
+    fn into(mut slf: PyRefMut<Self>, table: Ident) -> PyRefMut<Self> {
+        slf.recipe.record("into", || vec![table.to_arg()]);
+        slf.statement.into_table(table);
         slf
     }
 
-    fn columns(mut slf: PyRefMut<Self>, columns: Vec<String>) -> PyRefMut<Self> {
-        slf.0
-            .columns(columns.iter().map(Alias::new).collect::<Vec<Alias>>());
+    fn columns(mut slf: PyRefMut<Self>, columns: Vec<Ident>) -> PyRefMut<Self> {
+        slf.recipe.record("columns", || vec![columns.to_arg()]);
+        slf.statement.columns(columns.clone());
+        slf.columns = columns;
         slf
     }
 
-    fn values(mut slf: PyRefMut<Self>, values: Vec<PyValue>) -> PyRefMut<Self> {
-        let values = values
+    fn values<'py>(
+        mut slf: PyRefMut<'py, Self>,
+        values: Vec<Bound<'py, PyAny>>,
+    ) -> PyResult<PyRefMut<'py, Self>> {
+        slf.push_row(&values)?;
+        Ok(slf)
+    }
+
+    fn values_many<'py>(
+        mut slf: PyRefMut<'py, Self>,
+        rows: Vec<Vec<Bound<'py, PyAny>>>,
+    ) -> PyResult<PyRefMut<'py, Self>> {
+        slf.rows.reserve(rows.len());
+        for row in rows {
+            slf.push_row(&row)?;
+        }
+        Ok(slf)
+    }
+
+    fn values_columns<'py>(
+        mut slf: PyRefMut<'py, Self>,
+        data: &Bound<'py, PyMapping>,
+    ) -> PyResult<PyRefMut<'py, Self>> {
+        let mut columns = Vec::with_capacity(data.len()?);
+        let mut values = Vec::with_capacity(data.len()?);
+        for item in data.items()?.iter() {
+            let (column, column_values): (Ident, Vec<Bound<'py, PyAny>>) = item.extract()?;
+            columns.push(column);
+            values.push(column_values);
+        }
+
+        let len = values.first().map_or(0, Vec::len);
+        if values
             .iter()
-            .map(SeaSimpleExpr::from)
-            .collect::<Vec<SeaSimpleExpr>>();
-        slf.0.values(values).expect("Failed to add values");
+            .any(|column_values| column_values.len() != len)
+        {
+            return Err(PyValueError::new_err(
+                "All columns must have the same number of values",
+            ));
+        }
+
+        slf.recipe.record("columns", || vec![columns.to_arg()]);
+        slf.statement.columns(columns.clone());
+        slf.columns = columns;
+        slf.rows.reserve(len);
+        for i in 0..len {
+            let row: Vec<_> = values
+                .iter()
+                .map(|column_values| column_values[i].clone())
+                .collect();
+            slf.push_row(&row)?;
+        }
+        Ok(slf)
+    }
+
+    #[pyo3(signature = (enabled=true))]
+    fn keep_originals(mut slf: PyRefMut<Self>, enabled: bool) -> PyRefMut<Self> {
+        slf.recipe
+            .record("keep_originals", || vec![enabled.to_arg()]);
+        let py = slf.py();
+        let originals = match (enabled, slf.originals.take()) {
+            (false, _) => None,
+            (true, Some(originals)) => Some(originals),
+            // Rows added before get new objects, the only ones available.
+            (true, None) => Some(
+                slf.rows
+                    .iter()
+                    .flatten()
+                    .map(|value| PyValue::from(value).into_py(py))
+                    .collect(),
+            ),
+        };
+        slf.originals = originals;
         slf
     }
 
     fn select_from(mut slf: PyRefMut<Self>, select: SelectStatement) -> PyRefMut<Self> {
-        slf.0
-            .select_from(select.0)
-            .expect("Failed to add select statement");
+        slf.recipe.record("select_from", || vec![select.to_arg()]);
+        slf.select = Some(select.0);
+        slf.rows.clear();
+        if let Some(originals) = &mut slf.originals {
+            originals.clear();
+        }
         slf
     }
 
     fn on_conflict(mut slf: PyRefMut<Self>, on_conflict: OnConflict) -> PyRefMut<Self> {
-        slf.0.on_conflict(on_conflict.0);
+        slf.recipe
+            .record("on_conflict", || vec![on_conflict.to_arg()]);
+        slf.statement.on_conflict(on_conflict.0);
         slf
     }
 
     fn returning_all(mut slf: PyRefMut<Self>) -> PyRefMut<Self> {
-        slf.0.returning_all();
+        slf.recipe.record("returning_all", || vec![]);
+        slf.statement.returning_all();
         slf
     }
 
-    fn returning_column(mut slf: PyRefMut<Self>, column: String) -> PyRefMut<Self> {
-        slf.0.returning_col(Alias::new(column));
+    fn returning_column(mut slf: PyRefMut<Self>, column: Ident) -> PyRefMut<Self> {
+        slf.recipe
+            .record("returning_column", || vec![column.to_arg()]);
+        slf.statement.returning_col(column);
         slf
     }
 
-    fn returning_columns(mut slf: PyRefMut<Self>, columns: Vec<String>) -> PyRefMut<Self> {
-        slf.0
-            .returning(Returning.columns(columns.iter().map(Alias::new).collect::<Vec<Alias>>()));
+    fn returning_columns(mut slf: PyRefMut<Self>, columns: Vec<Ident>) -> PyRefMut<Self> {
+        slf.recipe
+            .record("returning_columns", || vec![columns.to_arg()]);
+        slf.statement.returning(Returning.columns(columns));
         slf
     }
 
-    fn to_string(&self, engine: &DBEngine) -> String {
-        match engine {
-            DBEngine::Mysql => self.0.to_string(MysqlQueryBuilder),
-            DBEngine::Postgres => self.0.to_string(PostgresQueryBuilder),
-            DBEngine::Sqlite => self.0.to_string(SqliteQueryBuilder),
+    fn fingerprint(&self) -> PyResult<u128> {
+        Ok(self.recipe.recorded()?.fingerprint_rows(self.rows.len()))
+    }
+
+    fn __hash__(&self) -> u64 {
+        self.recipe_with_rows().hash()
+    }
+
+    fn __eq__(&self, other: &Self) -> bool {
+        self.recipe_with_rows().same(&other.recipe_with_rows())
+    }
+
+    fn to_bytes<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyBytes>> {
+        self.recipe_with_rows().to_bytes(py)
+    }
+
+    #[classmethod]
+    fn from_bytes<'py>(cls: &Bound<'py, PyType>, data: &[u8]) -> PyResult<Bound<'py, PyAny>> {
+        Recipe::from_bytes(cls, data)
+    }
+
+    fn __reduce__<'py>(slf: &Bound<'py, Self>) -> PyResult<Bound<'py, PyTuple>> {
+        slf.borrow().recipe_with_rows().reduce(slf.as_any())
+    }
+
+    fn to_string(&self, py: Python, engine: &DBEngine) -> PyResult<String> {
+        py.allow_threads(|| {
+            metrics::timed(
+                Kind::Insert,
+                engine,
+                || self.recipe.fingerprint_rows(self.rows.len()),
+                || {
+                    self.memo.string(engine, &self.recipe, self.rows.len(), || {
+                        let statement = self.statement(&self.rows)?;
+                        check_inlined(self.shape(&self.rows), &*statement, engine)?;
+                        Ok(render_string(&*statement, engine))
+                    })
+                },
+            )
+        })
+    }
+
+    #[pyo3(signature = (engine, **params))]
+    fn build(
+        &self,
+        py: Python,
+        engine: &DBEngine,
+        params: Option<&Bound<'_, PyDict>>,
+    ) -> PyResult<(String, Vec<PyObject>)> {
+        self.build_rows(py, engine, 0..self.rows.len(), params)
+    }
+
+    #[pyo3(signature = (engine, max_params=None, max_bytes=None, **params))]
+    fn build_chunks(
+        &self,
+        py: Python,
+        engine: &DBEngine,
+        max_params: Option<usize>,
+        max_bytes: Option<usize>,
+        params: Option<&Bound<'_, PyDict>>,
+    ) -> PyResult<Vec<(String, Vec<PyObject>)>> {
+        let max_params = max_params.unwrap_or_else(|| engine.max_params());
+        let max_bytes = max_bytes.or_else(|| engine.max_bytes());
+        self.chunks(max_params, max_bytes)?
+            .into_iter()
+            .map(|rows| self.build_rows(py, engine, rows, params))
+            .collect()
+    }
+
+    #[pyo3(signature = (engine, types=None, **params))]
+    fn build_unnest(
+        &self,
+        py: Python,
+        engine: &DBEngine,
+        types: Option<HashMap<String, ColumnType>>,
+        params: Option<&Bound<'_, PyDict>>,
+    ) -> PyResult<(String, Vec<PyObject>)> {
+        if *engine != DBEngine::Postgres {
+            return Err(PyValueError::new_err("Only PostgreSQL can unnest arrays"));
+        }
+        if self.columns.is_empty() {
+            return Err(PyValueError::new_err("An insert to unnest needs columns"));
+        }
+        let types = self.unnest_types(&types.unwrap_or_default())?;
+        let (sql, values) = py.allow_threads(|| {
+            metrics::timed(
+                Kind::Insert,
+                engine,
+                || self.recipe.fingerprint(),
+                || -> PyResult<(String, Vec<PyValue>)> {
+                    let (sql, values) = self.unnest_statement(&types)?.build(PostgresQueryBuilder);
+                    Ok((sql, values.0.into_iter().map(PyValue::from).collect()))
+                },
+            )
+        })?;
+
+        let width = self.columns.len();
+        let mut arrays: Vec<Vec<PyObject>> = (0..width)
+            .map(|_| Vec::with_capacity(self.rows.len()))
+            .collect();
+        for (i, value) in self.rows.iter().flatten().enumerate() {
+            arrays[i % width].push(self.row_object(py, i, value, params)?);
+        }
+        let mut objects: Vec<PyObject> = arrays
+            .into_iter()
+            .map(|array| PyList::new_bound(py, array).into_any().unbind())
+            .collect();
+        objects.extend(bind_objects(
+            py,
+            &values[width.min(values.len())..],
+            params,
+        )?);
+        Ok((sql, objects))
+    }
+
+    #[pyo3(signature = (rows, engine, batch_rows=None, max_params=None, max_bytes=None, **params))]
+    fn stream(
+        &self,
+        rows: &Bound<'_, PyAny>,
+        engine: &DBEngine,
+        batch_rows: Option<usize>,
+        max_params: Option<usize>,
+        max_bytes: Option<usize>,
+        params: Option<&Bound<'_, PyDict>>,
+    ) -> PyResult<InsertStream> {
+        if self.select.is_some() {
+            return Err(PyValueError::new_err(
+                "An insert from a select has no rows to stream",
+            ));
+        }
+        let width = self.columns.len();
+        let max_params = max_params.unwrap_or_else(|| engine.max_params());
+        if width == 0 || width > max_params {
+            return Err(PyValueError::new_err(format!(
+                "A row needs {} parameters, but between 1 and {} are allowed",
+                width, max_params
+            )));
+        }
+        let batch_rows = batch_rows.unwrap_or(usize::MAX).min(max_params / width);
+        if batch_rows == 0 {
+            return Err(PyValueError::new_err("batch_rows must be at least 1"));
         }
+        Ok(InsertStream {
+            statement: self.empty_copy(),
+            rows: rows.iter()?.unbind(),
+            engine: *engine,
+            batch_rows,
+            max_bytes: max_bytes.or_else(|| engine.max_bytes()),
+            params: params.map(|params| params.clone().unbind()),
+            pending: None,
+        })
+    }
+
+    #[pyo3(signature = (engine, **params))]
+    fn build_executemany<'py>(
+        &self,
+        py: Python<'py>,
+        engine: &DBEngine,
+        params: Option<&Bound<'py, PyDict>>,
+    ) -> PyResult<(String, Vec<Bound<'py, PyTuple>>)> {
+        if self.rows.is_empty() {
+            return Err(PyValueError::new_err(
+                "An insert to execute many needs rows",
+            ));
+        }
+        // The values of the other clauses come after the row's, and are the
+        // same for every row.
+        let (sql, first) = self.build_rows(py, engine, 0..1, params)?;
+        let width = self.columns.len();
+        let shared = &first[width..];
+        let rows = self
+            .rows
+            .iter()
+            .enumerate()
+            .map(|(r, row)| -> PyResult<Bound<'py, PyTuple>> {
+                let mut objects = Vec::with_capacity(first.len());
+                for (c, value) in row.iter().enumerate() {
+                    objects.push(self.row_object(py, r * width + c, value, params)?);
+                }
+                objects.extend(shared.iter().map(|object| object.clone_ref(py)));
+                Ok(PyTuple::new_bound(py, objects))
+            })
+            .collect::<PyResult<_>>()?;
+        Ok((sql, rows))
+    }
+
+    fn compile(&self, py: Python, engine: &DBEngine) -> PyResult<CompiledStatement> {
+        let built = py.allow_threads(|| self.render(engine))?;
+        Ok(CompiledStatement::new(py, &built.0, built.1.clone()))
+    }
+}
+
+/// Batches of an insert built from rows pulled from an iterable as they are
+/// needed, so only one batch is held at a time.
+#[pyclass]
+pub struct InsertStream {
+    // The statement the batches are added to, rows aside.
+    statement: InsertStatement,
+    rows: Py<PyIterator>,
+    engine: DBEngine,
+    batch_rows: usize,
+    max_bytes: Option<usize>,
+    params: Option<Py<PyDict>>,
+    // A row pulled that didn't fit in the last batch.
+    pending: Option<PyObject>,
+}
+
+#[pymethods]
+impl InsertStream {
+    fn __iter__(slf: PyRef<Self>) -> PyRef<Self> {
+        slf
     }
 
-    fn build(&self, engine: &DBEngine) -> (String, Vec<PyValue>) {
-        let (sql, values) = self.0.build_any(&*engine.query_builder());
-        (sql, values.iter().map(|v| v.into()).collect())
+    fn __next__(&mut self, py: Python) -> PyResult<Option<(String, Vec<PyObject>)>> {
+        let mut batch = self.statement.empty_copy();
+        let mut rows = self.rows.bind(py).clone();
+        let width = batch.columns.len();
+        let mut bytes = 0;
+        while batch.rows.len() < self.batch_rows {
+            let row = match self.pending.take() {
+                Some(row) => row,
+                None => match rows.next() {
+                    Some(row) => row?.unbind(),
+                    None => break,
+                },
+            };
+            batch.push_row(&row.bind(py).extract::<Vec<Bound<'_, PyAny>>>()?)?;
+            let row_bytes = batch.rows[batch.rows.len() - 1]
+                .iter()
+                .map(value_size)
+                .sum::<usize>();
+            if batch.rows.len() > 1
+                && self
+                    .max_bytes
+                    .is_some_and(|max_bytes| bytes + row_bytes > max_bytes)
+            {
+                // Put the row back for the next batch.
+                batch.rows.pop();
+                if let Some(originals) = &mut batch.originals {
+                    originals.truncate(batch.rows.len() * width);
+                }
+                self.pending = Some(row);
+                break;
+            }
+            bytes += row_bytes;
+        }
+        if batch.rows.is_empty() {
+            return Ok(None);
+        }
+        let params = self.params.as_ref().map(|params| params.bind(py));
+        batch
+            .build_rows(py, &self.engine, 0..batch.rows.len(), params)
+            .map(Some)
     }
 }
 
 #[pyclass(subclass)]
-pub struct UpdateStatement(SeaUpdateStatement);
+pub struct UpdateStatement(SeaUpdateStatement, pub(crate) Recipe, Memo);
+
+impl UpdateStatement {
+    fn render(&self, engine: &DBEngine) -> PyResult<Built> {
+        metrics::timed(
+            Kind::Update,
+            engine,
+            || self.1.fingerprint(),
+            || {
+                self.2.built(engine, &self.1, 0, || {
+                    render(engine, || shape(&self.1), || Ok(Cow::Borrowed(&self.0)))
+                })
+            },
+        )
+    }
+}
 
 #[pymethods]
 impl UpdateStatement {
     #[new]
     fn new() -> Self {
-        Self(SeaUpdateStatement::new())
+        Self(
+            SeaUpdateStatement::new(),
+            Recipe::new("UpdateStatement", || vec![]),
+            Memo::default(),
+        )
     }
 
-    fn table(mut slf: PyRefMut<Self>, name: String) -> PyRefMut<Self> {
-        slf.0.table(Alias::new(name));
+    fn table(mut slf: PyRefMut<Self>, name: Ident) -> PyRefMut<Self> {
+        slf.1.record("table", || vec![name.to_arg()]);
+        slf.0.table(name);
         slf
     }
 
-    fn value(mut slf: PyRefMut<Self>, column: String, value: PyValue) -> PyRefMut<Self> {
-        slf.0.value(Alias::new(column), SeaSimpleExpr::from(&value));
+    fn value(mut slf: PyRefMut<Self>, column: Ident, value: PyValue) -> PyRefMut<Self> {
+        slf.1
+            .record("value", || vec![column.to_arg(), value.to_arg()]);
+        slf.0.value(column, SeaSimpleExpr::from(&value));
         slf
     }
 
-    fn values(mut slf: PyRefMut<Self>, values: Vec<(String, PyValue)>) -> PyRefMut<Self> {
-        let values = values
-            .iter()
-            .map(|(c, v)| (Alias::new(c), SeaSimpleExpr::from(v)))
-            .collect::<Vec<(Alias, SeaSimpleExpr)>>();
-        slf.0.values(values);
+    fn values(mut slf: PyRefMut<Self>, values: Vec<(Ident, PyValue)>) -> PyRefMut<Self> {
+        slf.1.record("values", || vec![values.to_arg()]);
+        slf.0.values(
+            values
+                .into_iter()
+                .map(|(c, v)| (c, SeaSimpleExpr::from(&v))),
+        );
         slf
     }
 
     fn and_where(mut slf: PyRefMut<Self>, expr: SimpleExpr) -> PyRefMut<Self> {
-        slf.0.and_where(expr.0);
+        slf.1.record("and_where", || vec![expr.to_arg()]);
+        slf.0.and_where(expr.into());
         slf
     }
 
     fn cond_where(mut slf: PyRefMut<Self>, cond: Condition) -> PyRefMut<Self> {
-        slf.0.cond_where(cond.0);
+        slf.1.record("cond_where", || vec![cond.to_arg()]);
+        slf.0.cond_where(cond);
         slf
     }
 
     fn limit(mut slf: PyRefMut<Self>, limit: u64) -> PyRefMut<Self> {
+        // Rendered as a parameter, so recorded as a value like it.
+        slf.1
+            .record("limit", || vec![PyValue::Int(limit as i64).to_arg()]);
         slf.0.limit(limit);
         slf
     }
 
     fn returning_all(mut slf: PyRefMut<Self>) -> PyRefMut<Self> {
+        slf.1.record("returning_all", || vec![]);
         slf.0.returning_all();
         slf
     }
 
-    fn returning_column(mut slf: PyRefMut<Self>, name: String) -> PyRefMut<Self> {
-        slf.0.returning_col(Alias::new(name));
+    fn returning_column(mut slf: PyRefMut<Self>, name: Ident) -> PyRefMut<Self> {
+        slf.1.record("returning_column", || vec![name.to_arg()]);
+        slf.0.returning_col(name);
         slf
     }
 
-    fn to_string(&self, engine: &DBEngine) -> String {
-        match engine {
-            DBEngine::Mysql => self.0.to_string(MysqlQueryBuilder),
-            DBEngine::Postgres => self.0.to_string(PostgresQueryBuilder),
-            DBEngine::Sqlite => self.0.to_string(SqliteQueryBuilder),
-        }
+    fn fingerprint(&self) -> PyResult<u128> {
+        Ok(self.1.recorded()?.fingerprint())
+    }
+
+    fn __hash__(&self) -> u64 {
+        self.1.hash()
+    }
+
+    fn __eq__(&self, other: &Self) -> bool {
+        self.1.same(&other.1)
+    }
+
+    fn to_bytes<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyBytes>> {
+        self.1.to_bytes(py)
+    }
+
+    #[classmethod]
+    fn from_bytes<'py>(cls: &Bound<'py, PyType>, data: &[u8]) -> PyResult<Bound<'py, PyAny>> {
+        Recipe::from_bytes(cls, data)
+    }
+
+    fn __reduce__<'py>(slf: &Bound<'py, Self>) -> PyResult<Bound<'py, PyTuple>> {
+        slf.borrow().1.reduce(slf.as_any())
     }
 
-    fn build(&self, engine: &DBEngine) -> (String, Vec<PyValue>) {
-        let (sql, values) = self.0.build_any(&*engine.query_builder());
-        (sql, values.iter().map(|v| v.into()).collect())
+    fn to_string(&self, py: Python, engine: &DBEngine) -> PyResult<String> {
+        py.allow_threads(|| {
+            metrics::timed(
+                Kind::Update,
+                engine,
+                || self.1.fingerprint(),
+                || {
+                    self.2.string(engine, &self.1, 0, || {
+                        check_inlined(shape(&self.1), &self.0, engine)?;
+                        Ok(render_string(&self.0, engine))
+                    })
+                },
+            )
+        })
+    }
+
+    #[pyo3(signature = (engine, **params))]
+    fn build(
+        &self,
+        py: Python,
+        engine: &DBEngine,
+        params: Option<&Bound<'_, PyDict>>,
+    ) -> PyResult<(String, Vec<PyObject>)> {
+        let built = py.allow_threads(|| self.render(engine))?;
+        Ok((built.0.clone(), bind_objects(py, &built.1, params)?))
+    }
+
+    fn build_executemany<'py>(
+        &self,
+        py: Python<'py>,
+        engine: &DBEngine,
+        rows: Vec<Bound<'py, PyDict>>,
+    ) -> PyResult<(String, Vec<Bound<'py, PyTuple>>)> {
+        let built = py.allow_threads(|| self.render(engine))?;
+        Ok((built.0.clone(), param_rows(py, &built.1, &rows)?))
+    }
+
+    fn compile(&self, py: Python, engine: &DBEngine) -> PyResult<CompiledStatement> {
+        let built = py.allow_threads(|| self.render(engine))?;
+        Ok(CompiledStatement::new(py, &built.0, built.1.clone()))
     }
 }
 
 #[pyclass(subclass)]
-pub struct DeleteStatement(SeaDeleteStatement);
+pub struct DeleteStatement(SeaDeleteStatement, pub(crate) Recipe, Memo);
+
+impl DeleteStatement {
+    fn render(&self, engine: &DBEngine) -> PyResult<Built> {
+        metrics::timed(
+            Kind::Delete,
+            engine,
+            || self.1.fingerprint(),
+            || {
+                self.2.built(engine, &self.1, 0, || {
+                    render(engine, || shape(&self.1), || Ok(Cow::Borrowed(&self.0)))
+                })
+            },
+        )
+    }
+}
 
 #[pymethods]
 impl DeleteStatement {
     #[new]
     fn new() -> Self {
-        Self(SeaDeleteStatement::new())
+        Self(
+            SeaDeleteStatement::new(),
+            Recipe::new("DeleteStatement", || vec![]),
+            Memo::default(),
+        )
     }
 
-    fn from_table(mut slf: PyRefMut<Self>, name: String) -> PyRefMut<Self> {
-        slf.0.from_table(Alias::new(name));
+    fn from_table(mut slf: PyRefMut<Self>, name: Ident) -> PyRefMut<Self> {
+        slf.1.record("from_table", || vec![name.to_arg()]);
+        slf.0.from_table(name);
         slf
     }
 
     fn and_where(mut slf: PyRefMut<Self>, expr: SimpleExpr) -> PyRefMut<Self> {
-        slf.0.and_where(expr.0);
+        slf.1.record("and_where", || vec![expr.to_arg()]);
+        slf.0.and_where(expr.into());
         slf
     }
 
     fn cond_where(mut slf: PyRefMut<Self>, cond: Condition) -> PyRefMut<Self> {
-        slf.0.cond_where(cond.0);
+        slf.1.record("cond_where", || vec![cond.to_arg()]);
+        slf.0.cond_where(cond);
         slf
     }
 
     fn limit(mut slf: PyRefMut<Self>, limit: u64) -> PyRefMut<Self> {
+        // Rendered as a parameter, so recorded as a value like it.
+        slf.1
+            .record("limit", || vec![PyValue::Int(limit as i64).to_arg()]);
         slf.0.limit(limit);
         slf
     }
 
     fn returning_all(mut slf: PyRefMut<Self>) -> PyRefMut<Self> {
+        slf.1.record("returning_all", || vec![]);
         slf.0.returning_all();
         slf
     }
 
-    fn returning_column(mut slf: PyRefMut<Self>, name: String) -> PyRefMut<Self> {
-        slf.0.returning_col(Alias::new(name));
+    fn returning_column(mut slf: PyRefMut<Self>, name: Ident) -> PyRefMut<Self> {
+        slf.1.record("returning_column", || vec![name.to_arg()]);
+        slf.0.returning_col(name);
         slf
     }
 
-    fn to_string(&self, engine: &DBEngine) -> String {
-        match engine {
-            DBEngine::Mysql => self.0.to_string(MysqlQueryBuilder),
-            DBEngine::Postgres => self.0.to_string(PostgresQueryBuilder),
-            DBEngine::Sqlite => self.0.to_string(SqliteQueryBuilder),
-        }
+    fn fingerprint(&self) -> PyResult<u128> {
+        Ok(self.1.recorded()?.fingerprint())
     }
 
-    fn build(&self, engine: &DBEngine) -> (String, Vec<PyValue>) {
-        let (sql, values) = self.0.build_any(&*engine.query_builder());
-        (sql, values.iter().map(|v| v.into()).collect())
+    fn __hash__(&self) -> u64 {
+        self.1.hash()
     }
+
+    fn __eq__(&self, other: &Self) -> bool {
+        self.1.same(&other.1)
+    }
+
+    fn to_bytes<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyBytes>> {
+        self.1.to_bytes(py)
+    }
+
+    #[classmethod]
+    fn from_bytes<'py>(cls: &Bound<'py, PyType>, data: &[u8]) -> PyResult<Bound<'py, PyAny>> {
+        Recipe::from_bytes(cls, data)
+    }
+
+    fn __reduce__<'py>(slf: &Bound<'py, Self>) -> PyResult<Bound<'py, PyTuple>> {
+        slf.borrow().1.reduce(slf.as_any())
+    }
+
+    fn to_string(&self, py: Python, engine: &DBEngine) -> PyResult<String> {
+        py.allow_threads(|| {
+            metrics::timed(
+                Kind::Delete,
+                engine,
+                || self.1.fingerprint(),
+                || {
+                    self.2.string(engine, &self.1, 0, || {
+                        check_inlined(shape(&self.1), &self.0, engine)?;
+                        Ok(render_string(&self.0, engine))
+                    })
+                },
+            )
+        })
+    }
+
+    #[pyo3(signature = (engine, **params))]
+    fn build(
+        &self,
+        py: Python,
+        engine: &DBEngine,
+        params: Option<&Bound<'_, PyDict>>,
+    ) -> PyResult<(String, Vec<PyObject>)> {
+        let built = py.allow_threads(|| self.render(engine))?;
+        Ok((built.0.clone(), bind_objects(py, &built.1, params)?))
+    }
+
+    fn build_executemany<'py>(
+        &self,
+        py: Python<'py>,
+        engine: &DBEngine,
+        rows: Vec<Bound<'py, PyDict>>,
+    ) -> PyResult<(String, Vec<Bound<'py, PyTuple>>)> {
+        let built = py.allow_threads(|| self.render(engine))?;
+        Ok((built.0.clone(), param_rows(py, &built.1, &rows)?))
+    }
+
+    fn compile(&self, py: Python, engine: &DBEngine) -> PyResult<CompiledStatement> {
+        let built = py.allow_threads(|| self.render(engine))?;
+        Ok(CompiledStatement::new(py, &built.0, built.1.clone()))
+    }
+}
+
+// Below this many statements per worker, spawning threads costs more than it saves.
+const BUILD_MANY_MIN_BATCH: usize = 256;
+
+#[derive(FromPyObject)]
+pub enum AnyStatement<'py> {
+    Select(PyRef<'py, SelectStatement>),
+    Insert(PyRef<'py, InsertStatement>),
+    Update(PyRef<'py, UpdateStatement>),
+    Delete(PyRef<'py, DeleteStatement>),
+}
+
+enum StatementRef<'a> {
+    Select(&'a SelectStatement),
+    Insert(&'a InsertStatement),
+    Update(&'a UpdateStatement),
+    Delete(&'a DeleteStatement),
+}
+
+impl StatementRef<'_> {
+    fn render(&self, engine: &DBEngine) -> PyResult<Built> {
+        match self {
+            StatementRef::Select(statement) => statement.render(engine),
+            StatementRef::Insert(statement) => statement.render(engine),
+            StatementRef::Update(statement) => statement.render(engine),
+            StatementRef::Delete(statement) => statement.render(engine),
+        }
+    }
+}
+
+fn render_many(statements: &[StatementRef], engine: &DBEngine) -> PyResult<Vec<Built>> {
+    let workers = std::thread::available_parallelism()
+        .map_or(1, |n| n.get())
+        .min(statements.len() / BUILD_MANY_MIN_BATCH);
+    if workers <= 1 {
+        return statements.iter().map(|s| s.render(engine)).collect();
+    }
+
+    let chunk_size = statements.len().div_ceil(workers);
+    std::thread::scope(|scope| {
+        let handles: Vec<_> = statements
+            .chunks(chunk_size)
+            .map(|chunk| {
+                scope.spawn(move || {
+                    chunk
+                        .iter()
+                        .map(|s| s.render(engine))
+                        .collect::<PyResult<Vec<_>>>()
+                })
+            })
+            .collect();
+
+        let mut results = Vec::with_capacity(statements.len());
+        for handle in handles {
+            let rendered = handle
+                .join()
+                .unwrap_or_else(|e| std::panic::resume_unwind(e))?;
+            results.extend(rendered);
+        }
+        Ok(results)
+    })
 }
+
+#[pyfunction]
+pub fn build_many<'py>(
+    py: Python<'py>,
+    statements: Vec<AnyStatement<'py>>,
+    engine: &DBEngine,
+) -> PyResult<Vec<(String, Vec<PyObject>)>> {
+    let refs: Vec<StatementRef> = statements
+        .iter()
+        .map(|statement| match statement {
+            AnyStatement::Select(s) => StatementRef::Select(s),
+            AnyStatement::Insert(s) => StatementRef::Insert(s),
+            AnyStatement::Update(s) => StatementRef::Update(s),
+            AnyStatement::Delete(s) => StatementRef::Delete(s),
+        })
+        .collect();
+
+    let rendered = py.allow_threads(|| render_many(&refs, engine))?;
+    rendered
+        .into_iter()
+        .zip(&refs)
+        .map(|(built, statement)| {
+            let objects = match statement {
+                StatementRef::Insert(statement) => statement.objects(py, &built.1, None)?,
+                _ => bind_objects(py, &built.1, None)?,
+            };
+            Ok((built.0.clone(), objects))
+        })
+        .collect()
+}
+
+bound_statements!(query SelectStatement("SelectStatement") -> PyObject {
+    Mysql("sea_query.mysql"): MysqlSelectStatement,
+    Postgres("sea_query.postgres"): PostgresSelectStatement,
+    Sqlite("sea_query.sqlite"): SqliteSelectStatement,
+});
+
+bound_statements!(insert InsertStatement("InsertStatement") {
+    Mysql("sea_query.mysql"): MysqlInsertStatement,
+    Postgres("sea_query.postgres"): PostgresInsertStatement,
+    Sqlite("sea_query.sqlite"): SqliteInsertStatement,
+});
+
+bound_statements!(dml UpdateStatement("UpdateStatement") -> PyObject {
+    Mysql("sea_query.mysql"): MysqlUpdateStatement,
+    Postgres("sea_query.postgres"): PostgresUpdateStatement,
+    Sqlite("sea_query.sqlite"): SqliteUpdateStatement,
+});
+
+bound_statements!(dml DeleteStatement("DeleteStatement") -> PyObject {
+    Mysql("sea_query.mysql"): MysqlDeleteStatement,
+    Postgres("sea_query.postgres"): PostgresDeleteStatement,
+    Sqlite("sea_query.sqlite"): SqliteDeleteStatement,
+});
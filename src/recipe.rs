@@ -0,0 +1,978 @@
+use std::sync::{
+    atomic::{AtomicBool, Ordering},
+    Arc,
+};
+
+use chrono::{DateTime, Datelike, FixedOffset, NaiveDate, NaiveTime, Timelike};
+use pyo3::{
+    exceptions::{PyTypeError, PyValueError},
+    prelude::*,
+    types::{PyBytes, PyList, PyString, PyTuple, PyType},
+};
+
+use crate::expr::{
+    CaseStatement, Condition, ConditionExpression, Expr, IntoSimpleExpr, SimpleExpr,
+};
+use crate::foreign_key::{ForeignKeyAction, ForeignKeyCreateStatement, ForeignKeyDropStatement};
+use crate::iden::Ident;
+use crate::index::{IndexCreateStatement, IndexDropStatement};
+use crate::query::{
+    DeleteStatement, InsertStatement, OnConflict, SelectStatement, UpdateStatement,
+};
+use crate::table::{
+    Column, TableAlterStatement, TableCreateStatement, TableDropStatement, TableRenameStatement,
+    TableTruncateStatement,
+};
+use crate::types::{
+    ColumnType, IndexType, LockBehavior, LockType, NullsOrder, OrderBy, Param, PyValue, UnionType,
+};
+
+// Statements and expressions remember the calls they were built with, which
+// is all that is needed to serialize them: sea-query's AST can't be read
+// back. Deserializing replays the calls on a new object.
+
+const MODULE: &str = "sea_query._internal";
+const MAGIC: &[u8] = b"SQB\x01";
+
+// Recording can be turned off for programs that never serialize, compare or
+// fingerprint what they build, so builder calls only mark objects as changed.
+static RECORDING: AtomicBool = AtomicBool::new(true);
+
+// The constructors and methods recorded, the only ones deserializing calls.
+const METHODS: &[&str] = &[
+    "__and__",
+    "__invert__",
+    "__or__",
+    "add",
+    "add_column",
+    "add_column_if_not_exists",
+    "add_foreign_key",
+    "all",
+    "and_having",
+    "and_where",
+    "any",
+    "auto_increment",
+    "between",
+    "big_integer",
+    "big_unsigned",
+    "blob",
+    "boolean",
+    "cascade",
+    "case",
+    "char",
+    "char_len",
+    "check",
+    "column",
+    "columns",
+    "comment",
+    "cond_having",
+    "cond_where",
+    "count",
+    "count_distinct",
+    "cross_join",
+    "current_date",
+    "current_time",
+    "current_timestamp",
+    "date",
+    "datetime",
+    "decimal",
+    "decimal_len",
+    "default",
+    "distinct",
+    "do_nothing",
+    "double",
+    "drop_column",
+    "drop_foreign_key",
+    "else_",
+    "eq",
+    "equals",
+    "exists",
+    "expr",
+    "expr_as",
+    "extra",
+    "float",
+    "foreign_key",
+    "from_column",
+    "from_subquery",
+    "from_table",
+    "full_outer_join",
+    "full_text",
+    "group_by",
+    "gt",
+    "gte",
+    "if_exists",
+    "if_not_exists",
+    "if_null",
+    "index",
+    "index_type",
+    "inner_join",
+    "integer",
+    "into",
+    "is_",
+    "is_in",
+    "is_not",
+    "is_not_in",
+    "is_not_null",
+    "is_null",
+    "json",
+    "jsonb",
+    "keep_originals",
+    "left_join",
+    "like",
+    "limit",
+    "lock",
+    "lock_exclusive",
+    "lock_shared",
+    "lock_with_behavior",
+    "lock_with_tables",
+    "lock_with_tables_behavior",
+    "lt",
+    "lte",
+    "max",
+    "min",
+    "modify_column",
+    "name",
+    "ne",
+    "new_with_type",
+    "not_between",
+    "not_equals",
+    "not_like",
+    "not_null",
+    "null",
+    "nulls_not_distinct",
+    "offset",
+    "on_conflict",
+    "on_delete",
+    "on_update",
+    "order_by",
+    "order_by_with_nulls",
+    "primary",
+    "primary_key",
+    "rename_column",
+    "restrict",
+    "returning_all",
+    "returning_column",
+    "returning_columns",
+    "right_join",
+    "select_from",
+    "small_integer",
+    "small_unsigned",
+    "string",
+    "string_len",
+    "sum",
+    "table",
+    "text",
+    "time",
+    "timestamp",
+    "timestamp_with_tz",
+    "tiny_integer",
+    "tiny_unsigned",
+    "to_column",
+    "to_table",
+    "union",
+    "unique",
+    "unsigned",
+    "uuid",
+    "value",
+    "values",
+    "values_many",
+    "when",
+];
+
+/// The class a recipe starts from, by its recorded name.
+///
+/// Looked up here instead of on the module, so deserializing can only
+/// create these.
+fn recorded_class<'py>(py: Python<'py>, name: &str) -> Option<Bound<'py, PyType>> {
+    Some(match name {
+        "SelectStatement" => py.get_type_bound::<SelectStatement>(),
+        "InsertStatement" => py.get_type_bound::<InsertStatement>(),
+        "UpdateStatement" => py.get_type_bound::<UpdateStatement>(),
+        "DeleteStatement" => py.get_type_bound::<DeleteStatement>(),
+        "OnConflict" => py.get_type_bound::<OnConflict>(),
+        "Expr" => py.get_type_bound::<Expr>(),
+        "Condition" => py.get_type_bound::<Condition>(),
+        "Column" => py.get_type_bound::<Column>(),
+        "TableCreateStatement" => py.get_type_bound::<TableCreateStatement>(),
+        "TableAlterStatement" => py.get_type_bound::<TableAlterStatement>(),
+        "TableDropStatement" => py.get_type_bound::<TableDropStatement>(),
+        "TableRenameStatement" => py.get_type_bound::<TableRenameStatement>(),
+        "TableTruncateStatement" => py.get_type_bound::<TableTruncateStatement>(),
+        "IndexCreateStatement" => py.get_type_bound::<IndexCreateStatement>(),
+        "IndexDropStatement" => py.get_type_bound::<IndexDropStatement>(),
+        "ForeignKeyCreateStatement" => py.get_type_bound::<ForeignKeyCreateStatement>(),
+        "ForeignKeyDropStatement" => py.get_type_bound::<ForeignKeyDropStatement>(),
+        _ => return None,
+    })
+}
+
+/// The enum an argument belongs to, by its recorded name.
+fn recorded_enum<'py>(py: Python<'py>, name: &str) -> Option<Bound<'py, PyType>> {
+    Some(match name {
+        "OrderBy" => py.get_type_bound::<OrderBy>(),
+        "NullsOrder" => py.get_type_bound::<NullsOrder>(),
+        "UnionType" => py.get_type_bound::<UnionType>(),
+        "LockType" => py.get_type_bound::<LockType>(),
+        "LockBehavior" => py.get_type_bound::<LockBehavior>(),
+        "IndexType" => py.get_type_bound::<IndexType>(),
+        "ColumnType" => py.get_type_bound::<ColumnType>(),
+        "ForeignKeyAction" => py.get_type_bound::<ForeignKeyAction>(),
+        _ => return None,
+    })
+}
+
+/// An argument of a recorded call.
+#[derive(Clone)]
+pub enum Arg {
+    None,
+    Bool(bool),
+    Int(i64),
+    UInt(u64),
+    Str(String),
+    Ident(Ident),
+    Value(PyValue),
+    List(Vec<Arg>),
+    Tuple(Vec<Arg>),
+    Enum(&'static str, i64),
+    Object(Recipe),
+}
+
+pub trait ToArg {
+    fn to_arg(&self) -> Arg;
+}
+
+/// How an object was built: the constructor and the calls made on it since.
+///
+/// Calls link to the recipe before them, so recording one and copying a
+/// recipe are both O(1).
+#[derive(Clone)]
+pub struct Recipe(Arc<Step>);
+
+enum Step {
+    New {
+        class: &'static str,
+        constructor: Option<&'static str>,
+        args: Vec<Arg>,
+    },
+    Call {
+        prev: Recipe,
+        method: &'static str,
+        args: Vec<Arg>,
+    },
+    // Built while recording was off, or from objects that were. Only tells
+    // the object apart from the ones it was changed into.
+    Unrecorded,
+}
+
+/// Whether none of `args` holds an object built while recording was off.
+fn recorded(args: &[Arg]) -> bool {
+    args.iter().all(|arg| match arg {
+        Arg::List(args) | Arg::Tuple(args) => recorded(args),
+        Arg::Object(recipe) => recipe.is_recorded(),
+        _ => true,
+    })
+}
+
+impl Recipe {
+    /// A step recorded with the arguments from `args`, which are only
+    /// gathered while recording is on.
+    fn step(args: impl FnOnce() -> Vec<Arg>, step: impl FnOnce(Vec<Arg>) -> Step) -> Self {
+        if !RECORDING.load(Ordering::Relaxed) {
+            return Self(Arc::new(Step::Unrecorded));
+        }
+        let args = args();
+        if !recorded(&args) {
+            return Self(Arc::new(Step::Unrecorded));
+        }
+        Self(Arc::new(step(args)))
+    }
+
+    /// An object created by calling its class with `args`.
+    pub fn new(class: &'static str, args: impl FnOnce() -> Vec<Arg>) -> Self {
+        Self::step(args, |args| Step::New {
+            class,
+            constructor: None,
+            args,
+        })
+    }
+
+    /// An object created by the static method `constructor` of its class.
+    pub fn constructor(
+        class: &'static str,
+        constructor: &'static str,
+        args: impl FnOnce() -> Vec<Arg>,
+    ) -> Self {
+        debug_assert!(
+            METHODS.contains(&constructor),
+            "{constructor} is not in METHODS"
+        );
+        Self::step(args, |args| Step::New {
+            class,
+            constructor: Some(constructor),
+            args,
+        })
+    }
+
+    /// The result of calling `method` on the object.
+    pub fn call(&self, method: &'static str, args: impl FnOnce() -> Vec<Arg>) -> Self {
+        debug_assert!(METHODS.contains(&method), "{method} is not in METHODS");
+        if !self.is_recorded() {
+            return Self(Arc::new(Step::Unrecorded));
+        }
+        Self::step(args, |args| Step::Call {
+            prev: self.clone(),
+            method,
+            args,
+        })
+    }
+
+    /// Record a call on a builder, which returns the same object.
+    pub fn record(&mut self, method: &'static str, args: impl FnOnce() -> Vec<Arg>) {
+        *self = self.call(method, args);
+    }
+
+    /// The recipe with a call added from state kept outside of it, like the
+    /// rows of an insert, whether recording is on or not.
+    pub fn with_call(&self, method: &'static str, args: Vec<Arg>) -> Self {
+        Self(Arc::new(Step::Call {
+            prev: self.clone(),
+            method,
+            args,
+        }))
+    }
+
+    pub fn is_recorded(&self) -> bool {
+        !matches!(*self.0, Step::Unrecorded)
+    }
+
+    /// The recipe, if the object was built while recording was on.
+    pub fn recorded(&self) -> PyResult<&Self> {
+        if self.is_recorded() {
+            Ok(self)
+        } else {
+            Err(PyValueError::new_err(
+                "Built while recording was off, so it can't be serialized or fingerprinted",
+            ))
+        }
+    }
+
+    /// Whether both are the same recipe, not just equal ones.
+    pub fn is(&self, other: &Recipe) -> bool {
+        Arc::ptr_eq(&self.0, &other.0)
+    }
+
+    pub fn to_bytes<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyBytes>> {
+        let mut out = MAGIC.to_vec();
+        write_recipe(&mut out, self.recorded()?);
+        Ok(PyBytes::new_bound(py, &out))
+    }
+
+    /// A hash of the shape of the object, that is everything but the values
+    /// given to it. Objects built while recording was off all share one.
+    pub fn fingerprint(&self) -> u128 {
+        let mut hasher = Fnv::new(false);
+        write_recipe(&mut hasher, self);
+        hasher.hash
+    }
+
+    /// The fingerprint of an insert statement with `rows` rows of values.
+    pub fn fingerprint_rows(&self, rows: usize) -> u128 {
+        let mut hasher = Fnv::new(false);
+        write_recipe(&mut hasher, self);
+        hasher.extend_from_slice(&(rows as u64).to_le_bytes());
+        hasher.hash
+    }
+
+    /// The arguments that can end up as query values, in a fixed order.
+    ///
+    /// Besides the values themselves, strings and integers can be rendered
+    /// as values too, like the pattern of `like` or a limit.
+    pub fn values(&self, out: &mut Vec<PyValue>) {
+        let mut calls = Vec::new();
+        let mut step = &*self.0;
+        while let Step::Call { prev, args, .. } = step {
+            calls.push(args);
+            step = &*prev.0;
+        }
+        if let Step::New { args, .. } = step {
+            collect_values(args, out);
+        }
+        for args in calls.into_iter().rev() {
+            collect_values(args, out);
+        }
+    }
+
+    /// A hash of the whole object, values included, or of its identity if
+    /// it was built while recording was off.
+    pub fn hash(&self) -> u64 {
+        if !self.is_recorded() {
+            return Arc::as_ptr(&self.0) as usize as u64;
+        }
+        let mut hasher = Fnv::new(true);
+        write_recipe(&mut hasher, self);
+        (hasher.hash >> 64) as u64 ^ hasher.hash as u64
+    }
+
+    /// Whether both objects were built the same way, or are the same object
+    /// if either was built while recording was off.
+    pub fn same(&self, other: &Recipe) -> bool {
+        if Arc::ptr_eq(&self.0, &other.0) {
+            return true;
+        }
+        if !self.is_recorded() || !other.is_recorded() {
+            return false;
+        }
+        let (mut left, mut right) = (Vec::new(), Vec::new());
+        write_recipe(&mut left, self);
+        write_recipe(&mut right, other);
+        left == right
+    }
+
+    /// Rebuild an object of `cls`, possibly a subclass of the recorded class.
+    pub fn from_bytes<'py>(cls: &Bound<'py, PyType>, data: &[u8]) -> PyResult<Bound<'py, PyAny>> {
+        let data = data
+            .strip_prefix(MAGIC)
+            .ok_or_else(|| PyValueError::new_err("Not a serialized statement"))?;
+        let mut reader = Reader { data, pos: 0 };
+        let obj = reader.read_recipe(cls.py(), Some(cls))?;
+        if reader.pos != data.len() {
+            return Err(reader.invalid());
+        }
+        Ok(obj)
+    }
+
+    /// Pickle `obj` through its serialized form.
+    pub fn reduce<'py>(&self, obj: &Bound<'py, PyAny>) -> PyResult<Bound<'py, PyTuple>> {
+        let py = obj.py();
+        let cls = obj.get_type();
+        let module = cls.getattr("__module__")?.extract::<String>()?;
+        let module = if module == "builtins" {
+            MODULE.to_owned()
+        } else {
+            module
+        };
+        let restore = py.import_bound(MODULE)?.getattr("_restore")?;
+        let args = (module, cls.getattr("__qualname__")?, self.to_bytes(py)?);
+        Ok(PyTuple::new_bound(
+            py,
+            [restore, args.into_py(py).into_bound(py)],
+        ))
+    }
+}
+
+#[pyfunction]
+pub fn enable_recording() {
+    RECORDING.store(true, Ordering::Relaxed);
+}
+
+#[pyfunction]
+pub fn disable_recording() {
+    RECORDING.store(false, Ordering::Relaxed);
+}
+
+/// Unpickle an object serialized by `Recipe::reduce`.
+#[pyfunction]
+#[pyo3(name = "_restore")]
+pub fn restore<'py>(
+    py: Python<'py>,
+    module: &str,
+    qualname: &str,
+    data: &[u8],
+) -> PyResult<Bound<'py, PyAny>> {
+    if module == MODULE {
+        let cls = recorded_class(py, qualname)
+            .ok_or_else(|| PyValueError::new_err("Invalid serialized statement"))?;
+        return Recipe::from_bytes(&cls, data);
+    }
+    let mut cls = py.import_bound(module)?.into_any();
+    for name in qualname.split('.') {
+        cls = cls.getattr(name)?;
+    }
+    Recipe::from_bytes(cls.downcast()?, data)
+}
+
+/// Where a recipe is written: bytes for serializing, or a hasher.
+trait Sink {
+    fn extend_from_slice(&mut self, bytes: &[u8]);
+
+    fn push(&mut self, byte: u8) {
+        self.extend_from_slice(&[byte]);
+    }
+
+    /// Whether the values given to the object are written, or only their
+    /// place.
+    fn with_values(&self) -> bool {
+        true
+    }
+}
+
+impl Sink for Vec<u8> {
+    fn extend_from_slice(&mut self, bytes: &[u8]) {
+        Vec::extend_from_slice(self, bytes);
+    }
+}
+
+/// 128-bit FNV-1a, stable across runs and platforms unlike `std::hash`.
+struct Fnv {
+    hash: u128,
+    values: bool,
+}
+
+impl Fnv {
+    fn new(values: bool) -> Self {
+        Self {
+            hash: 0x6c62272e07bb014262b821756295c58d,
+            values,
+        }
+    }
+}
+
+impl Sink for Fnv {
+    fn extend_from_slice(&mut self, bytes: &[u8]) {
+        for byte in bytes {
+            self.hash ^= *byte as u128;
+            self.hash = self.hash.wrapping_mul(0x0000000001000000000000000000013b);
+        }
+    }
+
+    fn with_values(&self) -> bool {
+        self.values
+    }
+}
+
+fn write_u32(out: &mut impl Sink, n: usize) {
+    out.extend_from_slice(&(n as u32).to_le_bytes());
+}
+
+fn write_str(out: &mut impl Sink, s: &str) {
+    write_u32(out, s.len());
+    out.extend_from_slice(s.as_bytes());
+}
+
+fn write_recipe(out: &mut impl Sink, recipe: &Recipe) {
+    let mut calls = Vec::new();
+    let mut step = &*recipe.0;
+    while let Step::Call { prev, method, args } = step {
+        calls.push((method, args));
+        step = &*prev.0;
+    }
+    if let Step::New {
+        class,
+        constructor,
+        args,
+    } = step
+    {
+        write_str(out, class);
+        write_str(out, constructor.unwrap_or(""));
+        write_args(out, args);
+    }
+    write_u32(out, calls.len());
+    for (method, args) in calls.into_iter().rev() {
+        write_str(out, method);
+        write_args(out, args);
+    }
+}
+
+fn write_args(out: &mut impl Sink, args: &[Arg]) {
+    write_u32(out, args.len());
+    for arg in args {
+        write_arg(out, arg);
+    }
+}
+
+fn write_arg(out: &mut impl Sink, arg: &Arg) {
+    match arg {
+        Arg::None => out.push(0),
+        Arg::Bool(v) => out.extend_from_slice(&[1, *v as u8]),
+        Arg::Int(v) => {
+            out.push(2);
+            out.extend_from_slice(&v.to_le_bytes());
+        }
+        Arg::UInt(v) => {
+            out.push(3);
+            out.extend_from_slice(&v.to_le_bytes());
+        }
+        Arg::Str(v) => {
+            out.push(4);
+            write_str(out, v);
+        }
+        Arg::Ident(v) => {
+            out.push(4);
+            write_str(out, &v.name());
+        }
+        Arg::Value(v) => {
+            out.push(5);
+            if out.with_values() {
+                write_value(out, v);
+            }
+        }
+        Arg::List(v) => {
+            out.push(6);
+            write_args(out, v);
+        }
+        Arg::Tuple(v) => {
+            out.push(7);
+            write_args(out, v);
+        }
+        Arg::Enum(class, v) => {
+            out.push(8);
+            write_str(out, class);
+            out.extend_from_slice(&v.to_le_bytes());
+        }
+        Arg::Object(recipe) => {
+            out.push(9);
+            write_recipe(out, recipe);
+        }
+    }
+}
+
+fn write_value(out: &mut impl Sink, value: &PyValue) {
+    match value {
+        PyValue::None(_) => out.push(0),
+        PyValue::Bool(v) => out.extend_from_slice(&[1, *v as u8]),
+        PyValue::Int(v) => {
+            out.push(2);
+            out.extend_from_slice(&v.to_le_bytes());
+        }
+        PyValue::Float(v) => {
+            out.push(3);
+            out.extend_from_slice(&v.to_le_bytes());
+        }
+        PyValue::String(v) => {
+            out.push(4);
+            write_str(out, v);
+        }
+        PyValue::DateTimeTz(v) => {
+            out.push(5);
+            out.extend_from_slice(&v.timestamp().to_le_bytes());
+            out.extend_from_slice(&v.timestamp_subsec_nanos().to_le_bytes());
+            out.extend_from_slice(&v.offset().local_minus_utc().to_le_bytes());
+        }
+        PyValue::DateTime(v) => {
+            out.push(6);
+            out.extend_from_slice(&v.and_utc().timestamp().to_le_bytes());
+            out.extend_from_slice(&v.and_utc().timestamp_subsec_nanos().to_le_bytes());
+        }
+        PyValue::Date(v) => {
+            out.push(7);
+            out.extend_from_slice(&v.num_days_from_ce().to_le_bytes());
+        }
+        PyValue::Time(v) => {
+            out.push(8);
+            out.extend_from_slice(&v.num_seconds_from_midnight().to_le_bytes());
+            out.extend_from_slice(&v.nanosecond().to_le_bytes());
+        }
+        PyValue::Param(v) => {
+            out.push(9);
+            write_str(out, &v.0);
+        }
+    }
+}
+
+fn collect_values(args: &[Arg], out: &mut Vec<PyValue>) {
+    for arg in args {
+        match arg {
+            Arg::Value(v) => out.push(v.clone()),
+            Arg::Str(v) => out.push(PyValue::String(v.clone())),
+            Arg::Int(v) => out.push(PyValue::Int(*v)),
+            Arg::UInt(v) => out.push(PyValue::Int(*v as i64)),
+            Arg::Bool(v) => out.push(PyValue::Bool(*v)),
+            Arg::List(args) | Arg::Tuple(args) => collect_values(args, out),
+            Arg::Object(recipe) => recipe.values(out),
+            Arg::None | Arg::Ident(_) | Arg::Enum(..) => {}
+        }
+    }
+}
+
+/// Bytes identifying a value, equal only for values rendered the same.
+pub fn value_key(value: &PyValue) -> Vec<u8> {
+    let mut out = Vec::new();
+    write_value(&mut out, value);
+    out
+}
+
+struct Reader<'a> {
+    data: &'a [u8],
+    pos: usize,
+}
+
+impl<'a> Reader<'a> {
+    fn invalid(&self) -> PyErr {
+        PyValueError::new_err("Invalid serialized statement")
+    }
+
+    fn take<const N: usize>(&mut self) -> PyResult<[u8; N]> {
+        let bytes = self
+            .data
+            .get(self.pos..self.pos + N)
+            .ok_or_else(|| self.invalid())?;
+        self.pos += N;
+        Ok(bytes.try_into().expect("slice of length N"))
+    }
+
+    fn u8(&mut self) -> PyResult<u8> {
+        Ok(self.take::<1>()?[0])
+    }
+
+    fn u32(&mut self) -> PyResult<usize> {
+        Ok(u32::from_le_bytes(self.take()?) as usize)
+    }
+
+    fn str(&mut self) -> PyResult<&'a str> {
+        let len = self.u32()?;
+        let bytes = self
+            .data
+            .get(self.pos..self.pos + len)
+            .ok_or_else(|| self.invalid())?;
+        self.pos += len;
+        std::str::from_utf8(bytes).map_err(|_| self.invalid())
+    }
+
+    /// A recorded method name, or "" for none.
+    fn method(&mut self) -> PyResult<&'a str> {
+        let method = self.str()?;
+        if method.is_empty() || METHODS.contains(&method) {
+            Ok(method)
+        } else {
+            Err(self.invalid())
+        }
+    }
+
+    fn read_recipe<'py>(
+        &mut self,
+        py: Python<'py>,
+        cls: Option<&Bound<'py, PyType>>,
+    ) -> PyResult<Bound<'py, PyAny>> {
+        let class = recorded_class(py, self.str()?).ok_or_else(|| self.invalid())?;
+        let constructor = self.method()?;
+        let args = self.read_args(py)?;
+
+        let mut obj = match (constructor, cls) {
+            ("", Some(cls)) if cls.is_subclass(class.as_any())? => cls.call1(args)?,
+            ("", _) => class.call1(args)?,
+            (constructor, _) => class.call_method1(constructor, args)?,
+        };
+        for _ in 0..self.u32()? {
+            let method = self.method()?;
+            if method.is_empty() {
+                return Err(self.invalid());
+            }
+            let args = self.read_args(py)?;
+            obj = obj.call_method1(method, args)?;
+        }
+
+        match cls {
+            Some(cls) if !obj.is_instance(cls)? => Err(PyTypeError::new_err(format!(
+                "Serialized {} can't be loaded as {}",
+                obj.get_type().name()?,
+                cls.name()?
+            ))),
+            _ => Ok(obj),
+        }
+    }
+
+    fn read_args<'py>(&mut self, py: Python<'py>) -> PyResult<Bound<'py, PyTuple>> {
+        let len = self.u32()?;
+        let args = (0..len)
+            .map(|_| self.read_arg(py))
+            .collect::<PyResult<Vec<_>>>()?;
+        Ok(PyTuple::new_bound(py, args))
+    }
+
+    fn read_arg<'py>(&mut self, py: Python<'py>) -> PyResult<Bound<'py, PyAny>> {
+        Ok(match self.u8()? {
+            0 => py.None().into_bound(py),
+            1 => (self.u8()? != 0).into_py(py).into_bound(py),
+            2 => i64::from_le_bytes(self.take()?).into_py(py).into_bound(py),
+            3 => u64::from_le_bytes(self.take()?).into_py(py).into_bound(py),
+            4 => PyString::new_bound(py, self.str()?).into_any(),
+            5 => self.read_value()?.into_py(py).into_bound(py),
+            6 => PyList::new_bound(py, self.read_args(py)?).into_any(),
+            7 => self.read_args(py)?.into_any(),
+            8 => {
+                let class = recorded_enum(py, self.str()?).ok_or_else(|| self.invalid())?;
+                let value = i64::from_le_bytes(self.take()?);
+                enum_variant(class.as_any(), value)?
+            }
+            9 => self.read_recipe(py, None)?,
+            _ => return Err(self.invalid()),
+        })
+    }
+
+    fn read_value(&mut self) -> PyResult<PyValue> {
+        Ok(match self.u8()? {
+            0 => PyValue::None(None),
+            1 => PyValue::Bool(self.u8()? != 0),
+            2 => PyValue::Int(i64::from_le_bytes(self.take()?)),
+            3 => PyValue::Float(f64::from_le_bytes(self.take()?)),
+            4 => PyValue::String(self.str()?.to_owned()),
+            5 => {
+                let secs = i64::from_le_bytes(self.take()?);
+                let nanos = u32::from_le_bytes(self.take()?);
+                let offset = FixedOffset::east_opt(i32::from_le_bytes(self.take()?));
+                let datetime = DateTime::from_timestamp(secs, nanos);
+                PyValue::DateTimeTz(
+                    datetime
+                        .zip(offset)
+                        .map(|(datetime, offset)| datetime.with_timezone(&offset))
+                        .ok_or_else(|| self.invalid())?,
+                )
+            }
+            6 => {
+                let secs = i64::from_le_bytes(self.take()?);
+                let nanos = u32::from_le_bytes(self.take()?);
+                PyValue::DateTime(
+                    DateTime::from_timestamp(secs, nanos)
+                        .ok_or_else(|| self.invalid())?
+                        .naive_utc(),
+                )
+            }
+            7 => PyValue::Date(
+                NaiveDate::from_num_days_from_ce_opt(i32::from_le_bytes(self.take()?))
+                    .ok_or_else(|| self.invalid())?,
+            ),
+            8 => {
+                let secs = u32::from_le_bytes(self.take()?);
+                let nanos = u32::from_le_bytes(self.take()?);
+                PyValue::Time(
+                    NaiveTime::from_num_seconds_from_midnight_opt(secs, nanos)
+                        .ok_or_else(|| self.invalid())?,
+                )
+            }
+            9 => PyValue::Param(Param(self.str()?.to_owned())),
+            _ => return Err(self.invalid()),
+        })
+    }
+}
+
+fn enum_variant<'py>(class: &Bound<'py, PyAny>, value: i64) -> PyResult<Bound<'py, PyAny>> {
+    for item in class.getattr("__dict__")?.call_method0("values")?.iter()? {
+        let item = item?;
+        if item.is_instance(class)? && item.call_method0("__int__")?.extract::<i64>()? == value {
+            return Ok(item);
+        }
+    }
+    Err(PyValueError::new_err("Invalid serialized statement"))
+}
+
+impl ToArg for bool {
+    fn to_arg(&self) -> Arg {
+        Arg::Bool(*self)
+    }
+}
+
+impl ToArg for u32 {
+    fn to_arg(&self) -> Arg {
+        Arg::UInt(*self as u64)
+    }
+}
+
+impl ToArg for u64 {
+    fn to_arg(&self) -> Arg {
+        Arg::UInt(*self)
+    }
+}
+
+impl ToArg for i64 {
+    fn to_arg(&self) -> Arg {
+        Arg::Int(*self)
+    }
+}
+
+impl ToArg for String {
+    fn to_arg(&self) -> Arg {
+        Arg::Str(self.clone())
+    }
+}
+
+impl ToArg for Ident {
+    fn to_arg(&self) -> Arg {
+        Arg::Ident(self.clone())
+    }
+}
+
+impl ToArg for PyValue {
+    fn to_arg(&self) -> Arg {
+        Arg::Value(self.clone())
+    }
+}
+
+impl<T: ToArg> ToArg for Option<T> {
+    fn to_arg(&self) -> Arg {
+        self.as_ref().map_or(Arg::None, ToArg::to_arg)
+    }
+}
+
+impl<T: ToArg> ToArg for Vec<T> {
+    fn to_arg(&self) -> Arg {
+        Arg::List(self.iter().map(ToArg::to_arg).collect())
+    }
+}
+
+impl<A: ToArg, B: ToArg> ToArg for (A, B) {
+    fn to_arg(&self) -> Arg {
+        Arg::Tuple(vec![self.0.to_arg(), self.1.to_arg()])
+    }
+}
+
+macro_rules! recorded_to_arg {
+    ($($class:ty),*) => {
+        $(impl ToArg for $class {
+            fn to_arg(&self) -> Arg {
+                Arg::Object(self.1.clone())
+            }
+        })*
+    };
+}
+
+recorded_to_arg!(
+    SimpleExpr,
+    Expr,
+    Condition,
+    CaseStatement,
+    SelectStatement,
+    OnConflict,
+    Column,
+    IndexCreateStatement,
+    ForeignKeyCreateStatement
+);
+
+macro_rules! enum_to_arg {
+    ($($class:ident),*) => {
+        $(impl ToArg for $class {
+            fn to_arg(&self) -> Arg {
+                Arg::Enum(stringify!($class), self.clone() as i64)
+            }
+        })*
+    };
+}
+
+enum_to_arg!(
+    OrderBy,
+    NullsOrder,
+    UnionType,
+    LockType,
+    LockBehavior,
+    IndexType,
+    ColumnType,
+    ForeignKeyAction
+);
+
+impl ToArg for ConditionExpression {
+    fn to_arg(&self) -> Arg {
+        match self {
+            ConditionExpression::Condition(cond) => cond.to_arg(),
+            ConditionExpression::SimpleExpr(expr) => expr.to_arg(),
+        }
+    }
+}
+
+impl ToArg for IntoSimpleExpr {
+    fn to_arg(&self) -> Arg {
+        match self {
+            IntoSimpleExpr::SimpleExpr(expr) => expr.to_arg(),
+            IntoSimpleExpr::Expr(expr) => expr.to_arg(),
+            IntoSimpleExpr::CaseStatement(case) => case.to_arg(),
+        }
+    }
+}
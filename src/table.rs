@@ -1,6 +1,11 @@
-use pyo3::{pyclass, pymethods, PyRefMut};
+use pyo3::{
+    pyclass, pymethods,
+    types::{PyBytes, PyTuple, PyType},
+    Bound, PyAny, PyRefMut, PyResult, Python,
+};
 use sea_query::{
     backend::{MysqlQueryBuilder, PostgresQueryBuilder, SqliteQueryBuilder},
+    expr::SimpleExpr as SeaSimpleExpr,
     table::{
         ColumnDef, TableAlterStatement as SeaTableAlterStatement,
         TableCreateStatement as SeaTableCreateStatement,
@@ -8,33 +13,36 @@ use sea_query::{
         TableRenameStatement as SeaTableRenameStatement,
         TableTruncateStatement as SeaTableTruncateStatement,
     },
-    Alias,
 };
 
 use crate::{
     expr::{Expr, SimpleExpr},
     foreign_key::ForeignKeyCreateStatement,
+    iden::Ident,
     index::IndexCreateStatement,
+    metrics::{self, Kind},
+    recipe::{Recipe, ToArg},
     types::{ColumnType, DBEngine},
 };
 
 #[pyclass]
 #[derive(Clone)]
-pub struct Column(ColumnDef);
+pub struct Column(ColumnDef, pub(crate) Recipe);
 
 #[pymethods]
 impl Column {
     #[new]
-    fn new(name: &str) -> Self {
-        Self(ColumnDef::new(Alias::new(name)))
+    fn new(name: Ident) -> Self {
+        let recipe = Recipe::new("Column", || vec![name.to_arg()]);
+        Self(ColumnDef::new(name), recipe)
     }
 
     #[staticmethod]
-    fn new_with_type(name: &str, column_type: ColumnType) -> Self {
-        Self(ColumnDef::new_with_type(
-            Alias::new(name),
-            column_type.into(),
-        ))
+    fn new_with_type(name: Ident, column_type: ColumnType) -> Self {
+        let recipe = Recipe::constructor("Column", "new_with_type", || {
+            vec![name.to_arg(), column_type.to_arg()]
+        });
+        Self(ColumnDef::new_with_type(name, column_type.into()), recipe)
     }
 
     fn get_name(&self) -> String {
@@ -46,121 +54,146 @@ impl Column {
     }
 
     fn not_null(mut slf: PyRefMut<Self>) -> PyRefMut<Self> {
+        slf.1.record("not_null", || vec![]);
         slf.0.not_null();
         slf
     }
 
     fn null(mut slf: PyRefMut<Self>) -> PyRefMut<Self> {
+        slf.1.record("null", || vec![]);
         slf.0.null();
         slf
     }
 
     fn default(mut slf: PyRefMut<Self>, mut expr: Expr) -> PyRefMut<Self> {
+        slf.1.record("default", || vec![expr.to_arg()]);
         slf.0.default(expr.take());
         slf
     }
 
     fn auto_increment(mut slf: PyRefMut<Self>) -> PyRefMut<Self> {
+        slf.1.record("auto_increment", || vec![]);
         slf.0.auto_increment();
         slf
     }
 
     fn unique(mut slf: PyRefMut<Self>) -> PyRefMut<Self> {
+        slf.1.record("unique", || vec![]);
         slf.0.unique_key();
         slf
     }
 
     fn primary_key(mut slf: PyRefMut<Self>) -> PyRefMut<Self> {
+        slf.1.record("primary_key", || vec![]);
         slf.0.primary_key();
         slf
     }
 
     fn char(mut slf: PyRefMut<Self>) -> PyRefMut<Self> {
+        slf.1.record("char", || vec![]);
         slf.0.char();
         slf
     }
 
     fn char_len(mut slf: PyRefMut<Self>, length: u32) -> PyRefMut<Self> {
+        slf.1.record("char_len", || vec![length.to_arg()]);
         slf.0.char_len(length);
         slf
     }
 
     fn string(mut slf: PyRefMut<Self>) -> PyRefMut<Self> {
+        slf.1.record("string", || vec![]);
         slf.0.string();
         slf
     }
 
     fn string_len(mut slf: PyRefMut<Self>, length: u32) -> PyRefMut<Self> {
+        slf.1.record("string_len", || vec![length.to_arg()]);
         slf.0.string_len(length);
         slf
     }
 
     fn text(mut slf: PyRefMut<Self>) -> PyRefMut<Self> {
+        slf.1.record("text", || vec![]);
         slf.0.text();
         slf
     }
 
     fn tiny_integer(mut slf: PyRefMut<Self>) -> PyRefMut<Self> {
+        slf.1.record("tiny_integer", || vec![]);
         slf.0.tiny_integer();
         slf
     }
 
     fn small_integer(mut slf: PyRefMut<Self>) -> PyRefMut<Self> {
+        slf.1.record("small_integer", || vec![]);
         slf.0.small_integer();
         slf
     }
 
     fn integer(mut slf: PyRefMut<Self>) -> PyRefMut<Self> {
+        slf.1.record("integer", || vec![]);
         slf.0.integer();
         slf
     }
 
     fn big_integer(mut slf: PyRefMut<Self>) -> PyRefMut<Self> {
+        slf.1.record("big_integer", || vec![]);
         slf.0.big_integer();
         slf
     }
 
     fn tiny_unsigned(mut slf: PyRefMut<Self>) -> PyRefMut<Self> {
+        slf.1.record("tiny_unsigned", || vec![]);
         slf.0.tiny_unsigned();
         slf
     }
 
     fn small_unsigned(mut slf: PyRefMut<Self>) -> PyRefMut<Self> {
+        slf.1.record("small_unsigned", || vec![]);
         slf.0.small_unsigned();
         slf
     }
 
     fn unsigned(mut slf: PyRefMut<Self>) -> PyRefMut<Self> {
+        slf.1.record("unsigned", || vec![]);
         slf.0.unsigned();
         slf
     }
 
     fn big_unsigned(mut slf: PyRefMut<Self>) -> PyRefMut<Self> {
+        slf.1.record("big_unsigned", || vec![]);
         slf.0.big_unsigned();
         slf
     }
 
     fn float(mut slf: PyRefMut<Self>) -> PyRefMut<Self> {
+        slf.1.record("float", || vec![]);
         slf.0.float();
         slf
     }
 
     fn double(mut slf: PyRefMut<Self>) -> PyRefMut<Self> {
+        slf.1.record("double", || vec![]);
         slf.0.double();
         slf
     }
 
     fn decimal(mut slf: PyRefMut<Self>) -> PyRefMut<Self> {
+        slf.1.record("decimal", || vec![]);
         slf.0.decimal();
         slf
     }
 
     fn decimal_len(mut slf: PyRefMut<Self>, precision: u32, scale: u32) -> PyRefMut<Self> {
+        slf.1
+            .record("decimal_len", || vec![precision.to_arg(), scale.to_arg()]);
         slf.0.decimal_len(precision, scale);
         slf
     }
 
     fn datetime(mut slf: PyRefMut<Self>) -> PyRefMut<Self> {
+        slf.1.record("datetime", || vec![]);
         slf.0.date_time();
         slf
     }
@@ -168,46 +201,55 @@ impl Column {
     // TODO: Add interval
 
     fn timestamp(mut slf: PyRefMut<Self>) -> PyRefMut<Self> {
+        slf.1.record("timestamp", || vec![]);
         slf.0.timestamp();
         slf
     }
 
     fn timestamp_with_tz(mut slf: PyRefMut<Self>) -> PyRefMut<Self> {
+        slf.1.record("timestamp_with_tz", || vec![]);
         slf.0.timestamp_with_time_zone();
         slf
     }
 
     fn date(mut slf: PyRefMut<Self>) -> PyRefMut<Self> {
+        slf.1.record("date", || vec![]);
         slf.0.date();
         slf
     }
 
     fn time(mut slf: PyRefMut<Self>) -> PyRefMut<Self> {
+        slf.1.record("time", || vec![]);
         slf.0.time();
         slf
     }
 
     fn blob(mut slf: PyRefMut<Self>) -> PyRefMut<Self> {
+        slf.1.record("blob", || vec![]);
         slf.0.blob();
         slf
     }
 
     fn boolean(mut slf: PyRefMut<Self>) -> PyRefMut<Self> {
+        slf.1.record("boolean", || vec![]);
         slf.0.boolean();
         slf
     }
 
     fn json(mut slf: PyRefMut<Self>) -> PyRefMut<Self> {
+        slf.1.record("json", || vec![]);
         slf.0.json();
         slf
     }
 
     fn jsonb(mut slf: PyRefMut<Self>) -> PyRefMut<Self> {
+        slf.1.record("jsonb", || vec![]);
         slf.0.json_binary();
         slf
     }
 
     fn uuid(mut slf: PyRefMut<Self>) -> PyRefMut<Self> {
+        slf.1.record("uuid", || vec![]);
         slf.0.uuid();
         slf
     }
@@ -215,53 +257,77 @@ impl Column {
     // TODO: Add array
 
     fn check(mut slf: PyRefMut<Self>, expr: SimpleExpr) -> PyRefMut<Self> {
-        slf.0.check(expr.0);
+        slf.1.record("check", || vec![expr.to_arg()]);
+        slf.0.check(SeaSimpleExpr::from(expr));
         slf
     }
 
     fn comment(mut slf: PyRefMut<Self>, comment: String) -> PyRefMut<Self> {
+        slf.1.record("comment", || vec![comment.to_arg()]);
         slf.0.comment(comment);
         slf
     }
+
+    fn to_bytes<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyBytes>> {
+        self.1.to_bytes(py)
+    }
+
+    #[classmethod]
+    fn from_bytes<'py>(cls: &Bound<'py, PyType>, data: &[u8]) -> PyResult<Bound<'py, PyAny>> {
+        Recipe::from_bytes(cls, data)
+    }
+
+    fn __reduce__<'py>(slf: &Bound<'py, Self>) -> PyResult<Bound<'py, PyTuple>> {
+        slf.borrow().1.reduce(slf.as_any())
+    }
 }
 
 #[pyclass(subclass)]
-pub struct TableCreateStatement(SeaTableCreateStatement);
+pub struct TableCreateStatement(SeaTableCreateStatement, pub(crate) Recipe);
 
 #[pymethods]
 impl TableCreateStatement {
     #[new]
     fn new() -> Self {
-        Self(SeaTableCreateStatement::new())
+        Self(
+            SeaTableCreateStatement::new(),
+            Recipe::new("TableCreateStatement", || vec![]),
+        )
     }
 
-    fn name(mut slf: PyRefMut<Self>, name: String) -> PyRefMut<Self> {
-        slf.0.table(Alias::new(name));
+    fn name(mut slf: PyRefMut<Self>, name: Ident) -> PyRefMut<Self> {
+        slf.1.record("name", || vec![name.to_arg()]);
+        slf.0.table(name);
         slf
     }
 
     fn if_not_exists(mut slf: PyRefMut<Self>) -> PyRefMut<Self> {
+        slf.1.record("if_not_exists", || vec![]);
         slf.0.if_not_exists();
         slf
     }
 
     fn column(mut slf: PyRefMut<'_, Self>, column: Column) -> PyRefMut<Self> {
+        slf.1.record("column", || vec![column.to_arg()]);
         slf.0.col(column.0);
         slf
     }
 
     fn check(mut slf: PyRefMut<Self>, expr: SimpleExpr) -> PyRefMut<Self> {
-        slf.0.check(expr.0);
+        slf.1.record("check", || vec![expr.to_arg()]);
+        slf.0.check(SeaSimpleExpr::from(expr));
         slf
     }
 
     fn index(mut slf: PyRefMut<Self>, mut index: IndexCreateStatement) -> PyRefMut<Self> {
+        slf.1.record("index", || vec![index.to_arg()]);
         // TODO: Mysql only
         slf.0.index(&mut index.0);
         slf
     }
 
     fn primary_key(mut slf: PyRefMut<Self>, mut index: IndexCreateStatement) -> PyRefMut<Self> {
+        slf.1.record("primary_key", || vec![index.to_arg()]);
         slf.0.index(&mut index.0);
         slf
     }
@@ -270,71 +336,113 @@ impl TableCreateStatement {
         mut slf: PyRefMut<Self>,
         mut foreign_key: ForeignKeyCreateStatement,
     ) -> PyRefMut<Self> {
+        slf.1.record("foreign_key", || vec![foreign_key.to_arg()]);
         slf.0.foreign_key(&mut foreign_key.0);
         slf
     }
 
     fn extra(mut slf: PyRefMut<Self>, extra: String) -> PyRefMut<Self> {
+        slf.1.record("extra", || vec![extra.to_arg()]);
         slf.0.extra(extra);
         slf
     }
 
     fn comment(mut slf: PyRefMut<Self>, comment: String) -> PyRefMut<Self> {
+        slf.1.record("comment", || vec![comment.to_arg()]);
         slf.0.comment(comment);
         slf
     }
 
-    fn to_string(&self, builder: &DBEngine) -> String {
-        match builder {
-            DBEngine::Mysql => self.0.to_string(MysqlQueryBuilder),
-            DBEngine::Postgres => self.0.to_string(PostgresQueryBuilder),
-            DBEngine::Sqlite => self.0.to_string(SqliteQueryBuilder),
-        }
+    fn fingerprint(&self) -> PyResult<u128> {
+        Ok(self.1.recorded()?.fingerprint())
+    }
+
+    fn __hash__(&self) -> u64 {
+        self.1.hash()
+    }
+
+    fn __eq__(&self, other: &Self) -> bool {
+        self.1.same(&other.1)
+    }
+
+    fn to_bytes<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyBytes>> {
+        self.1.to_bytes(py)
+    }
+
+    #[classmethod]
+    fn from_bytes<'py>(cls: &Bound<'py, PyType>, data: &[u8]) -> PyResult<Bound<'py, PyAny>> {
+        Recipe::from_bytes(cls, data)
+    }
+
+    fn __reduce__<'py>(slf: &Bound<'py, Self>) -> PyResult<Bound<'py, PyTuple>> {
+        slf.borrow().1.reduce(slf.as_any())
+    }
+
+    fn to_string(&self, py: Python, builder: &DBEngine) -> String {
+        py.allow_threads(|| {
+            metrics::timed(
+                Kind::Ddl,
+                builder,
+                || self.1.fingerprint(),
+                || match builder {
+                    DBEngine::Mysql => self.0.to_string(MysqlQueryBuilder),
+                    DBEngine::Postgres => self.0.to_string(PostgresQueryBuilder),
+                    DBEngine::Sqlite => self.0.to_string(SqliteQueryBuilder),
+                },
+            )
+        })
     }
 }
 
 #[pyclass(subclass)]
-pub struct TableAlterStatement(SeaTableAlterStatement);
+pub struct TableAlterStatement(SeaTableAlterStatement, pub(crate) Recipe);
 
 #[pymethods]
 impl TableAlterStatement {
     #[new]
     fn new() -> Self {
-        Self(SeaTableAlterStatement::new())
+        Self(
+            SeaTableAlterStatement::new(),
+            Recipe::new("TableAlterStatement", || vec![]),
+        )
     }
 
-    fn table(mut slf: PyRefMut<Self>, name: String) -> PyRefMut<Self> {
-        slf.0.table(Alias::new(name));
+    fn table(mut slf: PyRefMut<Self>, name: Ident) -> PyRefMut<Self> {
+        slf.1.record("table", || vec![name.to_arg()]);
+        slf.0.table(name);
         slf
     }
 
     fn add_column(mut slf: PyRefMut<Self>, column: Column) -> PyRefMut<Self> {
+        slf.1.record("add_column", || vec![column.to_arg()]);
         slf.0.add_column(column.0);
         slf
     }
 
     fn add_column_if_not_exists(mut slf: PyRefMut<Self>, column: Column) -> PyRefMut<Self> {
+        slf.1
+            .record("add_column_if_not_exists", || vec![column.to_arg()]);
         slf.0.add_column_if_not_exists(column.0);
         slf
     }
 
     fn modify_column(mut slf: PyRefMut<Self>, column: Column) -> PyRefMut<Self> {
+        slf.1.record("modify_column", || vec![column.to_arg()]);
         slf.0.modify_column(column.0);
         slf
     }
 
-    fn rename_column(
-        mut slf: PyRefMut<Self>,
-        from_name: String,
-        to_name: String,
-    ) -> PyRefMut<Self> {
-        slf.0
-            .rename_column(Alias::new(from_name), Alias::new(to_name));
+    fn rename_column(mut slf: PyRefMut<Self>, from_name: Ident, to_name: Ident) -> PyRefMut<Self> {
+        slf.1.record("rename_column", || {
+            vec![from_name.to_arg(), to_name.to_arg()]
+        });
+        slf.0.rename_column(from_name, to_name);
         slf
     }
 
-    fn drop_column(mut slf: PyRefMut<Self>, name: String) -> PyRefMut<Self> {
-        slf.0.drop_column(Alias::new(name));
+    fn drop_column(mut slf: PyRefMut<Self>, name: Ident) -> PyRefMut<Self> {
+        slf.1.record("drop_column", || vec![name.to_arg()]);
+        slf.0.drop_column(name);
         slf
     }
 
@@ -342,108 +450,255 @@ impl TableAlterStatement {
         mut slf: PyRefMut<Self>,
         foreign_key: ForeignKeyCreateStatement,
     ) -> PyRefMut<Self> {
+        slf.1
+            .record("add_foreign_key", || vec![foreign_key.to_arg()]);
         slf.0.add_foreign_key(foreign_key.0.get_foreign_key());
         slf
     }
 
-    fn drop_foreign_key(mut slf: PyRefMut<Self>, name: String) -> PyRefMut<Self> {
-        slf.0.drop_foreign_key(Alias::new(name));
+    fn drop_foreign_key(mut slf: PyRefMut<Self>, name: Ident) -> PyRefMut<Self> {
+        slf.1.record("drop_foreign_key", || vec![name.to_arg()]);
+        slf.0.drop_foreign_key(name);
         slf
     }
 
-    fn to_string(&self, builder: &DBEngine) -> String {
-        match builder {
-            DBEngine::Mysql => self.0.to_string(MysqlQueryBuilder),
-            DBEngine::Postgres => self.0.to_string(PostgresQueryBuilder),
-            DBEngine::Sqlite => self.0.to_string(SqliteQueryBuilder),
-        }
+    fn fingerprint(&self) -> PyResult<u128> {
+        Ok(self.1.recorded()?.fingerprint())
+    }
+
+    fn __hash__(&self) -> u64 {
+        self.1.hash()
+    }
+
+    fn __eq__(&self, other: &Self) -> bool {
+        self.1.same(&other.1)
+    }
+
+    fn to_bytes<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyBytes>> {
+        self.1.to_bytes(py)
+    }
+
+    #[classmethod]
+    fn from_bytes<'py>(cls: &Bound<'py, PyType>, data: &[u8]) -> PyResult<Bound<'py, PyAny>> {
+        Recipe::from_bytes(cls, data)
+    }
+
+    fn __reduce__<'py>(slf: &Bound<'py, Self>) -> PyResult<Bound<'py, PyTuple>> {
+        slf.borrow().1.reduce(slf.as_any())
+    }
+
+    fn to_string(&self, py: Python, builder: &DBEngine) -> String {
+        py.allow_threads(|| {
+            metrics::timed(
+                Kind::Ddl,
+                builder,
+                || self.1.fingerprint(),
+                || match builder {
+                    DBEngine::Mysql => self.0.to_string(MysqlQueryBuilder),
+                    DBEngine::Postgres => self.0.to_string(PostgresQueryBuilder),
+                    DBEngine::Sqlite => self.0.to_string(SqliteQueryBuilder),
+                },
+            )
+        })
     }
 }
 
 #[pyclass(subclass)]
-pub struct TableDropStatement(SeaTableDropStatement);
+pub struct TableDropStatement(SeaTableDropStatement, pub(crate) Recipe);
 
 #[pymethods]
 impl TableDropStatement {
     #[new]
     fn new() -> Self {
-        Self(SeaTableDropStatement::new())
+        Self(
+            SeaTableDropStatement::new(),
+            Recipe::new("TableDropStatement", || vec![]),
+        )
     }
 
-    fn table(mut slf: PyRefMut<Self>, name: String) -> PyRefMut<Self> {
-        slf.0.table(Alias::new(name));
+    fn table(mut slf: PyRefMut<Self>, name: Ident) -> PyRefMut<Self> {
+        slf.1.record("table", || vec![name.to_arg()]);
+        slf.0.table(name);
         slf
     }
 
     fn if_exists(mut slf: PyRefMut<Self>) -> PyRefMut<Self> {
+        slf.1.record("if_exists", || vec![]);
         slf.0.if_exists();
         slf
     }
 
     fn restrict(mut slf: PyRefMut<Self>) -> PyRefMut<Self> {
+        slf.1.record("restrict", || vec![]);
         slf.0.restrict();
         slf
     }
 
     fn cascade(mut slf: PyRefMut<Self>) -> PyRefMut<Self> {
+        slf.1.record("cascade", || vec![]);
         slf.0.cascade();
         slf
     }
 
-    fn to_string(&self, builder: &DBEngine) -> String {
-        match builder {
-            DBEngine::Mysql => self.0.to_string(MysqlQueryBuilder),
-            DBEngine::Postgres => self.0.to_string(PostgresQueryBuilder),
-            DBEngine::Sqlite => self.0.to_string(SqliteQueryBuilder),
-        }
+    fn fingerprint(&self) -> PyResult<u128> {
+        Ok(self.1.recorded()?.fingerprint())
+    }
+
+    fn __hash__(&self) -> u64 {
+        self.1.hash()
+    }
+
+    fn __eq__(&self, other: &Self) -> bool {
+        self.1.same(&other.1)
+    }
+
+    fn to_bytes<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyBytes>> {
+        self.1.to_bytes(py)
+    }
+
+    #[classmethod]
+    fn from_bytes<'py>(cls: &Bound<'py, PyType>, data: &[u8]) -> PyResult<Bound<'py, PyAny>> {
+        Recipe::from_bytes(cls, data)
+    }
+
+    fn __reduce__<'py>(slf: &Bound<'py, Self>) -> PyResult<Bound<'py, PyTuple>> {
+        slf.borrow().1.reduce(slf.as_any())
+    }
+
+    fn to_string(&self, py: Python, builder: &DBEngine) -> String {
+        py.allow_threads(|| {
+            metrics::timed(
+                Kind::Ddl,
+                builder,
+                || self.1.fingerprint(),
+                || match builder {
+                    DBEngine::Mysql => self.0.to_string(MysqlQueryBuilder),
+                    DBEngine::Postgres => self.0.to_string(PostgresQueryBuilder),
+                    DBEngine::Sqlite => self.0.to_string(SqliteQueryBuilder),
+                },
+            )
+        })
     }
 }
 
 #[pyclass(subclass)]
-pub struct TableRenameStatement(SeaTableRenameStatement);
+pub struct TableRenameStatement(SeaTableRenameStatement, pub(crate) Recipe);
 
 #[pymethods]
 impl TableRenameStatement {
     #[new]
     fn new() -> Self {
-        Self(SeaTableRenameStatement::new())
+        Self(
+            SeaTableRenameStatement::new(),
+            Recipe::new("TableRenameStatement", || vec![]),
+        )
     }
 
-    fn table(mut slf: PyRefMut<Self>, from_name: String, to_name: String) -> PyRefMut<Self> {
-        slf.0.table(Alias::new(from_name), Alias::new(to_name));
+    fn table(mut slf: PyRefMut<Self>, from_name: Ident, to_name: Ident) -> PyRefMut<Self> {
+        slf.1
+            .record("table", || vec![from_name.to_arg(), to_name.to_arg()]);
+        slf.0.table(from_name, to_name);
         slf
     }
 
-    fn to_string(&self, builder: &DBEngine) -> String {
-        match builder {
-            DBEngine::Mysql => self.0.to_string(MysqlQueryBuilder),
-            DBEngine::Postgres => self.0.to_string(PostgresQueryBuilder),
-            DBEngine::Sqlite => self.0.to_string(SqliteQueryBuilder),
-        }
+    fn fingerprint(&self) -> PyResult<u128> {
+        Ok(self.1.recorded()?.fingerprint())
+    }
+
+    fn __hash__(&self) -> u64 {
+        self.1.hash()
+    }
+
+    fn __eq__(&self, other: &Self) -> bool {
+        self.1.same(&other.1)
+    }
+
+    fn to_bytes<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyBytes>> {
+        self.1.to_bytes(py)
+    }
+
+    #[classmethod]
+    fn from_bytes<'py>(cls: &Bound<'py, PyType>, data: &[u8]) -> PyResult<Bound<'py, PyAny>> {
+        Recipe::from_bytes(cls, data)
+    }
+
+    fn __reduce__<'py>(slf: &Bound<'py, Self>) -> PyResult<Bound<'py, PyTuple>> {
+        slf.borrow().1.reduce(slf.as_any())
+    }
+
+    fn to_string(&self, py: Python, builder: &DBEngine) -> String {
+        py.allow_threads(|| {
+            metrics::timed(
+                Kind::Ddl,
+                builder,
+                || self.1.fingerprint(),
+                || match builder {
+                    DBEngine::Mysql => self.0.to_string(MysqlQueryBuilder),
+                    DBEngine::Postgres => self.0.to_string(PostgresQueryBuilder),
+                    DBEngine::Sqlite => self.0.to_string(SqliteQueryBuilder),
+                },
+            )
+        })
     }
 }
 
 #[pyclass(subclass)]
-pub struct TableTruncateStatement(SeaTableTruncateStatement);
+pub struct TableTruncateStatement(SeaTableTruncateStatement, pub(crate) Recipe);
 
 #[pymethods]
 impl TableTruncateStatement {
     #[new]
     fn new() -> Self {
-        Self(SeaTableTruncateStatement::new())
+        Self(
+            SeaTableTruncateStatement::new(),
+            Recipe::new("TableTruncateStatement", || vec![]),
+        )
     }
 
-    fn table(mut slf: PyRefMut<Self>, name: String) -> PyRefMut<Self> {
-        slf.0.table(Alias::new(name));
+    fn table(mut slf: PyRefMut<Self>, name: Ident) -> PyRefMut<Self> {
+        slf.1.record("table", || vec![name.to_arg()]);
+        slf.0.table(name);
         slf
     }
 
-    fn to_string(&self, builder: &DBEngine) -> String {
-        match builder {
-            DBEngine::Mysql => self.0.to_string(MysqlQueryBuilder),
-            DBEngine::Postgres => self.0.to_string(PostgresQueryBuilder),
-            DBEngine::Sqlite => self.0.to_string(SqliteQueryBuilder),
-        }
+    fn fingerprint(&self) -> PyResult<u128> {
+        Ok(self.1.recorded()?.fingerprint())
+    }
+
+    fn __hash__(&self) -> u64 {
+        self.1.hash()
+    }
+
+    fn __eq__(&self, other: &Self) -> bool {
+        self.1.same(&other.1)
+    }
+
+    fn to_bytes<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyBytes>> {
+        self.1.to_bytes(py)
+    }
+
+    #[classmethod]
+    fn from_bytes<'py>(cls: &Bound<'py, PyType>, data: &[u8]) -> PyResult<Bound<'py, PyAny>> {
+        Recipe::from_bytes(cls, data)
+    }
+
+    fn __reduce__<'py>(slf: &Bound<'py, Self>) -> PyResult<Bound<'py, PyTuple>> {
+        slf.borrow().1.reduce(slf.as_any())
+    }
+
+    fn to_string(&self, py: Python, builder: &DBEngine) -> String {
+        py.allow_threads(|| {
+            metrics::timed(
+                Kind::Ddl,
+                builder,
+                || self.1.fingerprint(),
+                || match builder {
+                    DBEngine::Mysql => self.0.to_string(MysqlQueryBuilder),
+                    DBEngine::Postgres => self.0.to_string(PostgresQueryBuilder),
+                    DBEngine::Sqlite => self.0.to_string(SqliteQueryBuilder),
+                },
+            )
+        })
     }
 }
 
@@ -477,3 +732,32 @@ impl Table {
         TableTruncateStatement::new()
     }
 }
+
+bound_statements!(schema TableCreateStatement("TableCreateStatement") {
+    Mysql("sea_query.mysql"): MysqlTableCreateStatement,
+    Postgres("sea_query.postgres"): PostgresTableCreateStatement,
+    Sqlite("sea_query.sqlite"): SqliteTableCreateStatement,
+});
+
+bound_statements!(schema TableAlterStatement("TableAlterStatement") {
+    Mysql("sea_query.mysql"): MysqlTableAlterStatement,
+    Postgres("sea_query.postgres"): PostgresTableAlterStatement,
+    Sqlite("sea_query.sqlite"): SqliteTableAlterStatement,
+});
+
+bound_statements!(schema TableDropStatement("TableDropStatement") {
+    Mysql("sea_query.mysql"): MysqlTableDropStatement,
+    Postgres("sea_query.postgres"): PostgresTableDropStatement,
+    Sqlite("sea_query.sqlite"): SqliteTableDropStatement,
+});
+
+bound_statements!(schema TableRenameStatement("TableRenameStatement") {
+    Mysql("sea_query.mysql"): MysqlTableRenameStatement,
+    Postgres("sea_query.postgres"): PostgresTableRenameStatement,
+    Sqlite("sea_query.sqlite"): SqliteTableRenameStatement,
+});
+
+bound_statements!(schema TableTruncateStatement("TableTruncateStatement") {
+    Mysql("sea_query.mysql"): MysqlTableTruncateStatement,
+    Postgres("sea_query.postgres"): PostgresTableTruncateStatement,
+});
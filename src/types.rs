@@ -1,5 +1,18 @@
+use std::{
+    collections::HashMap,
+    sync::{OnceLock, PoisonError, RwLock},
+};
+
 use chrono::{DateTime, FixedOffset, NaiveDate, NaiveDateTime, NaiveTime};
-use pyo3::{pyclass, FromPyObject, IntoPy, PyObject, Python};
+use pyo3::{
+    exceptions::PyTypeError,
+    pyclass, pymethods,
+    types::{
+        PyAnyMethods, PyBool, PyBoolMethods, PyDate, PyDateTime, PyFloat, PyFloatMethods, PyLong,
+        PyString, PyStringMethods, PyTime, PyTypeMethods, PyTzInfoAccess,
+    },
+    Bound, FromPyObject, IntoPy, PyAny, PyObject, PyResult, Python, ToPyObject,
+};
 use sea_query::{
     backend::{MysqlQueryBuilder, PostgresQueryBuilder, QueryBuilder, SqliteQueryBuilder},
     index::{IndexOrder, IndexType as SeaIndexType},
@@ -10,7 +23,7 @@ use sea_query::{
 };
 
 #[pyclass(eq, eq_int)]
-#[derive(PartialEq)]
+#[derive(Clone, Copy, PartialEq)]
 pub enum DBEngine {
     Mysql,
     Postgres,
@@ -18,16 +31,95 @@ pub enum DBEngine {
 }
 
 impl DBEngine {
-    pub fn query_builder(&self) -> Box<dyn QueryBuilder> {
+    pub fn query_builder(&self) -> &'static dyn QueryBuilder {
+        match self {
+            DBEngine::Mysql => &MysqlQueryBuilder,
+            DBEngine::Postgres => &PostgresQueryBuilder,
+            DBEngine::Sqlite => &SqliteQueryBuilder,
+        }
+    }
+
+    /// Maximum number of bind parameters the engine accepts in one statement.
+    ///
+    /// SQLite builds older than 3.32 only accept 999.
+    pub fn max_params(&self) -> usize {
+        match self {
+            DBEngine::Mysql => 65_535,
+            DBEngine::Postgres => 65_535,
+            DBEngine::Sqlite => 32_766,
+        }
+    }
+
+    /// Default size limit for one statement, MySQL's `max_allowed_packet`.
+    pub fn max_bytes(&self) -> Option<usize> {
         match self {
-            DBEngine::Mysql => Box::new(MysqlQueryBuilder),
-            DBEngine::Postgres => Box::new(PostgresQueryBuilder),
-            DBEngine::Sqlite => Box::new(SqliteQueryBuilder),
+            DBEngine::Mysql => Some(4 * 1024 * 1024),
+            DBEngine::Postgres | DBEngine::Sqlite => None,
+        }
+    }
+}
+
+/// A named placeholder filled in when the statement is built.
+#[pyclass(frozen)]
+#[derive(Clone, PartialEq)]
+pub struct Param(pub(crate) String);
+
+#[pymethods]
+impl Param {
+    #[getter]
+    fn name(&self) -> &str {
+        &self.0
+    }
+
+    fn __repr__(&self) -> String {
+        format!("Param({:?})", self.0)
+    }
+}
+
+// Placeholders travel through the AST as unsigned values holding an id into
+// this table. Python values are never converted to unsigned values, and
+// sea-query only adds values of its own as big unsigned ones, so an id cannot
+// be mistaken for a value.
+#[derive(Default)]
+struct ParamNames {
+    ids: HashMap<Box<str>, u32>,
+    names: Vec<Box<str>>,
+}
+
+static PARAM_NAMES: OnceLock<RwLock<ParamNames>> = OnceLock::new();
+
+fn param_names() -> &'static RwLock<ParamNames> {
+    PARAM_NAMES.get_or_init(Default::default)
+}
+
+impl Param {
+    fn id(&self) -> u32 {
+        let table = param_names();
+        if let Some(id) = table
+            .read()
+            .unwrap_or_else(PoisonError::into_inner)
+            .ids
+            .get(self.0.as_str())
+        {
+            return *id;
         }
+
+        let mut table = table.write().unwrap_or_else(PoisonError::into_inner);
+        let next = table.names.len() as u32;
+        let id = *table.ids.entry(self.0.as_str().into()).or_insert(next);
+        if id == next {
+            table.names.push(self.0.as_str().into());
+        }
+        id
+    }
+
+    fn from_id(id: u32) -> Self {
+        let table = param_names().read().unwrap_or_else(PoisonError::into_inner);
+        Param(table.names[id as usize].to_string())
     }
 }
 
-#[derive(FromPyObject, Clone)]
+#[derive(Clone, PartialEq)]
 pub enum PyValue {
     Bool(bool),
     Int(i64),
@@ -37,9 +129,81 @@ pub enum PyValue {
     Date(NaiveDate),
     Time(NaiveTime),
     String(String),
+    Param(Param),
     None(Option<bool>),
 }
 
+impl<'py> FromPyObject<'py> for PyValue {
+    fn extract_bound(ob: &Bound<'py, PyAny>) -> PyResult<Self> {
+        // Look at the exact type first so the common case is a single type
+        // check rather than a chain of failed extractions, each raising.
+        if ob.is_none() {
+            return Ok(PyValue::None(None));
+        }
+        if let Ok(v) = ob.downcast_exact::<PyString>() {
+            return Ok(PyValue::String(v.to_str()?.to_owned()));
+        }
+        if let Ok(v) = ob.downcast_exact::<PyBool>() {
+            return Ok(PyValue::Bool(v.is_true()));
+        }
+        if ob.is_exact_instance_of::<PyLong>() {
+            if let Ok(v) = ob.extract() {
+                return Ok(PyValue::Int(v));
+            }
+        } else if let Ok(v) = ob.downcast_exact::<PyFloat>() {
+            return Ok(PyValue::Float(v.value()));
+        } else if let Ok(v) = ob.downcast_exact::<PyDateTime>() {
+            return if v.get_tzinfo_bound().is_some() {
+                ob.extract().map(PyValue::DateTimeTz)
+            } else {
+                ob.extract().map(PyValue::DateTime)
+            };
+        } else if ob.is_exact_instance_of::<PyDate>() {
+            return ob.extract().map(PyValue::Date);
+        } else if ob.is_exact_instance_of::<PyTime>() {
+            return ob.extract().map(PyValue::Time);
+        } else if let Ok(v) = ob.downcast_exact::<Param>() {
+            return Ok(PyValue::Param(v.get().clone()));
+        }
+        Self::extract_subclass(ob)
+    }
+}
+
+impl PyValue {
+    /// Slow path for subclasses of the supported types (and ints that do not
+    /// fit in an i64), trying each conversion in order.
+    fn extract_subclass(ob: &Bound<'_, PyAny>) -> PyResult<Self> {
+        if let Ok(v) = ob.extract() {
+            return Ok(PyValue::Bool(v));
+        }
+        if let Ok(v) = ob.extract() {
+            return Ok(PyValue::Int(v));
+        }
+        if let Ok(v) = ob.extract() {
+            return Ok(PyValue::Float(v));
+        }
+        if let Ok(v) = ob.extract() {
+            return Ok(PyValue::DateTimeTz(v));
+        }
+        if let Ok(v) = ob.extract() {
+            return Ok(PyValue::DateTime(v));
+        }
+        if let Ok(v) = ob.extract() {
+            return Ok(PyValue::Date(v));
+        }
+        if let Ok(v) = ob.extract() {
+            return Ok(PyValue::Time(v));
+        }
+        if let Ok(v) = ob.extract() {
+            return Ok(PyValue::String(v));
+        }
+        Err(PyTypeError::new_err(format!(
+            "Unsupported value type: '{}'",
+            ob.get_type().name()?
+        )))
+    }
+}
+
 impl From<&PyValue> for Value {
     fn from(value: &PyValue) -> Self {
         match value {
@@ -51,11 +215,21 @@ impl From<&PyValue> for Value {
             PyValue::Date(v) => Value::ChronoDate(Some(Box::new(*v))),
             PyValue::Time(v) => Value::ChronoTime(Some(Box::new(*v))),
             PyValue::String(v) => Value::String(Some(Box::new(v.clone()))),
+            PyValue::Param(v) => Value::Unsigned(Some(v.id())),
             PyValue::None(_) => Value::Bool(None),
         }
     }
 }
 
+impl From<PyValue> for Value {
+    fn from(value: PyValue) -> Self {
+        match value {
+            PyValue::String(v) => Value::String(Some(Box::new(v))),
+            value => Value::from(&value),
+        }
+    }
+}
+
 impl From<&Value> for PyValue {
     fn from(val: &Value) -> Self {
         match val {
@@ -69,6 +243,7 @@ impl From<&Value> for PyValue {
             Value::ChronoDate(v) => PyValue::Date(*v.clone().unwrap()),
             Value::ChronoTime(v) => PyValue::Time(*v.clone().unwrap()),
             Value::String(v) => PyValue::String(*v.clone().unwrap()),
+            Value::Unsigned(Some(id)) => PyValue::Param(Param::from_id(*id)),
             _ => {
                 unimplemented!("Unsupported value type: {:?}", val);
             }
@@ -76,6 +251,20 @@ impl From<&Value> for PyValue {
     }
 }
 
+impl From<Value> for PyValue {
+    fn from(val: Value) -> Self {
+        // Move out of the boxes instead of cloning them.
+        match val {
+            Value::ChronoDateTimeWithTimeZone(Some(v)) => PyValue::DateTimeTz(*v),
+            Value::ChronoDateTime(Some(v)) => PyValue::DateTime(*v),
+            Value::ChronoDate(Some(v)) => PyValue::Date(*v),
+            Value::ChronoTime(Some(v)) => PyValue::Time(*v),
+            Value::String(Some(v)) => PyValue::String(*v),
+            val => PyValue::from(&val),
+        }
+    }
+}
+
 impl IntoPy<PyObject> for PyValue {
     fn into_py(self, py: Python<'_>) -> PyObject {
         match self {
@@ -87,6 +276,25 @@ impl IntoPy<PyObject> for PyValue {
             PyValue::Date(v) => v.into_py(py),
             PyValue::Time(v) => v.into_py(py),
             PyValue::String(v) => v.into_py(py),
+            PyValue::Param(v) => v.into_py(py),
+            PyValue::None(_) => py.None(),
+        }
+    }
+}
+
+// Converts a value without taking it, for outputs shared by the memo.
+impl ToPyObject for PyValue {
+    fn to_object(&self, py: Python<'_>) -> PyObject {
+        match self {
+            PyValue::Bool(v) => v.to_object(py),
+            PyValue::Float(v) => v.to_object(py),
+            PyValue::Int(v) => v.to_object(py),
+            PyValue::DateTimeTz(v) => v.to_object(py),
+            PyValue::DateTime(v) => v.to_object(py),
+            PyValue::Date(v) => v.to_object(py),
+            PyValue::Time(v) => v.to_object(py),
+            PyValue::String(v) => v.to_object(py),
+            PyValue::Param(v) => v.clone().into_py(py),
             PyValue::None(_) => py.None(),
         }
     }
@@ -237,6 +445,36 @@ pub enum ColumnType {
     Uuid,
 }
 
+impl ColumnType {
+    /// The name of the column's PostgreSQL type, to cast to.
+    ///
+    /// Lengths are left out, `char` included as `bpchar` so values aren't
+    /// cut to a single character.
+    pub fn postgres_name(&self) -> &'static str {
+        match self {
+            ColumnType::Char => "bpchar",
+            ColumnType::String => "varchar",
+            ColumnType::Text => "text",
+            ColumnType::TinyInteger | ColumnType::TinyUnsigned => "smallint",
+            ColumnType::SmallInteger | ColumnType::SmallUnsigned => "smallint",
+            ColumnType::Integer | ColumnType::Unsigned => "integer",
+            ColumnType::BigInteger | ColumnType::BigUnsigned => "bigint",
+            ColumnType::Float => "real",
+            ColumnType::Double => "double precision",
+            ColumnType::Decimal => "numeric",
+            ColumnType::DateTime | ColumnType::Timestamp => "timestamp",
+            ColumnType::TimestampWithTz => "timestamp with time zone",
+            ColumnType::Date => "date",
+            ColumnType::Time => "time",
+            ColumnType::Blob => "bytea",
+            ColumnType::Boolean => "bool",
+            ColumnType::Json => "json",
+            ColumnType::Jsonb => "jsonb",
+            ColumnType::Uuid => "uuid",
+        }
+    }
+}
+
 impl From<ColumnType> for SeaColumnType {
     fn from(val: ColumnType) -> Self {
         match val {
@@ -292,3 +292,18 @@ def test_create_foreign_key_query():
         .to_string()
         == "ALTER TABLE `table` ADD CONSTRAINT `fk` FOREIGN KEY (`column`) REFERENCES `ref_table` (`ref_column`)"
     )
+
+
+def test_bound_statements_are_native():
+    from sea_query.query import SelectStatement
+
+    query = PostgresQuery.select().all().from_table("table")
+    assert isinstance(query, SelectStatement)
+    assert not hasattr(query, "__dict__")
+
+    insert = SqliteQuery.insert().into("table").columns(["a"])
+    insert.values_many([[1], [2], [3]])
+    assert insert.build_chunks(max_params=2) == [
+        ('INSERT INTO "table" ("a") VALUES (?), (?)', [1, 2]),
+        ('INSERT INTO "table" ("a") VALUES (?)', [3]),
+    ]
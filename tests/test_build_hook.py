@@ -0,0 +1,69 @@
+import sys
+from typing import Iterator, List
+
+import pytest
+
+from sea_query import (
+    BuildEvent,
+    DBEngine,
+    Expr,
+    Query,
+    clear_build_hook,
+    set_build_hook,
+)
+from sea_query.query import SelectStatement
+
+
+@pytest.fixture
+def events() -> Iterator[List[BuildEvent]]:
+    events: List[BuildEvent] = []
+    yield events
+    clear_build_hook()
+
+
+def select(value: int) -> SelectStatement:
+    return Query.select().all().from_table("t").and_where(Expr.column("a").eq(value))
+
+
+def test_build_hook(events):
+    set_build_hook(events.append)
+    sql, params = select(1).build(DBEngine.Postgres)
+    select(2).build(DBEngine.Postgres)
+
+    first, second = events
+    assert first.kind == "select"
+    assert first.engine == "postgres"
+    assert first.sql_length == len(sql)
+    assert first.params == len(params)
+    assert first.nanos >= 0
+    assert not first.slow
+    assert first.fingerprint == second.fingerprint == select(3).fingerprint()
+
+
+def test_build_hook_sampling(events):
+    set_build_hook(events.append, sample_rate=0.0)
+    select(1).build(DBEngine.Sqlite)
+    assert events == []
+
+    set_build_hook(events.append, sample_rate=0.0, slow_threshold_ns=0)
+    select(1).build(DBEngine.Sqlite)
+    assert [event.slow for event in events] == [True]
+
+    set_build_hook(events.append, sample_rate=0.5)
+    for value in range(1000):
+        select(value).build(DBEngine.Mysql)
+    assert 300 < len(events) - 1 < 700
+
+    with pytest.raises(ValueError):
+        set_build_hook(events.append, sample_rate=2.0)
+
+
+def test_build_hook_errors_do_not_fail_builds(events, monkeypatch):
+    def hook(event):
+        raise RuntimeError("hook failed")
+
+    unraisable: List[sys.UnraisableHookArgs] = []
+    monkeypatch.setattr(sys, "unraisablehook", unraisable.append)
+    set_build_hook(hook)
+    assert select(1).build(DBEngine.Sqlite)[1] == [1]
+    assert isinstance(unraisable[0].exc_value, RuntimeError)
@@ -0,0 +1,91 @@
+from typing import List, Union
+
+import pytest
+
+from sea_query import DBEngine, Expr, Query, build_many
+from sea_query.postgres import Query as PostgresQuery
+from sea_query.query import (
+    DeleteStatement,
+    InsertStatement,
+    SelectStatement,
+    UpdateStatement,
+)
+
+
+def test_build_many_mixed_statements():
+    statements: List[
+        Union[SelectStatement, InsertStatement, UpdateStatement, DeleteStatement]
+    ] = [
+        Query.select().all().from_table("table").and_where(Expr.column("id").eq(1)),
+        Query.insert().into("table").columns(["col1"]).values(["value"]),
+        Query.update()
+        .table("table")
+        .value("col1", 2)
+        .and_where(Expr.column("id").eq(3)),
+        Query.delete().from_table("table").and_where(Expr.column("id").eq(4)),
+    ]
+
+    assert build_many(statements, DBEngine.Postgres) == [
+        statement.build(DBEngine.Postgres) for statement in statements
+    ]
+
+
+def test_build_many_large_batch_keeps_order():
+    statements = [
+        Query.update()
+        .table("table")
+        .value("col1", i)
+        .and_where(Expr.column("id").eq(i))
+        for i in range(5000)
+    ]
+
+    results = build_many(statements, DBEngine.Mysql)
+
+    assert len(results) == 5000
+    assert results[0] == ("UPDATE `table` SET `col1` = ? WHERE `id` = ?", [0, 0])
+    assert [values for _, values in results] == [[i, i] for i in range(5000)]
+
+
+def test_build_many_keep_originals():
+    document = "x" * 1000
+    statement = (
+        Query.insert()
+        .keep_originals()
+        .into("table")
+        .columns(["id", "document"])
+        .values([1, document])
+        .returning_column("id")
+    )
+
+    [(sql, params)] = build_many([statement], DBEngine.Postgres)
+
+    assert (sql, params) == statement.build(DBEngine.Postgres)
+    assert params[1] is document
+    assert statement.build(DBEngine.Postgres)[1][1] is document
+
+
+def test_build_many_bounded_statements():
+    statement = PostgresQuery.select().all().from_table("table")
+
+    assert build_many([statement], DBEngine.Sqlite) == [('SELECT * FROM "table"', [])]
+
+
+def test_build_many_empty():
+    assert build_many([], DBEngine.Postgres) == []
+
+
+def test_build_many_invalid_statement():
+    with pytest.raises(TypeError):
+        build_many(["SELECT 1"], DBEngine.Postgres)  # type: ignore[list-item]
+
+
+def test_build_many_missing_param():
+    statement = (
+        Query.select()
+        .all()
+        .from_table("table")
+        .and_where(Expr.column("id").eq(Expr.param("id")))
+    )
+
+    with pytest.raises(KeyError):
+        build_many([statement], DBEngine.Postgres)
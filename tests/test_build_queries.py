@@ -1,7 +1,10 @@
 import datetime as dt
 
+import pytest
+
 from sea_query import DBEngine, Expr, Query
 from sea_query.expr import Condition
+from sea_query.query import OnConflict
 
 from tests.utils import format_mysql, format_sqlite
 
@@ -200,3 +203,246 @@ def test_delete_query_build():
         'DELETE FROM "table" WHERE "column" = ?',
         [1],
     )
+
+
+def test_select_query_build_with_params():
+    query = (
+        Query.select()
+        .all()
+        .from_table("table")
+        .and_where(Expr.column("col1").eq(Expr.param("first")))
+        .and_where(Expr.column("col2").gt(2))
+        .and_where(Expr.column("col3").is_in([Expr.param("second"), 4]))
+    )
+    sql = (
+        'SELECT * FROM "table" WHERE "col1" = $1 AND "col2" > $2 AND "col3" IN ($3, $4)'
+    )
+
+    assert query.build(DBEngine.Postgres, first=1, second="value") == (
+        sql,
+        [1, 2, "value", 4],
+    )
+    assert query.build(DBEngine.Mysql, first=5, second=None) == (
+        format_mysql(sql),
+        [5, 2, None, 4],
+    )
+    assert query.build(DBEngine.Sqlite, second=6, first=7) == (
+        format_sqlite(sql),
+        [7, 2, 6, 4],
+    )
+
+
+def test_build_missing_param():
+    query = (
+        Query.delete()
+        .from_table("table")
+        .and_where(Expr.column("id").eq(Expr.param("id")))
+    )
+
+    with pytest.raises(KeyError):
+        query.build(DBEngine.Postgres)
+
+
+def test_to_string_unbound_param():
+    query = (
+        Query.update()
+        .table("table")
+        .value("col1", Expr.param("value"))
+        .and_where(Expr.column("id").eq(1))
+    )
+
+    with pytest.raises(ValueError, match="'value'"):
+        query.to_string(DBEngine.Postgres)
+
+    insert = Query.insert().into("table").columns(["col1"]).values([Expr.param("v")])
+    with pytest.raises(ValueError, match="'v'"):
+        insert.to_string(DBEngine.Mysql)
+
+
+def test_update_query_build_with_params():
+    query = (
+        Query.update()
+        .table("table")
+        .value("column1", Expr.param("value"))
+        .and_where(Expr.column("id").eq(Expr.param("id")))
+    )
+
+    assert query.build(DBEngine.Postgres, id=3, value="new") == (
+        'UPDATE "table" SET "column1" = $1 WHERE "id" = $2',
+        ["new", 3],
+    )
+
+
+def test_insert_build_chunks():
+    query = (
+        Query.insert()
+        .into("table")
+        .columns(["col1", "col2"])
+        .values_many([(1, "a"), (2, "b"), (3, "c")])
+        .on_conflict(OnConflict.column("col1").do_nothing())
+    )
+
+    assert query.build_chunks(DBEngine.Postgres, max_params=4) == [
+        (
+            'INSERT INTO "table" ("col1", "col2") VALUES ($1, $2), ($3, $4) ON CONFLICT ("col1") DO NOTHING',
+            [1, "a", 2, "b"],
+        ),
+        (
+            'INSERT INTO "table" ("col1", "col2") VALUES ($1, $2) ON CONFLICT ("col1") DO NOTHING',
+            [3, "c"],
+        ),
+    ]
+
+
+def test_insert_build_chunks_within_limits():
+    query = (
+        Query.insert()
+        .into("table")
+        .columns(["col1", "col2"])
+        .values_many([(i, str(i)) for i in range(100)])
+    )
+
+    assert query.build_chunks(DBEngine.Sqlite) == [query.build(DBEngine.Sqlite)]
+
+    chunks = query.build_chunks(DBEngine.Mysql, max_params=50)
+    assert len(chunks) == 4
+    assert [value for _, values in chunks for value in values] == [
+        value for i in range(100) for value in (i, str(i))
+    ]
+
+
+def test_insert_build_chunks_max_bytes():
+    query = (
+        Query.insert().into("table").columns(["col1"]).values_many([("a" * 100,)] * 10)
+    )
+
+    chunks = query.build_chunks(DBEngine.Mysql, max_bytes=500)
+    assert all(len(values) <= 4 for _, values in chunks)
+    assert sum(len(values) for _, values in chunks) == 10
+
+
+def test_insert_build_chunks_row_too_large():
+    query = Query.insert().into("table").columns(["col1", "col2"]).values([1, 2])
+
+    with pytest.raises(ValueError):
+        query.build_chunks(DBEngine.Postgres, max_params=1)
+
+
+def test_build_from_threads():
+    from concurrent.futures import ThreadPoolExecutor
+
+    query = (
+        Query.select()
+        .all()
+        .from_table("table")
+        .and_where(Expr.column("id").is_in(list(range(100))))
+    )
+    expected = query.build(DBEngine.Postgres)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(
+            executor.map(lambda _: query.build(DBEngine.Postgres), range(16))
+        )
+
+    assert results == [expected] * 16
+
+
+def test_build_value_types():
+    import enum
+
+    class Status(str, enum.Enum):
+        ACTIVE = "active"
+
+    class Level(enum.IntEnum):
+        HIGH = 3
+
+    tz = dt.timezone(dt.timedelta(hours=2))
+    values = [
+        "text",
+        True,
+        1,
+        2**70,
+        1.5,
+        dt.datetime(2024, 1, 1, 12, 0, tzinfo=tz),
+        dt.datetime(2024, 1, 1, 12, 0),
+        dt.date(2024, 1, 1),
+        dt.time(12, 0),
+        None,
+        Status.ACTIVE,
+        Level.HIGH,
+    ]
+    query = (
+        Query.insert()
+        .into("table")
+        .columns([f"col{i}" for i in range(len(values))])
+        .values(values)  # type: ignore[arg-type]
+    )
+
+    _, params = query.build(DBEngine.Postgres)
+    assert params[:10] == [
+        "text",
+        True,
+        1,
+        float(2**70),
+        1.5,
+        dt.datetime(2024, 1, 1, 12, 0, tzinfo=tz),
+        dt.datetime(2024, 1, 1, 12, 0),
+        dt.date(2024, 1, 1),
+        dt.time(12, 0),
+        None,
+    ]
+    assert params[10:] == ["active", 3]
+    assert type(params[2]) is int and type(params[1]) is bool
+
+
+def test_build_unsupported_value_type():
+    with pytest.raises(TypeError):
+        Query.insert().into("table").columns(["col1"]).values([{"key": "value"}])  # type: ignore[list-item]
+
+
+def test_insert_build_keep_originals():
+    document = "x" * 1000
+    created = dt.datetime(2024, 1, 1)
+    query = (
+        Query.insert()
+        .keep_originals()
+        .into("table")
+        .columns(["id", "document", "created", "owner"])
+        .values([1, document, created, Expr.param("owner")])
+        .on_conflict(OnConflict.column("id").do_nothing())
+    )
+
+    sql, params = query.build(DBEngine.Postgres, owner="me")
+    assert sql == (
+        'INSERT INTO "table" ("id", "document", "created", "owner") '
+        'VALUES ($1, $2, $3, $4) ON CONFLICT ("id") DO NOTHING'
+    )
+    assert params == [1, document, created, "me"]
+    assert params[1] is document
+    assert params[2] is created
+
+    chunks = query.build_chunks(DBEngine.Postgres, max_params=4, owner="me")
+    assert chunks[0][1][1] is document
+
+
+def test_insert_keep_originals_after_values():
+    query = Query.insert().into("table").columns(["col1"]).values(["value"])
+
+    assert query.keep_originals().build(DBEngine.Sqlite) == (
+        'INSERT INTO "table" ("col1") VALUES (?)',
+        ["value"],
+    )
+
+
+def test_register_identifiers():
+    from sea_query import register_identifiers
+
+    register_identifiers(["users", "id", "name"])
+
+    query = Query.select().columns(["id", "name"]).from_table("users")
+    assert query.build(DBEngine.Postgres) == ('SELECT "id", "name" FROM "users"', [])
+
+
+def test_identifier_must_be_str():
+    with pytest.raises(TypeError):
+        Query.select().from_table(1)  # type: ignore[arg-type]
@@ -0,0 +1,90 @@
+import pytest
+
+from sea_query import DBEngine, Expr, Query
+from sea_query.postgres import Query as PostgresQuery
+
+from tests.utils import format_mysql
+
+
+def test_compile_select():
+    query = (
+        Query.select()
+        .all()
+        .from_table("table")
+        .and_where(Expr.column("col1").eq(1))
+        .and_where(Expr.column("col2").ne("value"))
+    )
+
+    sql = 'SELECT * FROM "table" WHERE "col1" = $1 AND "col2" <> $2'
+    compiled = query.compile(DBEngine.Postgres)
+    assert compiled.sql == sql
+    assert compiled.params == [1, "value"]
+    assert compiled.bind() == (sql, [1, "value"])
+    assert compiled.bind([2, "other"]) == (sql, [2, "other"])
+
+    compiled = query.compile(DBEngine.Mysql)
+    assert compiled.bind([3, "mysql"]) == (format_mysql(sql), [3, "mysql"])
+
+
+def test_compile_update():
+    query = (
+        Query.update()
+        .table("table")
+        .value("col1", 1)
+        .and_where(Expr.column("col2").eq(2))
+    )
+
+    compiled = query.compile(DBEngine.Sqlite)
+    assert compiled.bind([10, 20]) == (
+        'UPDATE "table" SET "col1" = ? WHERE "col2" = ?',
+        [10, 20],
+    )
+
+
+def test_compile_is_detached_from_statement():
+    query = Query.select().all().from_table("table").and_where(Expr.column("id").eq(1))
+    compiled = query.compile(DBEngine.Postgres)
+
+    query.and_where(Expr.column("name").eq("name"))
+
+    assert compiled.bind([5]) == ('SELECT * FROM "table" WHERE "id" = $1', [5])
+
+
+def test_compile_bind_wrong_number_of_params():
+    query = Query.delete().from_table("table").and_where(Expr.column("id").eq(1))
+    compiled = query.compile(DBEngine.Postgres)
+
+    with pytest.raises(ValueError):
+        compiled.bind([1, 2])
+
+
+def test_compile_bounded_statement():
+    query = (
+        PostgresQuery.insert()
+        .into("table")
+        .columns(["col1", "col2"])
+        .values([1, "value"])
+    )
+
+    assert query.compile().bind([2, "other"]) == (
+        'INSERT INTO "table" ("col1", "col2") VALUES ($1, $2)',
+        [2, "other"],
+    )
+
+
+def test_compile_bind_named_params():
+    query = (
+        Query.select()
+        .all()
+        .from_table("table")
+        .and_where(Expr.column("id").eq(Expr.param("id")))
+        .and_where(Expr.column("active").eq(True))
+    )
+    compiled = query.compile(DBEngine.Postgres)
+    sql = 'SELECT * FROM "table" WHERE "id" = $1 AND "active" = $2'
+
+    assert compiled.bind({"id": 1}) == (sql, [1, True])
+    assert compiled.bind(id=2) == (sql, [2, True])
+
+    with pytest.raises(KeyError):
+        compiled.bind()
@@ -0,0 +1,121 @@
+import datetime as dt
+import struct
+
+import pytest
+
+from sea_query.postgres import CopyFormat, Query
+from sea_query.table import ColumnType
+
+
+def test_copy_command():
+    copy = Query.copy().into("users").columns(["id", "name"])
+    assert copy.to_string() == 'COPY "users" ("id", "name") FROM STDIN'
+    types = {"id": ColumnType.Integer, "name": ColumnType.Text}
+    assert copy.format(CopyFormat.Binary, types).to_string() == (
+        'COPY "users" ("id", "name") FROM STDIN WITH (FORMAT binary)'
+    )
+
+
+def test_copy_text():
+    copy = (
+        Query.copy()
+        .into("events")
+        .columns(["id", "name", "ok", "score", "at", "day"])
+        .values([1, "a\tb\\c\nd", True, 1.5, dt.datetime(2024, 1, 2, 3, 4, 5), None])
+        .values_many(
+            [
+                [
+                    2,
+                    "x",
+                    False,
+                    float("inf"),
+                    dt.datetime(2024, 1, 2, tzinfo=dt.timezone.utc),
+                    dt.date(2024, 1, 2),
+                ]
+            ]
+        )
+    )
+    assert len(copy) == 2
+    assert copy.payload() == (
+        b"1\ta\\tb\\\\c\\nd\tt\t1.5\t2024-01-02 03:04:05\t\\N\n"
+        b"2\tx\tf\tInfinity\t2024-01-02 00:00:00+00:00\t2024-01-02\n"
+    )
+
+
+def test_copy_binary():
+    copy = (
+        Query.copy()
+        .into("t")
+        .columns(["id", "name", "day"])
+        .format(
+            CopyFormat.Binary,
+            {
+                "id": ColumnType.BigInteger,
+                "name": ColumnType.Text,
+                "day": ColumnType.Date,
+            },
+        )
+        .values([1, "ab", dt.date(2000, 1, 2)])
+        .values([None, "", dt.date(1999, 12, 31)])
+    )
+    header = b"PGCOPY\n\xff\r\n\x00" + struct.pack(">ii", 0, 0)
+    rows = struct.pack(">hiqi2sii", 3, 8, 1, 2, b"ab", 4, 1)
+    rows += struct.pack(">hiiii", 3, -1, 0, 4, -1)
+    assert copy.payload() == header + rows + struct.pack(">h", -1)
+
+
+def test_copy_binary_column_types():
+    copy = (
+        Query.copy()
+        .into("t")
+        .columns(["a", "b", "c", "d"])
+        .format(
+            CopyFormat.Binary,
+            {
+                "a": ColumnType.SmallInteger,
+                "b": ColumnType.Integer,
+                "c": ColumnType.Float,
+                "d": ColumnType.Jsonb,
+            },
+        )
+        .values([1, 2, 1.5, "{}"])
+    )
+    row = struct.pack(">hihiiif", 4, 2, 1, 4, 2, 4, 1.5)
+    row += struct.pack(">ib2s", 3, 1, b"{}")
+    assert copy.payload()[19:-2] == row
+
+
+def test_copy_binary_needs_types():
+    copy = Query.copy().into("t").columns(["a", "b"]).values([1, "x"])
+    with pytest.raises(ValueError):
+        copy.format(CopyFormat.Binary)
+
+    copy.format(CopyFormat.Binary, {"a": ColumnType.Integer})
+    with pytest.raises(ValueError, match="'b'"):
+        copy.payload()
+
+    copy.format(CopyFormat.Binary, {"a": ColumnType.Integer, "b": ColumnType.Uuid})
+    with pytest.raises(ValueError, match="text format"):
+        copy.chunks()
+
+    copy.format(CopyFormat.Binary, {"a": ColumnType.SmallInteger, "b": ColumnType.Text})
+    copy.values([70000, "y"])
+    with pytest.raises(ValueError, match="out of range"):
+        copy.payload()
+
+    copy.format(CopyFormat.Binary, {"a": ColumnType.Integer, "b": ColumnType.Date})
+    with pytest.raises(ValueError, match="a str"):
+        copy.payload()
+
+
+def test_copy_chunks():
+    copy = Query.copy().into("t").columns(["id"])
+    copy.values_many([[i] for i in range(1000)])
+
+    chunks = list(copy.chunks(size=100))
+    assert len(chunks) > 1
+    assert all(len(chunk) < 110 for chunk in chunks)
+    assert b"".join(chunks) == copy.payload()
+
+    with pytest.raises(ValueError):
+        copy.values([1, 2])
@@ -0,0 +1,65 @@
+import sqlite3
+
+from sea_query import DBEngine, Expr, Query
+from sea_query.postgres import Query as PostgresQuery
+from sea_query.query import OnConflict
+
+
+def test_insert_executemany():
+    query = (
+        Query.insert()
+        .into("t")
+        .columns(["a", "b"])
+        .values_many([[1, "x"], [2, None], [3, "z"]])
+    )
+    sql, rows = query.build_executemany(DBEngine.Postgres)
+    assert sql == 'INSERT INTO "t" ("a", "b") VALUES ($1, $2)'
+    assert rows == [(1, "x"), (2, None), (3, "z")]
+
+
+def test_insert_executemany_shared_values():
+    query = (
+        PostgresQuery.insert()
+        .into("t")
+        .columns(["a", "b"])
+        .values([1, Expr.param("b")])
+        .values([2, "y"])
+        .on_conflict(OnConflict.column("a").do_nothing())
+        .returning_column("a")
+    )
+    sql, rows = query.build_executemany(b="x")
+    assert sql == (
+        'INSERT INTO "t" ("a", "b") VALUES ($1, $2)'
+        ' ON CONFLICT ("a") DO NOTHING RETURNING "a"'
+    )
+    assert rows == [(1, "x"), (2, "y")]
+
+
+def test_update_executemany():
+    query = (
+        Query.update()
+        .table("t")
+        .value("b", Expr.param("b"))
+        .and_where(Expr.column("a").eq(Expr.param("a")))
+        .and_where(Expr.column("c").eq(0))
+    )
+    sql, rows = query.build_executemany(
+        DBEngine.Sqlite, [{"a": 1, "b": "x"}, {"a": 2, "b": "y"}]
+    )
+    assert sql == 'UPDATE "t" SET "b" = ? WHERE "a" = ? AND "c" = ?'
+    assert rows == [("x", 1, 0), ("y", 2, 0)]
+
+
+def test_executemany_with_sqlite():
+    connection = sqlite3.connect(":memory:")
+    connection.execute("CREATE TABLE t (a INTEGER, b TEXT)")
+
+    insert = Query.insert().into("t").columns(["a", "b"])
+    insert.values_many([[i, f"v{i}"] for i in range(100)])
+    connection.executemany(*insert.build_executemany(DBEngine.Sqlite))
+
+    delete = Query.delete().from_table("t")
+    delete.and_where(Expr.column("a").gte(Expr.param("a")))
+    connection.executemany(*delete.build_executemany(DBEngine.Sqlite, [{"a": 50}]))
+
+    assert connection.execute("SELECT count(*) FROM t").fetchone() == (50,)
@@ -370,3 +370,54 @@ def test_pyvalue_datetime_with_tz():
         query.to_string(DBEngine.Postgres)
         == 'SELECT  FROM "table" WHERE "column" = \'2024-09-12 12:30:00 +05:00\''
     )
+
+
+def test_shared_subexpressions():
+    from sea_query.expr import Condition, SimpleExpr
+
+    def visible() -> SimpleExpr:
+        return Expr.column("active").eq(True) & ~Expr.column("hidden").eq(True)
+
+    shared = visible()
+    base = Condition.all().add(shared)
+    queries = [
+        Query.select()
+        .all()
+        .from_table("table")
+        .cond_where(base.add(Expr.column("id").eq(i)))
+        for i in range(2)
+    ] + [Query.select().all().from_table("table").and_where(shared | shared)]
+    expected = [
+        Query.select()
+        .all()
+        .from_table("table")
+        .cond_where(Condition.all().add(visible()).add(Expr.column("id").eq(i)))
+        for i in range(2)
+    ] + [Query.select().all().from_table("table").and_where(visible() | visible())]
+
+    for query, expected_query in zip(queries, expected):
+        assert query.build(DBEngine.Postgres) == expected_query.build(DBEngine.Postgres)
+    assert queries[0].build(DBEngine.Postgres)[1] == [True, True, 0]
+
+
+def test_large_condition():
+    from sea_query.expr import Condition
+
+    condition = Condition.any()
+    for i in range(2000):
+        condition = condition.add(Expr.column("id").eq(i))
+
+    query = Query.select().all().from_table("table").cond_where(condition)
+    _, params = query.build(DBEngine.Postgres)
+    assert params == list(range(2000))
+
+
+def test_large_expression():
+    expr = Expr.column("id").eq(0)
+    for i in range(1, 2000):
+        expr = expr | Expr.column("id").eq(i)
+
+    query = Query.select().all().from_table("table").and_where(~expr)
+    sql, params = query.build(DBEngine.Postgres)
+    assert sql.count(" OR ") == 1999
+    assert params == list(range(2000))
@@ -0,0 +1,94 @@
+from sea_query import Expr, Query, Table
+from sea_query.expr import Condition
+from sea_query.postgres import Query as PostgresQuery
+from sea_query.query import OrderBy, SelectStatement
+from sea_query.table import Column
+
+
+def select(user_id: int, name: str = "name") -> SelectStatement:
+    return (
+        Query.select()
+        .columns(["id", name])
+        .from_table("users")
+        .and_where(Expr.column("id").eq(user_id))
+    )
+
+
+def test_fingerprint_ignores_values():
+    assert select(1).fingerprint() == select(2).fingerprint()
+    assert select(1).fingerprint() != select(1, "email").fingerprint()
+    assert select(1).fingerprint() == select(1).fingerprint()
+
+    insert = Query.insert().into("users").columns(["id", "name"])
+    one = insert.values([1, "a"]).fingerprint()
+    assert (
+        one
+        == Query.insert()
+        .into("users")
+        .columns(["id", "name"])
+        .values([2, "b"])
+        .fingerprint()
+    )
+    assert one != insert.values([3, "c"]).fingerprint()
+
+
+def test_fingerprint_is_128_bits():
+    fingerprint = select(1).fingerprint()
+    assert isinstance(fingerprint, int)
+    assert 0 <= fingerprint < 2**128
+
+
+def test_statement_equality():
+    assert select(1) == select(1)
+    assert select(1) != select(2)
+    assert len({select(1), select(1), select(2)}) == 2
+    assert PostgresQuery.select().from_table("t") == Query.select().from_table("t")
+    delete: object = Query.delete().from_table("t")
+    assert delete != Query.select().from_table("t")
+
+    create = Table.create().name("t").column(Column("id").integer())
+    assert create == Table.create().name("t").column(Column("id").integer())
+    assert create != Table.create().name("t").column(Column("id").big_integer())
+
+
+def test_expression_equality():
+    expr = Expr.column("a").eq(1) | Expr.column("b").is_null()
+    assert expr == Expr.column("a").eq(1) | Expr.column("b").is_null()
+    assert expr != Expr.column("a").eq(2) | Expr.column("b").is_null()
+    assert hash(expr) == hash(Expr.column("a").eq(1) | Expr.column("b").is_null())
+    assert (
+        expr.fingerprint()
+        == (Expr.column("a").eq(2) | Expr.column("b").is_null()).fingerprint()
+    )
+
+    condition = Condition.all().add(expr)
+    assert condition == Condition.all().add(expr)
+    assert condition != Condition.any().add(expr)
+
+
+def test_fingerprint_ignores_limit_offset_and_patterns():
+    def page(limit: int, offset: int, pattern: str) -> SelectStatement:
+        return (
+            Query.select()
+            .all()
+            .from_table("users")
+            .and_where(Expr.column("name").like(pattern))
+            .and_where(Expr.column("email").not_like(pattern))
+            .limit(limit)
+            .offset(offset)
+        )
+
+    assert page(10, 0, "a%").fingerprint() == page(20, 40, "b%").fingerprint()
+    assert page(10, 0, "a%") != page(20, 40, "b%")
+    assert page(10, 0, "a%").fingerprint() != (
+        page(10, 0, "a%").order_by("id", OrderBy.Asc).fingerprint()
+    )
+
+    update = Query.update().table("users").value("active", False)
+    delete = Query.delete().from_table("users")
+    assert update.limit(1).fingerprint() == (
+        Query.update().table("users").value("active", False).limit(2).fingerprint()
+    )
+    assert delete.limit(1).fingerprint() == (
+        Query.delete().from_table("users").limit(2).fingerprint()
+    )
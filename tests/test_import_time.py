@@ -0,0 +1,54 @@
+import subprocess
+import sys
+
+from typing import Dict
+
+import sea_query._internal
+
+
+def import_times(code: str) -> Dict[str, int]:
+    """Run `code` in a new interpreter and return the cumulative import time
+    of each module it loaded, in microseconds."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times: Dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _, cumulative, module = line[len("import time:") :].split("|")
+        times[module.strip()] = int(cumulative)
+    return times
+
+
+def test_typing_is_not_imported():
+    # Unless the interpreter already imports it on startup.
+    startup = import_times("pass")
+    assert "typing" in startup or "typing" not in import_times("import sea_query")
+
+
+def test_schema_and_engine_modules_are_lazy():
+    times = import_times("import sea_query")
+    for module in ("table", "index", "foreign_key", "postgres", "mysql", "sqlite"):
+        assert f"sea_query.{module}" not in times
+
+    times = import_times("from sea_query import Table; import sea_query.postgres")
+    assert "sea_query.table" in times
+    assert "sea_query.postgres" in times
+
+
+def test_schema_copy_and_load_data_classes_are_not_registered():
+    # Their types are created by the modules exposing them, on first import.
+    for name in (
+        "Column",
+        "ColumnType",
+        "TableCreateStatement",
+        "IndexCreateStatement",
+        "ForeignKeyCreateStatement",
+        "CopyStatement",
+        "LoadDataStatement",
+    ):
+        assert not hasattr(sea_query._internal, name)
@@ -1,4 +1,8 @@
-from sea_query import Query
+from types import MappingProxyType
+
+import pytest
+
+from sea_query import DBEngine, Query
 from sea_query.query import OnConflict
 
 from tests.utils import assert_query
@@ -59,6 +63,18 @@ def test_select_from():
     )
 
 
+def test_select_from_wrong_number_of_columns():
+    query = (
+        Query.insert()
+        .into("table")
+        .columns(["column1", "column2"])
+        .select_from(Query.select().from_table("table2").columns(["column3"]))
+    )
+
+    with pytest.raises(ValueError):
+        query.to_string(DBEngine.Postgres)
+
+
 def test_on_conflict_do_nothing():
     query = (
         Query.insert()
@@ -155,3 +171,50 @@ def test_insert_returning_columns_overrides_previous():
         'INSERT INTO "table" ("column1", "column2") VALUES (1, 3.5) RETURNING "column2"',
         mysql_expected="INSERT INTO `table` (`column1`, `column2`) VALUES (1, 3.5)",
     )
+
+
+def test_insert_values_many():
+    query = (
+        Query.insert()
+        .into("table")
+        .columns(["column1", "column2"])
+        .values_many([(1, "str1"), (2, "str2"), [3, None]])
+    )
+    assert_query(
+        query,
+        'INSERT INTO "table" ("column1", "column2") VALUES (1, \'str1\'), (2, \'str2\'), (3, NULL)',
+    )
+
+
+def test_insert_values_many_wrong_length():
+    query = Query.insert().into("table").columns(["column1", "column2"])
+
+    with pytest.raises(ValueError):
+        query.values_many([(1, "str1"), (2,)])
+
+
+def test_insert_values_columns():
+    query = (
+        Query.insert()
+        .into("table")
+        .values_columns({"column1": [1, 2], "column2": ["str1", "str2"]})
+    )
+    assert_query(
+        query,
+        'INSERT INTO "table" ("column1", "column2") VALUES (1, \'str1\'), (2, \'str2\')',
+    )
+
+
+def test_insert_values_columns_mapping():
+    data = MappingProxyType({"column1": (1, 2), "column2": (3, 4)})
+    query = Query.insert().into("table").values_columns(data)
+    assert_query(
+        query, 'INSERT INTO "table" ("column1", "column2") VALUES (1, 3), (2, 4)'
+    )
+
+
+def test_insert_values_columns_different_lengths():
+    with pytest.raises(ValueError):
+        Query.insert().into("table").values_columns(
+            {"column1": [1, 2], "column2": ["str1"]}
+        )
@@ -0,0 +1,83 @@
+import datetime as dt
+import io
+
+import pytest
+
+from sea_query.mysql import Query
+
+
+def test_load_data_statement():
+    load = Query.load_data().infile("/tmp/users.tsv").into("users")
+    load.columns(["id", "name"])
+    assert load.to_string() == (
+        "LOAD DATA LOCAL INFILE '/tmp/users.tsv' INTO TABLE `users`"
+        " CHARACTER SET utf8mb4 FIELDS TERMINATED BY '\\t'"
+        " ESCAPED BY '\\\\' LINES TERMINATED BY '\\n' (`id`, `name`)"
+    )
+
+    load.replace().fields_terminated_by(",").enclosed_by()
+    assert load.to_string() == (
+        "LOAD DATA LOCAL INFILE '/tmp/users.tsv' REPLACE INTO TABLE `users`"
+        " CHARACTER SET utf8mb4 FIELDS TERMINATED BY ','"
+        " OPTIONALLY ENCLOSED BY '\"'"
+        " ESCAPED BY '\\\\' LINES TERMINATED BY '\\n' (`id`, `name`)"
+    )
+    assert "IGNORE INTO" in load.ignore().to_string()
+
+
+def test_load_data_tsv():
+    load = (
+        Query.load_data()
+        .into("events")
+        .columns(["id", "name", "ok", "at", "day"])
+        .values([1, "a\tb\\c\nd", True, dt.datetime(2024, 1, 2, 3, 4, 5), None])
+        .values(
+            [
+                2,
+                "\\N",
+                False,
+                dt.datetime(2024, 1, 2, 1, tzinfo=dt.timezone(dt.timedelta(hours=1))),
+                dt.date(2024, 1, 2),
+            ]
+        )
+    )
+    assert len(load) == 2
+    assert load.payload() == (
+        b"1\ta\\tb\\\\c\\nd\t1\t2024-01-02 03:04:05\t\\N\n"
+        b"2\t\\\\N\t0\t2024-01-02 00:00:00\t2024-01-02\n"
+    )
+
+
+def test_load_data_csv():
+    load = (
+        Query.load_data()
+        .into("t")
+        .columns(["id", "name"])
+        .fields_terminated_by(",")
+        .enclosed_by('"')
+        .values([1, 'say "hi", bye'])
+        .values([2, None])
+    )
+    assert load.payload() == b'1,"say \\"hi\\"\\, bye"\n2,\\N\n'
+
+
+def test_load_data_write_to():
+    load = Query.load_data().into("t").columns(["id"])
+    load.values_many([[i] for i in range(1000)])
+
+    file = io.BytesIO()
+    assert load.write_to(file, size=100) == len(load.payload())
+    assert file.getvalue() == load.payload()
+    assert b"".join(load.chunks(size=100)) == load.payload()
+
+
+def test_load_data_errors():
+    load = Query.load_data().into("t").columns(["id"])
+    with pytest.raises(ValueError):
+        load.values([float("nan")])
+    with pytest.raises(ValueError):
+        load.values([1, 2])
+    with pytest.raises(ValueError):
+        load.fields_terminated_by("x")
+    with pytest.raises(ValueError):
+        load.to_string()
@@ -0,0 +1,45 @@
+from sea_query import DBEngine, Expr, Query
+
+
+def test_repeated_build_after_change():
+    query = Query.select().column("id").from_table("users")
+    assert query.build(DBEngine.Postgres) == query.build(DBEngine.Postgres)
+    assert query.to_string(DBEngine.Mysql) == "SELECT `id` FROM `users`"
+
+    query.and_where(Expr.column("id").eq(1))
+    assert query.build(DBEngine.Postgres) == (
+        'SELECT "id" FROM "users" WHERE "id" = $1',
+        [1],
+    )
+    assert query.to_string(DBEngine.Mysql) == "SELECT `id` FROM `users` WHERE `id` = 1"
+    assert query.build(DBEngine.Sqlite) == (
+        'SELECT "id" FROM "users" WHERE "id" = ?',
+        [1],
+    )
+
+
+def test_repeated_build_binds_params():
+    query = (
+        Query.delete()
+        .from_table("users")
+        .and_where(Expr.column("id").eq(Expr.param("id")))
+    )
+    assert query.build(DBEngine.Sqlite, id=1)[1] == [1]
+    assert query.build(DBEngine.Sqlite, id=2)[1] == [2]
+
+
+def test_repeated_build_insert_rows():
+    query = Query.insert().into("users").columns(["id"]).values([1])
+    assert query.build(DBEngine.Sqlite) == (
+        'INSERT INTO "users" ("id") VALUES (?)',
+        [1],
+    )
+
+    query.values([2])
+    assert query.build(DBEngine.Sqlite) == (
+        'INSERT INTO "users" ("id") VALUES (?), (?)',
+        [1, 2],
+    )
+    assert query.to_string(DBEngine.Sqlite) == (
+        'INSERT INTO "users" ("id") VALUES (1), (2)'
+    )
@@ -0,0 +1,60 @@
+import pytest
+
+from sea_query import (
+    DBEngine,
+    Expr,
+    Query,
+    Table,
+    disable_metrics,
+    enable_metrics,
+    metrics_prometheus,
+    metrics_snapshot,
+    reset_metrics,
+)
+from sea_query.table import Column
+
+
+@pytest.fixture(autouse=True)
+def metrics():
+    enable_metrics()
+    reset_metrics()
+    yield
+    disable_metrics()
+    reset_metrics()
+
+
+def test_metrics_snapshot():
+    query = Query.select().all().from_table("t").and_where(Expr.column("a").eq(1))
+    sql, params = query.build(DBEngine.Postgres)
+    query.to_string(DBEngine.Postgres)
+    Table.create().name("t").column(Column("a").integer()).to_string(DBEngine.Mysql)
+
+    snapshot = metrics_snapshot()
+    select = snapshot["select"]["postgres"]
+    assert select["statements"] == 2
+    assert select["params"] == len(params)
+    assert select["bytes"] > len(sql)
+    assert select["buckets"][float("inf")] == 2
+    assert list(select["buckets"].values()) == sorted(select["buckets"].values())
+    assert snapshot["ddl"]["mysql"]["statements"] == 1
+    assert "insert" not in snapshot
+
+
+def test_metrics_prometheus():
+    Query.insert().into("t").columns(["a"]).values([1]).build(DBEngine.Sqlite)
+
+    text = metrics_prometheus()
+    assert "# TYPE sea_query_statements_total counter" in text
+    assert 'sea_query_statements_total{kind="insert",engine="sqlite"} 1' in text
+    assert 'sea_query_params_total{kind="insert",engine="sqlite"} 1' in text
+    assert (
+        'sea_query_build_seconds_bucket{kind="insert",engine="sqlite",le="+Inf"} 1'
+        in text
+    )
+    assert 'sea_query_build_seconds_count{kind="insert",engine="sqlite"} 1' in text
+
+
+def test_metrics_disabled():
+    disable_metrics()
+    Query.delete().from_table("t").build(DBEngine.Mysql)
+    assert metrics_snapshot() == {}
@@ -0,0 +1,181 @@
+import datetime as dt
+import pickle
+import struct
+from typing import TypeVar
+
+import pytest
+
+from sea_query import (
+    DBEngine,
+    Expr,
+    Index,
+    Query,
+    Table,
+    disable_recording,
+    enable_recording,
+)
+from sea_query.expr import Condition
+from sea_query.postgres import Query as PostgresQuery
+from sea_query.query import OrderBy, SelectStatement, UnionType
+from sea_query.table import Column
+
+
+T = TypeVar("T")
+
+
+def roundtrip(obj: T) -> T:
+    restored: T = pickle.loads(pickle.dumps(obj))
+    return restored
+
+
+def name(value: str) -> bytes:
+    return struct.pack("<I", len(value)) + value.encode()
+
+
+def test_pickle_select():
+    subquery = Query.select().column("id").from_table("banned")
+    query = (
+        Query.select()
+        .columns(["id", "name"])
+        .from_table("users")
+        .cond_where(
+            Condition.any()
+            .add(Expr.column("age").between(18, 65))
+            .add(~Expr.column("id").is_in([1, 2, 3]))
+        )
+        .and_where(~Expr.exists(subquery))
+        .order_by("name", OrderBy.Desc)
+        .union(Query.select().column("id").from_table("admins"), UnionType.All)
+        .limit(10)
+    )
+
+    for engine in (DBEngine.Mysql, DBEngine.Postgres, DBEngine.Sqlite):
+        assert roundtrip(query).build(engine) == query.build(engine)
+
+
+def test_pickle_insert():
+    query = (
+        Query.insert()
+        .into("events")
+        .columns(["name", "at", "day", "param"])
+        .values(["a", dt.datetime(2024, 1, 2, 3, 4, 5, 6), dt.date(2024, 1, 2), None])
+        .values(
+            [
+                "b",
+                dt.datetime(2024, 1, 2, tzinfo=dt.timezone(dt.timedelta(hours=2))),
+                dt.date(1, 1, 1),
+                "c",
+            ]
+        )
+    )
+
+    restored = roundtrip(query)
+    assert restored.to_string(DBEngine.Postgres) == query.to_string(DBEngine.Postgres)
+
+    query = query.values(["c", None, None, Expr.param("value")])
+
+    restored = roundtrip(query)
+    assert restored.build(DBEngine.Postgres, value=1) == query.build(
+        DBEngine.Postgres, value=1
+    )
+
+
+def test_pickle_expressions():
+    expr = Expr.column("a").eq(1) | Expr.column("b").like("%b")
+    condition = (
+        Condition.all()
+        .add(expr & ~Expr.column("c").is_null())
+        .add(Condition.any().add(Expr.column("d").gt(2.5)))
+    )
+
+    query = Query.select().all().from_table("t").and_where(roundtrip(expr))
+    assert query.to_string(DBEngine.Sqlite) == (
+        'SELECT * FROM "t" WHERE "a" = 1 OR "b" LIKE \'%b\''
+    )
+
+    delete = Query.delete().from_table("t")
+    assert delete.cond_where(roundtrip(condition)).to_string(DBEngine.Mysql) == (
+        Query.delete().from_table("t").cond_where(condition).to_string(DBEngine.Mysql)
+    )
+
+
+def test_pickle_table_create():
+    statement = (
+        Table.create()
+        .name("users")
+        .if_not_exists()
+        .column(Column("id").integer().primary_key().auto_increment())
+        .column(Column("name").string_len(100).not_null().default(Expr.value("x")))
+        .index(Index.create().name("idx_name").table("users").column("name"))
+    )
+
+    for engine in (DBEngine.Mysql, DBEngine.Postgres, DBEngine.Sqlite):
+        assert roundtrip(statement).to_string(engine) == statement.to_string(engine)
+
+
+def test_pickle_bounded_statement():
+    query = (
+        PostgresQuery.select()
+        .all()
+        .from_table("users")
+        .and_where(Expr.column("id").eq(1))
+    )
+
+    restored = roundtrip(query)
+    assert type(restored) is type(query)
+    assert restored.build() == query.build()
+
+
+def test_from_bytes():
+    query = Query.update().table("users").values([("name", "a"), ("age", 3)])
+    data = query.to_bytes()
+
+    assert isinstance(data, bytes)
+    restored = type(query).from_bytes(data)
+    assert restored.to_string(DBEngine.Postgres) == query.to_string(DBEngine.Postgres)
+
+    with pytest.raises(TypeError):
+        SelectStatement.from_bytes(data)
+    with pytest.raises(ValueError):
+        SelectStatement.from_bytes(b"not a statement")
+
+
+def test_from_bytes_only_replays_recorded_calls():
+    data = Query.select().all().from_table("table").to_bytes()
+    assert SelectStatement.from_bytes(data).build(DBEngine.Sqlite) == (
+        'SELECT * FROM "table"',
+        [],
+    )
+
+    with pytest.raises(ValueError, match="Invalid serialized statement"):
+        SelectStatement.from_bytes(
+            data.replace(name("SelectStatement"), name("set_build_hook"))
+        )
+    with pytest.raises(ValueError, match="Invalid serialized statement"):
+        SelectStatement.from_bytes(data.replace(name("all"), name("__reduce__")))
+
+
+def test_recording_disabled():
+    recorded = Query.select().all().from_table("table")
+    disable_recording()
+    try:
+        query = recorded.and_where(Expr.column("id").eq(1))
+        other = (
+            Query.select().all().from_table("table").and_where(Expr.column("id").eq(1))
+        )
+    finally:
+        enable_recording()
+
+    assert query.build(DBEngine.Postgres) == (
+        'SELECT * FROM "table" WHERE "id" = $1',
+        [1],
+    )
+    assert query == query
+    assert query != other
+    assert hash(query) == hash(query)
+    with pytest.raises(ValueError):
+        query.to_bytes()
+    with pytest.raises(ValueError):
+        query.fingerprint()
+    with pytest.raises(ValueError):
+        pickle.dumps(query)
@@ -310,6 +310,50 @@ def test_select_from_subquery():
     )
 
 
+def test_subquery_is_snapshot():
+    subquery = Query.select().all().from_table("table")
+    query = Query.select().all().from_subquery(subquery, "subquery").from_table("other")
+
+    subquery.and_where(Expr.column("column1").gt(1))
+
+    assert_query(
+        query,
+        'SELECT * FROM (SELECT * FROM "table") AS "subquery", "other"',
+    )
+    assert_query(subquery, 'SELECT * FROM "table" WHERE "column1" > 1')
+
+
+def test_subquery_reused():
+    permissions = Query.select().column("id").from_table("permissions")
+    first = Query.select().all().from_table("a").and_where(Expr.exists(permissions))
+    second = Query.select().all().from_table("b").union(permissions, UnionType.All)
+
+    assert_query(
+        first,
+        'SELECT * FROM "a" WHERE EXISTS(SELECT "id" FROM "permissions")',
+    )
+    assert second.to_string(DBEngine.Postgres) == (
+        Query.select()
+        .all()
+        .from_table("b")
+        .union(Query.select().column("id").from_table("permissions"), UnionType.All)
+        .to_string(DBEngine.Postgres)
+    )
+
+
+def test_composed_statement_changed_after_build():
+    subquery = Query.select().all().from_table("table")
+    query = Query.select().all().from_subquery(subquery, "subquery")
+    assert_query(query, 'SELECT * FROM (SELECT * FROM "table") AS "subquery"')
+
+    query.and_where(Expr.column("column1").gt(1))
+
+    assert_query(
+        query,
+        'SELECT * FROM (SELECT * FROM "table") AS "subquery" WHERE "column1" > 1',
+    )
+
+
 def test_select_expr():
     query = Query.select().expr(Expr.column("column1").max()).from_table("table")
     assert_query(query, 'SELECT MAX("column1") FROM "table"')
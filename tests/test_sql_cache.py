@@ -0,0 +1,122 @@
+from typing import Iterator
+
+import pytest
+
+from sea_query import (
+    DBEngine,
+    Expr,
+    Query,
+    build_many,
+    clear_sql_cache,
+    disable_sql_cache,
+    enable_sql_cache,
+    sql_cache_info,
+)
+from sea_query.query import SelectStatement
+
+
+@pytest.fixture(autouse=True)
+def sql_cache() -> Iterator[None]:
+    enable_sql_cache()
+    clear_sql_cache()
+    yield
+    disable_sql_cache()
+
+
+def select(user_id: int, name: str) -> SelectStatement:
+    return (
+        Query.select()
+        .columns(["id", "name"])
+        .from_table("users")
+        .and_where(Expr.column("id").eq(user_id))
+        .and_where(Expr.column("name").like(name))
+        .limit(10)
+    )
+
+
+def test_cache_hit_collects_new_values():
+    for user_id, name in [(1, "a%"), (2, "b%"), (3, "c%")]:
+        assert select(user_id, name).build(DBEngine.Postgres) == (
+            'SELECT "id", "name" FROM "users" WHERE "id" = $1 AND "name" LIKE $2 LIMIT $3',
+            [user_id, name, 10],
+        )
+
+    info = sql_cache_info()
+    assert (info.hits, info.misses, info.entries) == (1, 2, 1)
+
+
+def test_cache_verifies_with_other_values():
+    for user_id, name in [(1, "a%"), (1, "a%"), (2, "b%"), (3, "c%")]:
+        assert select(user_id, name).build(DBEngine.Postgres)[1] == [user_id, name, 10]
+
+    info = sql_cache_info()
+    assert (info.hits, info.misses) == (1, 3)
+
+
+def test_cache_finds_slots_again():
+    for a, b in [(1, 1), (2, 3), (4, 5), (6, 7)]:
+        query = (
+            Query.update().table("t").value("a", a).and_where(Expr.column("b").eq(b))
+        )
+        assert query.build(DBEngine.Sqlite)[1] == [a, b]
+
+    info = sql_cache_info()
+    assert (info.hits, info.misses) == (1, 3)
+
+
+def test_cache_is_per_engine():
+    select(1, "a").build(DBEngine.Postgres)
+    assert select(1, "a").build(DBEngine.Mysql)[0] == (
+        "SELECT `id`, `name` FROM `users` WHERE `id` = ? AND `name` LIKE ? LIMIT ?"
+    )
+    assert sql_cache_info().entries == 2
+
+
+def test_cache_repeated_values_are_not_cached():
+    for value in (1, 2, 3):
+        query = (
+            Query.update()
+            .table("t")
+            .value("a", value)
+            .and_where(Expr.column("b").eq(value))
+        )
+        assert query.build(DBEngine.Sqlite) == (
+            'UPDATE "t" SET "a" = ? WHERE "b" = ?',
+            [value, value],
+        )
+    assert sql_cache_info().hits == 0
+
+
+def test_cache_insert_rows():
+    for offset in range(3):
+        query = Query.insert().into("t").columns(["a", "b"])
+        query.values([offset, "x"]).values([offset + 1, "y"])
+        assert query.build(DBEngine.Postgres) == (
+            'INSERT INTO "t" ("a", "b") VALUES ($1, $2), ($3, $4)',
+            [offset, "x", offset + 1, "y"],
+        )
+        statements = build_many([query, select(offset, "z")], DBEngine.Sqlite)
+        assert statements[0][1] == [offset, "x", offset + 1, "y"]
+        assert statements[1][1] == [offset, "z", 10]
+    assert sql_cache_info().hits == 3
+
+
+def test_cache_limits():
+    enable_sql_cache(max_entries=2)
+    for limit in range(5):
+        Query.select().column("a").from_table(f"t{limit}").build(DBEngine.Sqlite)
+    assert sql_cache_info().entries == 2
+
+    enable_sql_cache(max_bytes=0)
+    select(1, "a").build(DBEngine.Sqlite)
+    assert sql_cache_info().entries == 0
+
+    with pytest.raises(ValueError):
+        enable_sql_cache(max_entries=0)
+
+
+def test_disable_sql_cache():
+    disable_sql_cache()
+    select(1, "a").build(DBEngine.Sqlite)
+    info = sql_cache_info()
+    assert (info.hits, info.misses, info.entries) == (0, 0, 0)
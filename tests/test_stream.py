@@ -0,0 +1,79 @@
+import sqlite3
+from typing import Any, Iterator, List
+
+import pytest
+
+from sea_query import DBEngine, Query
+from sea_query.postgres import Query as PostgresQuery
+from sea_query.query import OnConflict
+
+
+def rows(count: int) -> Iterator[List[Any]]:
+    for i in range(count):
+        yield [i, f"name{i}"]
+
+
+def test_stream_batches():
+    query = Query.insert().into("t").columns(["id", "name"])
+    batches = list(query.stream(rows(5), DBEngine.Sqlite, batch_rows=2))
+
+    assert [len(params) for _, params in batches] == [4, 4, 2]
+    assert batches[0] == (
+        'INSERT INTO "t" ("id", "name") VALUES (?, ?), (?, ?)',
+        [0, "name0", 1, "name1"],
+    )
+    assert batches[2][1] == [4, "name4"]
+
+
+def test_stream_is_lazy():
+    pulled: List[List[Any]] = []
+
+    def source() -> Iterator[List[Any]]:
+        for row in rows(10):
+            pulled.append(row)
+            yield row
+
+    query = Query.insert().into("t").columns(["id", "name"])
+    stream = query.stream(source(), DBEngine.Postgres, max_params=6)
+    next(stream)
+    assert len(pulled) == 3
+
+
+def test_stream_keeps_clauses():
+    query = (
+        PostgresQuery.insert()
+        .into("t")
+        .columns(["id", "name"])
+        .on_conflict(OnConflict.column("id").do_nothing())
+    )
+    [(sql, params)] = list(query.stream([[1, "a"]]))
+    assert sql == (
+        'INSERT INTO "t" ("id", "name") VALUES ($1, $2) ON CONFLICT ("id") DO NOTHING'
+    )
+    assert params == [1, "a"]
+
+
+def test_stream_max_bytes():
+    query = Query.insert().into("t").columns(["id", "name"])
+    padded: Iterator[List[Any]] = ([i, "x" * 100] for i in range(10))
+    stream = query.stream(padded, DBEngine.Mysql, max_bytes=300)
+    assert [len(params) // 2 for _, params in stream] == [2, 2, 2, 2, 2]
+
+
+def test_stream_into_sqlite():
+    connection = sqlite3.connect(":memory:")
+    connection.execute("CREATE TABLE t (id INTEGER, name TEXT)")
+    query = Query.insert().into("t").columns(["id", "name"])
+    for sql, params in query.stream(rows(1000), DBEngine.Sqlite, batch_rows=64):
+        connection.execute(sql, params)
+    assert connection.execute("SELECT count(*) FROM t").fetchone() == (1000,)
+
+
+def test_stream_errors():
+    query = Query.insert().into("t").columns(["id", "name"])
+    with pytest.raises(ValueError):
+        query.stream(rows(1), DBEngine.Sqlite, max_params=1)
+
+    stream = query.stream([[1]], DBEngine.Sqlite)
+    with pytest.raises(ValueError):
+        next(stream)
@@ -0,0 +1,70 @@
+import datetime as dt
+
+import pytest
+
+from sea_query import DBEngine, Expr, Query
+from sea_query.postgres import Query as PostgresQuery
+from sea_query.query import OnConflict
+from sea_query.table import ColumnType
+
+
+def test_build_unnest():
+    query = (
+        Query.insert()
+        .into("users")
+        .columns(["id", "name", "born"])
+        .values([1, "alice", dt.date(1990, 1, 2)])
+        .values([2, None, None])
+    )
+    sql, params = query.build_unnest(DBEngine.Postgres)
+    assert sql == (
+        'INSERT INTO "users" ("id", "name", "born")'
+        " SELECT unnest(CAST($1 AS bigint[])), unnest(CAST($2 AS text[])),"
+        " unnest(CAST($3 AS date[]))"
+    )
+    assert params == [[1, 2], ["alice", None], [dt.date(1990, 1, 2), None]]
+
+
+def test_build_unnest_sql_ignores_row_count():
+    def build(rows: int) -> str:
+        query = Query.insert().into("t").columns(["a"])
+        query.values_many([[i] for i in range(rows)])
+        sql, params = query.build_unnest(DBEngine.Postgres)
+        assert params == [list(range(rows))]
+        return sql
+
+    assert build(1) == build(10) == build(1000)
+
+
+def test_build_unnest_types():
+    query = (
+        PostgresQuery.insert()
+        .into("t")
+        .columns(["a", "b"])
+        .values([None, 1])
+        .on_conflict(OnConflict.column("b").do_nothing())
+    )
+    with pytest.raises(ValueError):
+        query.build_unnest()
+
+    sql, params = query.build_unnest(
+        types={"a": ColumnType.Uuid, "b": ColumnType.Integer}
+    )
+    assert sql == (
+        'INSERT INTO "t" ("a", "b")'
+        " SELECT unnest(CAST($1 AS uuid[])), unnest(CAST($2 AS integer[]))"
+        ' ON CONFLICT ("b") DO NOTHING'
+    )
+    assert params == [[None], [1]]
+
+
+def test_build_unnest_params():
+    query = Query.insert().into("t").columns(["a"]).values([Expr.param("a")])
+    _, params = query.build_unnest(DBEngine.Postgres, {"a": ColumnType.Text}, a="x")
+    assert params == [["x"]]
+
+
+def test_build_unnest_postgres_only():
+    query = Query.insert().into("t").columns(["a"]).values([1])
+    with pytest.raises(ValueError):
+        query.build_unnest(DBEngine.Mysql)